@@ -8,4 +8,5 @@ __citation__ = 'Rose, Michael E. and John R. Kitchin: "pybliometrics: '\
 
 import pybliometrics.scopus
 import pybliometrics.sciencedirect
+from pybliometrics.utils import cache
 from pybliometrics.utils.startup import init
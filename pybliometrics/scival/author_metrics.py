@@ -1,9 +1,9 @@
 from typing import NamedTuple
 
-from pybliometrics.superclasses import Retrieval
+from pybliometrics.superclasses import MetricsRetrieval
 from pybliometrics.utils import make_int_if_possible
 from pybliometrics.utils.constants import SCIVAL_METRICS
-from pybliometrics.utils.parse_metrics import extract_metric_data, MetricData
+from pybliometrics.utils.parse_metrics import extract_metric_data_from_index, MetricData
 
 
 class Author(NamedTuple):
@@ -13,14 +13,14 @@ class Author(NamedTuple):
     uri: str | None
 
 
-class AuthorMetrics(Retrieval):
+class AuthorMetrics(MetricsRetrieval):
     @property  
     def AcademicCorporateCollaboration(self) -> list[MetricData] | None:
         """Academic corporate collaboration metrics for each author.
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'AcademicCorporateCollaboration', self._by_year, "author")
+        return extract_metric_data_from_index(self._metric_index, 'AcademicCorporateCollaboration', self._by_year)
 
     @property
     def AcademicCorporateCollaborationImpact(self) -> list[MetricData] | None:
@@ -28,7 +28,7 @@ class AuthorMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'AcademicCorporateCollaborationImpact', self._by_year, "author")
+        return extract_metric_data_from_index(self._metric_index, 'AcademicCorporateCollaborationImpact', self._by_year)
 
     @property
     def authors(self) -> list[MetricData] | None:
@@ -59,7 +59,7 @@ class AuthorMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'CitationCount', self._by_year, "author")
+        return extract_metric_data_from_index(self._metric_index, 'CitationCount', self._by_year)
 
     @property
     def CitationsPerPublication(self) -> list[MetricData] | None:
@@ -67,7 +67,7 @@ class AuthorMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'CitationsPerPublication', self._by_year, "author")
+        return extract_metric_data_from_index(self._metric_index, 'CitationsPerPublication', self._by_year)
 
     @property
     def CitedPublications(self) -> list[MetricData] | None:
@@ -75,7 +75,7 @@ class AuthorMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'CitedPublications', self._by_year, "author")
+        return extract_metric_data_from_index(self._metric_index, 'CitedPublications', self._by_year)
 
     @property
     def Collaboration(self) -> list[MetricData] | None:
@@ -83,7 +83,7 @@ class AuthorMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'Collaboration', self._by_year, "author")
+        return extract_metric_data_from_index(self._metric_index, 'Collaboration', self._by_year)
 
     @property
     def CollaborationImpact(self) -> list[MetricData] | None:
@@ -91,7 +91,7 @@ class AuthorMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'CollaborationImpact', self._by_year, "author")
+        return extract_metric_data_from_index(self._metric_index, 'CollaborationImpact', self._by_year)
 
     @property
     def FieldWeightedCitationImpact(self) -> list[MetricData] | None:
@@ -99,7 +99,7 @@ class AuthorMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'FieldWeightedCitationImpact', self._by_year, "author")
+        return extract_metric_data_from_index(self._metric_index, 'FieldWeightedCitationImpact', self._by_year)
 
     @property
     def HIndices(self) -> list[MetricData] | None:
@@ -107,7 +107,7 @@ class AuthorMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'HIndices', self._by_year, "author")
+        return extract_metric_data_from_index(self._metric_index, 'HIndices', self._by_year)
 
     @property
     def OutputsInTopCitationPercentiles(self) -> list[MetricData] | None:
@@ -115,7 +115,7 @@ class AuthorMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'OutputsInTopCitationPercentiles', self._by_year, "author")
+        return extract_metric_data_from_index(self._metric_index, 'OutputsInTopCitationPercentiles', self._by_year)
 
     @property
     def PublicationsInTopJournalPercentiles(self) -> list[MetricData] | None:
@@ -123,7 +123,7 @@ class AuthorMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'PublicationsInTopJournalPercentiles', self._by_year, "author")
+        return extract_metric_data_from_index(self._metric_index, 'PublicationsInTopJournalPercentiles', self._by_year)
 
     @property
     def ScholarlyOutput(self) -> list[MetricData] | None:
@@ -131,7 +131,7 @@ class AuthorMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'ScholarlyOutput', self._by_year, "author")
+        return extract_metric_data_from_index(self._metric_index, 'ScholarlyOutput', self._by_year)
 
     def __init__(self,
                  author_ids: str | list,
@@ -170,10 +170,6 @@ class AuthorMetrics(Retrieval):
         self._refresh = refresh
         self._by_year = by_year
 
-        # Handle authors parameter
-        if isinstance(author_ids, list):
-            author_ids = ",".join(str(a) for a in author_ids)
-
         # Handle metric_types parameter - use all metrics by default
         if metric_types is None:
             if not by_year:
@@ -181,20 +177,18 @@ class AuthorMetrics(Retrieval):
             if by_year:
                 metric_types = SCIVAL_METRICS["AuthorMetrics"]["byYear"]
 
-        if isinstance(metric_types, list):
-            metric_types = ",".join(metric_types)
-
-        self._metric_types = metric_types
+        if isinstance(metric_types, str):
+            metric_types = [m.strip() for m in metric_types.split(",")]
 
         # Set up parameters for the API call
         params = {
-            'authors': author_ids,
-            'metricTypes': metric_types,
             'byYear': str(by_year).lower(),
             **kwds
         }
 
-        Retrieval.__init__(self, **params)
+        MetricsRetrieval.__init__(self, author_ids, entity_param='authors',
+                                  entity_type='author',
+                                  metric_types=metric_types, **params)
 
     def __str__(self):
         """Return pretty text version of the author metrics."""
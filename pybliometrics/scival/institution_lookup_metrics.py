@@ -1,9 +1,9 @@
 from typing import NamedTuple
 
-from pybliometrics.superclasses import Retrieval
+from pybliometrics.superclasses import MetricsRetrieval
 from pybliometrics.utils import make_int_if_possible
 from pybliometrics.utils.constants import SCIVAL_METRICS
-from pybliometrics.utils.parse_metrics import extract_metric_data, MetricData
+from pybliometrics.utils.parse_metrics import extract_metric_data_from_index, MetricData
 
 
 class Institution(NamedTuple):
@@ -13,14 +13,14 @@ class Institution(NamedTuple):
     uri: str | None
 
 
-class InstitutionLookupMetrics(Retrieval):
+class InstitutionLookupMetrics(MetricsRetrieval):
     @property  
     def AcademicCorporateCollaboration(self) -> list[MetricData] | None:
         """Academic corporate collaboration metrics for each institution.
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'AcademicCorporateCollaboration', self._by_year, "institution")
+        return extract_metric_data_from_index(self._metric_index, 'AcademicCorporateCollaboration', self._by_year)
 
     @property
     def AcademicCorporateCollaborationImpact(self) -> list[MetricData] | None:
@@ -28,7 +28,7 @@ class InstitutionLookupMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'AcademicCorporateCollaborationImpact', self._by_year, "institution")
+        return extract_metric_data_from_index(self._metric_index, 'AcademicCorporateCollaborationImpact', self._by_year)
 
     @property
     def institutions(self) -> list[Institution] | None:
@@ -59,7 +59,7 @@ class InstitutionLookupMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'CitationCount', self._by_year, "institution")
+        return extract_metric_data_from_index(self._metric_index, 'CitationCount', self._by_year)
 
     @property
     def CitationsPerPublication(self) -> list[MetricData] | None:
@@ -67,7 +67,7 @@ class InstitutionLookupMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'CitationsPerPublication', self._by_year, "institution")
+        return extract_metric_data_from_index(self._metric_index, 'CitationsPerPublication', self._by_year)
 
     @property
     def CitedPublications(self) -> list[MetricData] | None:
@@ -75,7 +75,7 @@ class InstitutionLookupMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'CitedPublications', self._by_year, "institution")
+        return extract_metric_data_from_index(self._metric_index, 'CitedPublications', self._by_year)
 
     @property
     def Collaboration(self) -> list[MetricData] | None:
@@ -83,7 +83,7 @@ class InstitutionLookupMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'Collaboration', self._by_year, "institution")
+        return extract_metric_data_from_index(self._metric_index, 'Collaboration', self._by_year)
 
     @property
     def CollaborationImpact(self) -> list[MetricData] | None:
@@ -91,7 +91,7 @@ class InstitutionLookupMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'CollaborationImpact', self._by_year, "institution")
+        return extract_metric_data_from_index(self._metric_index, 'CollaborationImpact', self._by_year)
 
     @property
     def FieldWeightedCitationImpact(self) -> list[MetricData] | None:
@@ -99,7 +99,7 @@ class InstitutionLookupMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'FieldWeightedCitationImpact', self._by_year, "institution")
+        return extract_metric_data_from_index(self._metric_index, 'FieldWeightedCitationImpact', self._by_year)
 
     @property
     def OutputsInTopCitationPercentiles(self) -> list[MetricData] | None:
@@ -107,7 +107,7 @@ class InstitutionLookupMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'OutputsInTopCitationPercentiles', self._by_year, "institution")
+        return extract_metric_data_from_index(self._metric_index, 'OutputsInTopCitationPercentiles', self._by_year)
 
     @property
     def PublicationsInTopJournalPercentiles(self) -> list[MetricData] | None:
@@ -115,7 +115,7 @@ class InstitutionLookupMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'PublicationsInTopJournalPercentiles', self._by_year, "institution")
+        return extract_metric_data_from_index(self._metric_index, 'PublicationsInTopJournalPercentiles', self._by_year)
 
     @property
     def ScholarlyOutput(self) -> list[MetricData] | None:
@@ -123,7 +123,7 @@ class InstitutionLookupMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'ScholarlyOutput', self._by_year, "institution")
+        return extract_metric_data_from_index(self._metric_index, 'ScholarlyOutput', self._by_year)
 
     def __init__(self,
                  institution_ids: str | list,
@@ -161,28 +161,22 @@ class InstitutionLookupMetrics(Retrieval):
         self._refresh = refresh
         self._by_year = by_year
 
-        # Handle institutions parameter
-        if isinstance(institution_ids, list):
-            institution_ids = ",".join(str(i) for i in institution_ids)
-
         # Handle metric_types parameter - use all metrics by default
         if metric_types is None:
             metric_types = SCIVAL_METRICS["InstitutionLookupMetrics"]["byYear"]
 
-        if isinstance(metric_types, list):
-            metric_types = ",".join(metric_types)
-
-        self._metric_types = metric_types
+        if isinstance(metric_types, str):
+            metric_types = [m.strip() for m in metric_types.split(",")]
 
         # Set up parameters for the API call
         params = {
-            'institutionIds': institution_ids,
-            'metricTypes': metric_types,
             'byYear': str(by_year).lower(),
             **kwds
         }
 
-        Retrieval.__init__(self, **params, **kwds)
+        MetricsRetrieval.__init__(self, institution_ids, entity_param='institutionIds',
+                                  entity_type='institution',
+                                  metric_types=metric_types, **params)
 
     def __str__(self):
         """Return pretty text version of the institution metrics."""
@@ -1,4 +1,7 @@
+import pytest
+
 from pybliometrics.scival.author_metrics import AuthorMetrics
+from pybliometrics.utils.parse_metrics import MetricData
 from pybliometrics.utils.startup import init
 
 init()
@@ -45,6 +48,32 @@ def test_academic_corporate_collaboration_impact():
     assert has_all_fields(result_multi[0])
 
 
+def test_as_arrow():
+    """Test the columnar output as Arrow table."""
+    pa = pytest.importorskip("pyarrow")
+    table = multiple_authors_all.as_arrow()
+    assert table.column_names == list(MetricData._fields)
+    assert table.num_rows == len(list(multiple_authors_all.iter_metric_data()))
+    assert table.schema.field('year').type == pa.int16()
+    assert table.schema.field('value').type == pa.float64()
+    assert pa.types.is_dictionary(table.schema.field('metric').type)
+    assert empty_metrics.as_arrow().num_rows == 0
+
+
+def test_as_columns():
+    """Test the columnar output as NumPy arrays."""
+    np = pytest.importorskip("numpy")
+    columns, categories = single_author_h_index.as_columns()
+    assert list(columns) == list(MetricData._fields)
+    assert columns['metric'].dtype == np.int32
+    metrics = categories['metric'][columns['metric']]
+    assert metrics.tolist() == [m.metric for m in single_author_h_index.HIndices]
+    assert columns['entity_id'].dtype == np.int64
+    assert columns['year'].mask.all()
+    expected = [m.value for m in single_author_h_index.HIndices]
+    assert columns['value'].tolist() == expected
+
+
 def test_authors():
     """Test the authors property for all test cases with actual values."""
     # Test single author with all metrics
@@ -83,6 +112,15 @@ def has_all_fields(metric_data):
     return all(hasattr(metric_data, field) for field in required_fields)
 
 
+def test_cached_entities():
+    """Test that entities of a previous request are read from the cache."""
+    received = AuthorMetrics([6603480302, 7201667143], by_year=True)
+    assert [a.id for a in received.authors] == [6603480302, 7201667143]
+    assert received.get_cache_file_mdate() == multiple_authors_all.get_cache_file_mdate()
+    expected = multiple_authors_all.ScholarlyOutput
+    assert sorted(received.ScholarlyOutput) == sorted(expected)
+
+
 def test_citation_count():
     """Test CitationCount property for all test cases."""
     result = single_author_all.CitationCount
@@ -143,6 +181,13 @@ def test_empty_metrics():
     assert empty_metrics.CollaborationImpact is None
 
 
+def test_empty_ids():
+    """Test whether missing author IDs raise a clear error."""
+    for author_ids in ("", " , ", []):
+        with pytest.raises(ValueError, match="at least 1 ID"):
+            AuthorMetrics(author_ids)
+
+
 def test_field_weighted_citation_impact():
     """Test FieldWeightedCitationImpact property for all test cases."""
     result = single_author_all.FieldWeightedCitationImpact
@@ -165,6 +210,15 @@ def test_h_indices():
     assert multiple_authors_all.HIndices is None
 
 
+def test_iter_metric_data():
+    """Test the combined stream of all metric types."""
+    received = list(multiple_authors_all.iter_metric_data())
+    assert all(has_all_fields(m) for m in received)
+    expected = multiple_authors_all.CitationCount + multiple_authors_all.ScholarlyOutput
+    assert all(m in received for m in expected)
+    assert single_author_h_index.HIndices == list(single_author_h_index.iter_metric_data())
+
+
 def test_outputs_in_top_citation_percentiles():
     """Test OutputsInTopCitationPercentiles property for all test cases."""
     result = single_author_all.OutputsInTopCitationPercentiles
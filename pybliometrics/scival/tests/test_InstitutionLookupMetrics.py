@@ -126,6 +126,13 @@ def test_empty_metrics():
     assert empty_metrics.CollaborationImpact is None
 
 
+def test_extra_keywords():
+    """Test whether additional query parameters are passed on once."""
+    received = InstitutionLookupMetrics("505023", metric_types="ScholarlyOutput",
+                                        refresh=30, yearRange="5yrs")
+    assert received.ScholarlyOutput[0].entity_id == 505023
+
+
 def test_field_weighted_citation_impact():
     """Test FieldWeightedCitationImpact property for all test cases."""
     result = single_institution_all.FieldWeightedCitationImpact
@@ -135,6 +142,15 @@ def test_field_weighted_citation_impact():
     assert has_all_fields(result_multi[0])
 
 
+def test_iter_metric_data():
+    """Test the combined stream of all metric types."""
+    received = list(multiple_institutions_all.iter_metric_data())
+    assert all(has_all_fields(m) for m in received)
+    assert received[:len(multiple_institutions_all.AcademicCorporateCollaboration)] == \
+        multiple_institutions_all.AcademicCorporateCollaboration
+    assert list(empty_metrics.iter_metric_data()) == []
+
+
 def test_outputs_in_top_citation_percentiles():
     """Test OutputsInTopCitationPercentiles property for all test cases."""
     result = single_institution_all.OutputsInTopCitationPercentiles
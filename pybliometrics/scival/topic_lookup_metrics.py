@@ -3,7 +3,8 @@ from typing import NamedTuple
 from pybliometrics.superclasses import Retrieval
 from pybliometrics.utils import make_int_if_possible
 from pybliometrics.utils.constants import SCIVAL_METRICS
-from pybliometrics.utils.parse_metrics import extract_metric_data, extract_metric_lists, MetricData
+from pybliometrics.utils.parse_metrics import build_metric_index, \
+    extract_metric_data_from_index, extract_metric_lists_from_index, MetricData
 
 
 class Topic(NamedTuple):
@@ -123,7 +124,7 @@ class TopicLookupMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold),
         """
-        return extract_metric_data(self._json, 'AuthorCount', self._by_year, "topic")
+        return extract_metric_data_from_index(self._metric_index, 'AuthorCount', self._by_year)
 
     @property
     def CitationCount(self) -> list[MetricData] | None:
@@ -131,7 +132,7 @@ class TopicLookupMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold),
         """
-        return extract_metric_data(self._json, 'CitationCount', self._by_year, "topic")
+        return extract_metric_data_from_index(self._metric_index, 'CitationCount', self._by_year)
 
     @property
     def CorePapers(self) -> list[CorePaper] | None:
@@ -140,7 +141,7 @@ class TopicLookupMetrics(Retrieval):
         (entity_id, entity_name, publication_id).
         """
         out = []
-        for item in extract_metric_lists(self._json, "CorePapers", "topic"):
+        for item in extract_metric_lists_from_index(self._metric_index, "CorePapers"):
             entity_id = item.get('entity_id')
             entity_name = item.get('entity_name')
 
@@ -158,7 +159,7 @@ class TopicLookupMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'FieldWeightedCitationImpact', self._by_year, "topic")
+        return extract_metric_data_from_index(self._metric_index, 'FieldWeightedCitationImpact', self._by_year)
 
     @property
     def InstitutionCount(self) -> list[MetricData] | None:
@@ -166,7 +167,7 @@ class TopicLookupMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'InstitutionCount', self._by_year, "topic")
+        return extract_metric_data_from_index(self._metric_index, 'InstitutionCount', self._by_year)
 
     @property
     def MostRecentlyPublishedPapers(self) -> list[RecentPaper] | None:
@@ -175,7 +176,7 @@ class TopicLookupMetrics(Retrieval):
         (entity_id, entity_name, publication_id).
         """
         out = []
-        for item in extract_metric_lists(self._json, "MostRecentlyPublishedPapers", "topic"):
+        for item in extract_metric_lists_from_index(self._metric_index, "MostRecentlyPublishedPapers"):
             entity_id = item.get('entity_id')
             entity_name = item.get('entity_name')
 
@@ -196,7 +197,7 @@ class TopicLookupMetrics(Retrieval):
         """
 
         out = []
-        for item in extract_metric_lists(self._json, "RelatedTopics", "topic"):
+        for item in extract_metric_lists_from_index(self._metric_index, "RelatedTopics"):
             entity_id = item.get('entity_id')
             entity_name = item.get('entity_name')
 
@@ -220,7 +221,7 @@ class TopicLookupMetrics(Retrieval):
         Returns list of MetricData namedtuples with structure:
         (entity_id, entity_name, metric, year, value, percentage, threshold).
         """
-        return extract_metric_data(self._json, 'ScholarlyOutput', self._by_year, "topic")
+        return extract_metric_data_from_index(self._metric_index, 'ScholarlyOutput', self._by_year)
 
     @property
     def TopAuthors(self) -> list[TopAuthor] | None:
@@ -230,7 +231,7 @@ class TopicLookupMetrics(Retrieval):
         """
 
         out = []
-        for item in extract_metric_lists(self._json, "TopAuthors", "topic"):
+        for item in extract_metric_lists_from_index(self._metric_index, "TopAuthors"):
             entity_id = item.get('entity_id')
             entity_name = item.get('entity_name')
 
@@ -252,7 +253,7 @@ class TopicLookupMetrics(Retrieval):
         """
 
         out = []
-        for item in extract_metric_lists(self._json, "TopCitedPublications", "topic"):
+        for item in extract_metric_lists_from_index(self._metric_index, "TopCitedPublications"):
             entity_id = item.get('entity_id')
             entity_name = item.get('entity_name')
 
@@ -272,7 +273,7 @@ class TopicLookupMetrics(Retrieval):
         (entity_id, entity_name, institution_id, institution_name, publicationCount).
         """
         out = []
-        for item in extract_metric_lists(self._json, "TopInstitutions", "topic"):
+        for item in extract_metric_lists_from_index(self._metric_index, "TopInstitutions"):
             entity_id = item.get('entity_id')
             entity_name = item.get('entity_name')
 
@@ -294,7 +295,7 @@ class TopicLookupMetrics(Retrieval):
         citationCount, authorCount, publicationGrowth, authorGrowth, sjr, snip, citeScore).
         """
         out = []
-        for item in extract_metric_lists(self._json, "TopJournals", "topic"):
+        for item in extract_metric_lists_from_index(self._metric_index, "TopJournals"):
             entity_id = item.get('entity_id')
             entity_name = item.get('entity_name')
 
@@ -323,7 +324,7 @@ class TopicLookupMetrics(Retrieval):
         relevance, publicationCount, publicationGrowth).
         """
         out = []
-        for item in extract_metric_lists(self._json, "TopKeywords", "topic"):
+        for item in extract_metric_lists_from_index(self._metric_index, "TopKeywords"):
             entity_id = item.get('entity_id')
             entity_name = item.get('entity_name')
 
@@ -398,6 +399,7 @@ class TopicLookupMetrics(Retrieval):
         }
 
         Retrieval.__init__(self, **params)
+        self._metric_index = build_metric_index(self._json, "topic")
 
     def __str__(self):
         """Return pretty text version of the topic metrics."""
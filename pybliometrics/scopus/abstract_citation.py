@@ -1,10 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from hashlib import md5
 from typing import NamedTuple
 from warnings import warn
 
+from pybliometrics.exception import Scopus404Error
 from pybliometrics.superclasses import Retrieval
-from pybliometrics.utils import chained_get, check_parameter_value
+from pybliometrics.superclasses.base import _cache_only, _CacheMiss, \
+    _init_from_cache, _store
+from pybliometrics.utils import chained_get, check_parameter_value, dumps, \
+    encode, get_content, get_max_workers, listify, loads, URLS
+
+# Maximum number of identifiers per request
+CHUNK_SIZE = 25
 
 
 class Author(NamedTuple):
@@ -212,9 +219,9 @@ class CitationOverview(Retrieval):
                  ) -> None:
         """Interaction with the Citation Overview API.
 
-        :param identifier: Up to 25 identifiers of the same kind for which to look
+        :param identifier: Identifiers of the same kind for which to look
                            up citations.  Must be Scopus IDs, DOIs, PIIs or
-                           Pubmed IDs.
+                           Pubmed IDs.  Duplicates are ignored.
         :param date: Represents the year range for which the citations should be counted.
                      If `None`, Scopus returns data for the current and the previous
                      two years.
@@ -237,18 +244,29 @@ class CitationOverview(Retrieval):
         Raises
         -----
         ValueError
-            If parameter `identifier` contains fewer than 1 or more than
-            25 elements.
+            If parameter `identifier` is empty.
 
         ValueError
             If any of the parameters `citation`, `id_type` or `refresh` is not
             one of the allowed values.
 
+        Scopus404Error
+            If Scopus finds none of the documents.
+
         Notes
         -----
         The directory for cached results is `{path}/STANDARD/{id}-{citation}-{date}`,
         where `path` is specified in your configuration file, and `id` the
-        md5-hashed version of a string joining `identifier` on underscore.
+        identifier of one document, prefixed with `id_type` unless it is a
+        Scopus ID.  Each document is cached separately, such that only
+        documents that are not cached yet are downloaded.
+
+        The API accepts at most 25 identifiers per request.  Longer lists
+        of documents to download are split into chunks of 25 identifiers,
+        which are retrieved concurrently (see `get_max_workers()`).  The
+        documents are merged in the order of `identifier`, where the combined
+        h-index is computed from the total citation count of each document.
+        Documents that Scopus does not find are omitted, and cached as such.
 
         Your API Key needs to be augmented by Elsevier's Scopus
         Integration Team to access this API.
@@ -259,12 +277,12 @@ class CitationOverview(Retrieval):
         if citation:
             allowed = ('exclude-self', 'exclude-books')
             check_parameter_value(citation, allowed, "citation")
-        if len(identifier) < 0 or len(identifier) > 25:
-            msg = "Provide at least 1 and at most than 25 identifiers"
+        if len(identifier) < 1:
+            msg = "Provide at least 1 identifier"
             raise ValueError(msg)
 
         # Variables
-        identifier = [str(i) for i in identifier]
+        identifier = list(dict.fromkeys(str(i) for i in identifier))
         if start or end:
             msg = "Parameters `start` and `end` are deprecated and will be removed"\
                   f" in a future release.  Please use 'date={start}-{end}' instead."
@@ -276,10 +294,45 @@ class CitationOverview(Retrieval):
         self._refresh = refresh
         self._view = "STANDARD"
 
-        # Get file content
-        kwds.update({id_type: identifier})
-        stem = md5("_".join(identifier).encode('utf8')).hexdigest()
-        Retrieval.__init__(self, stem, date=date, citation=citation, **kwds)
+        # Read cached documents and download the others in chunks
+        documents = {}
+        missing = {}
+        for ident in identifier:
+            doc = self._read_document(ident, id_type, self._refresh, **kwds)
+            if doc._json is None:
+                missing[ident] = doc
+            else:
+                documents[ident] = doc
+        if missing:
+            if _cache_only.get():
+                raise _CacheMiss
+            idents = list(missing)
+            chunks = [idents[i:i+CHUNK_SIZE]
+                      for i in range(0, len(idents), CHUNK_SIZE)]
+
+            def download(chunk):
+                return self._download_chunk(chunk, missing, id_type, **kwds)
+
+            with ThreadPoolExecutor(max_workers=get_max_workers()) as executor:
+                for header in executor.map(download, chunks):
+                    if header is not None:
+                        self._header = header
+            for ident, doc in missing.items():
+                doc = self._read_document(ident, id_type, False, **kwds)
+                if doc._json is not None:
+                    documents[ident] = doc
+        parts = [documents[i] for i in identifier if i in documents]
+        if not any(part._citeInfoMatrix for part in parts):
+            msg = f"Scopus finds none of the documents with {id_type} "\
+                  f"{', '.join(identifier)}."
+            raise Scopus404Error(msg)
+        self._json = {'abstract-citations-response':
+                      _merge_responses(parts, identifier, id_type)}
+        self._mdate = min(part._mdate for part in parts)
+        self._parse_json()
+
+    def _parse_json(self) -> None:
+        """Parse the content of the response."""
         self._data = self._json['abstract-citations-response']
 
         # citeInfoMatrix
@@ -302,6 +355,146 @@ class CitationOverview(Retrieval):
             f"{'; '.join([str(n) for n in self.rowTotal])}"
         return s
 
+    def _read_document(self,
+                       ident: str,
+                       id_type: str,
+                       refresh: bool | int,
+                       **kwds: str
+                       ) -> 'CitationOverview':
+        """Return the object of a single document read from the cache.
+        If the document is not cached or needs to be refreshed, the
+        object's content is `None`.
+        """
+        doc = CitationOverview.__new__(CitationOverview)
+        doc._date = self._date
+        doc._citation = self._citation
+        doc._refresh = refresh
+        doc._view = self._view
+        stem = ident if id_type == 'scopus_id' else f'{id_type}-{ident}'
+        if _init_from_cache(Retrieval.__init__, doc, stem, **kwds):
+            doc._parse_json()
+        return doc
+
+    def _download_chunk(self,
+                        chunk: list[str],
+                        documents: dict,
+                        id_type: str,
+                        **kwds: str
+                        ) -> dict:
+        """Download the citations of up to 25 documents in one request and
+        store them in the cache entries of the corresponding objects in
+        `documents`.  Return the header of the response, or `None` if
+        Scopus finds none of the documents.
+        """
+        params = {'view': self._view, 'date': self._date,
+                  'citation': self._citation, id_type: chunk}
+        try:
+            resp = get_content(URLS['CitationOverview'], 'CitationOverview',
+                               params, **kwds)
+        except Scopus404Error:
+            # Cache the documents as missing, like those missing in responses
+            resp = None
+            data = {'abstract-citations-response': {
+                'citeInfoMatrix': {'citeInfoMatrixXML': {
+                    'citationMatrix': {'citeInfo': []}}},
+                'identifier-legend': {'identifier': []},
+                'citeColumnTotalXML': {'citeCountHeader': {'columnTotal': []}}}}
+        else:
+            data = loads(resp.content)
+        responses = _split_response(data, chunk, id_type)
+        for ident, data in responses.items():
+            _store(documents[ident]._cache_key, encode(dumps(data)))
+        return resp.headers if resp is not None else None
+
+
+def _split_response(data: dict, chunk: list[str], id_type: str) -> dict:
+    """Auxiliary function to split a response into one response for each
+    document, keyed by the identifier of type `id_type` in `chunk`.
+    Documents missing in the response get a response without documents.
+    """
+    data = data['abstract-citations-response']
+    cite_info = data['citeInfoMatrix']['citeInfoMatrixXML']
+    matrix = listify(cite_info['citationMatrix']['citeInfo'])
+    legend = listify(data['identifier-legend']['identifier'])
+    header = data['citeColumnTotalXML']['citeCountHeader']
+    n_years = len(listify(header['columnTotal']))
+    requested = {i.lower(): i for i in chunk}
+    out = {}
+    for entry, ident in zip(matrix, legend):
+        parsed = _parse_dict(entry)
+        key = str(_parse_dict(ident).get(id_type)).lower()
+        if key not in requested:
+            if len(chunk) != 1:
+                continue
+            key = chunk[0].lower()
+        row_total = int(parsed['rowTotal'])
+        doc_header = {**header,
+                      'columnTotal': listify(parsed.get('cc')) or [{'$': '0'}]*n_years,
+                      'grandTotal': parsed['rowTotal'],
+                      'prevColumnTotal': parsed['pcc'],
+                      'laterColumnTotal': parsed['lcc'],
+                      'rangeColumnTotal': parsed['rangeCount']}
+        out[requested[key]] = {'abstract-citations-response': {
+            'h-index': str(min(row_total, 1)),
+            'citeInfoMatrix': {'citeInfoMatrixXML': {
+                'citationMatrix': {'citeInfo': [entry]}}},
+            'identifier-legend': {'identifier': [ident]},
+            'citeColumnTotalXML': {'citeCountHeader': doc_header}}}
+    empty_header = {**header, 'columnTotal': [{'$': '0'}]*n_years,
+                    'grandTotal': '0', 'prevColumnTotal': '0',
+                    'laterColumnTotal': '0', 'rangeColumnTotal': '0'}
+    for ident in chunk:
+        out.setdefault(ident, {'abstract-citations-response': {
+            'h-index': '0',
+            'citeInfoMatrix': {'citeInfoMatrixXML': {
+                'citationMatrix': {'citeInfo': []}}},
+            'identifier-legend': {'identifier': []},
+            'citeColumnTotalXML': {'citeCountHeader': empty_header}}})
+    return out
+
+
+def _merge_responses(parts: list[CitationOverview],
+                     order: list[str],
+                     id_type: str
+                     ) -> dict:
+    """Auxiliary function to merge the responses of several objects
+    into one response, with documents sorted by the position of their
+    identifier of type `id_type` in `order`.
+    """
+    # Documents that Scopus does not find contribute nothing
+    parts = [p for p in parts if p._citeInfoMatrix]
+    matrix = []
+    legend = []
+    header = dict(parts[0]._citeCountHeader)
+    for key in ('grandTotal', 'laterColumnTotal', 'prevColumnTotal',
+                'rangeColumnTotal'):
+        header[key] = str(sum(int(p._citeCountHeader[key]) for p in parts))
+    totals = zip(*[p.columnTotal for p in parts])
+    header['columnTotal'] = [{'$': str(sum(t))} for t in totals]
+    for part in parts:
+        cite_info = part._data['citeInfoMatrix']['citeInfoMatrixXML']
+        matrix.extend(listify(cite_info['citationMatrix']['citeInfo']))
+        legend.extend(listify(part._data['identifier-legend']['identifier']))
+    # Scopus does not return documents in the requested order
+    position = {str(i).lower(): n for n, i in enumerate(order)}
+
+    def sort_key(n):
+        ident = str(_parse_dict(legend[n]).get(id_type)).lower()
+        return position.get(ident, len(order))
+
+    ranks = sorted(range(len(legend)), key=sort_key)
+    matrix = [matrix[n] for n in ranks]
+    legend = [legend[n] for n in ranks]
+    # Combined h-index of all documents
+    counts = sorted((int(e['rowTotal']) for p in parts
+                     for e in p._citeInfoMatrix), reverse=True)
+    h_index = sum(1 for i, n in enumerate(counts, start=1) if n >= i)
+    return {'h-index': str(h_index),
+            'citeInfoMatrix': {'citeInfoMatrixXML': {
+                'citationMatrix': {'citeInfo': matrix}}},
+            'identifier-legend': {'identifier': legend},
+            'citeColumnTotalXML': {'citeCountHeader': header}}
+
 
 def _parse_dict(dct):
     """Auxiliary function to change the keys of a dictionary."""
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from functools import cached_property
 from typing import NamedTuple
 
 from pybliometrics.superclasses import Retrieval
@@ -115,7 +116,7 @@ class AbstractRetrieval(Retrieval):
         """
         return self._head.get('abstracts')
 
-    @property
+    @cached_property
     def affiliation(self) -> list[Affiliation] | None:
         """A list of namedtuples representing listed affiliations in
         the form `(id, name, city, country)`.
@@ -134,7 +135,7 @@ class AbstractRetrieval(Retrieval):
         """Aggregation type of source the document is published in."""
         return chained_get(self._json, ['coredata', 'prism:aggregationType'])
 
-    @property
+    @cached_property
     def authkeywords(self) -> list[str] | None:
         """List of author-provided keywords of the document."""
         keywords = self._json.get('authkeywords')
@@ -146,7 +147,7 @@ class AbstractRetrieval(Retrieval):
             except TypeError:  # Singleton keyword
                 return [keywords['author-keyword']['$']]
 
-    @property
+    @cached_property
     def authorgroup(self) -> list[AuthorGroup] | None:
         """A list of namedtuples representing the article's authors and collaborations
         organized by affiliation, in the form `(affiliation_id, collaboration_id, dptid,
@@ -207,7 +208,7 @@ class AbstractRetrieval(Retrieval):
                 out.append(new)
         return out or None
 
-    @property
+    @cached_property
     def authors(self) -> list[Author] | None:
         """A list of namedtuples representing the article's authors, in the
         form `(auid, indexed_name, surname, given_name, affiliation)`.  In case
@@ -240,7 +241,7 @@ class AbstractRetrieval(Retrieval):
         """URL to Scopus page listing citing documents."""
         return get_link(self._json, 2)
 
-    @property
+    @cached_property
     def chemicals(self) -> list[Chemical] | None:
         """List of namedtuples representing chemical entities in the form
         `(source, chemical_name, cas_registry_number)`.  In case multiple
@@ -266,7 +267,7 @@ class AbstractRetrieval(Retrieval):
         """Code of the conference the document belongs to."""
         return make_int_if_possible(self._confevent.get('confcode'))
 
-    @property
+    @cached_property
     def confdate(self) -> tuple[tuple[int, int], tuple[int, int]] | None:
         """Date range of the conference the document belongs to represented
         by two tuples in the form (YYYY, MM, DD).
@@ -290,7 +291,7 @@ class AbstractRetrieval(Retrieval):
         """Name of the conference the document belongs to."""
         return self._confevent.get('confname')
 
-    @property
+    @cached_property
     def confsponsor(self) -> list[str] | str | None:
         """Sponsor(s) of the conference the document belongs to."""
         path = ['confsponsors', 'confsponsor']
@@ -301,7 +302,7 @@ class AbstractRetrieval(Retrieval):
             return [s['$'] for s in sponsors]
         return sponsors
 
-    @property
+    @cached_property
     def contributor_group(self) -> list[Contributor] | None:
         """List of namedtuples representing contributors compiled by Scopus,
         in the form `(given_name, initials, surname, indexed_name, role)`.
@@ -334,7 +335,7 @@ class AbstractRetrieval(Retrieval):
         path = ['item', 'bibrecord', 'item-info', 'copyright', '@type']
         return chained_get(self._json, path)
 
-    @property
+    @cached_property
     def correspondence(self) -> list[Correspondence] | None:
         """List of namedtuples representing the authors to whom correspondence
         should be addressed, in the form ´(surname, initials, organization,
@@ -364,7 +365,7 @@ class AbstractRetrieval(Retrieval):
         """The date of the cover the document is in."""
         return chained_get(self._json, ['coredata', 'prism:coverDate'])
 
-    @property
+    @cached_property
     def date_created(self) -> tuple[int, int, int] | None:
         """Return the `date_created` of a record.
         """
@@ -410,7 +411,7 @@ class AbstractRetrieval(Retrieval):
             ending = chained_get(self._head, path)
         return ending
 
-    @property
+    @cached_property
     def funding(self) -> list[Funding] | None:
         """List of namedtuples parsed funding information in the form
         `(agency, agency_id, string, funding_id, acronym, country)`.
@@ -442,7 +443,7 @@ class AbstractRetrieval(Retrieval):
         path = ['item', 'xocs:meta', 'xocs:funding-list', 'xocs:funding-text']
         return chained_get(self._json, path)
 
-    @property
+    @cached_property
     def isbn(self) -> tuple[str, ...] | None:
         """ISBNs `str | None` to publicationName as tuple of variying length,
         (e.g. ISBN-10 or ISBN-13)."""
@@ -452,7 +453,7 @@ class AbstractRetrieval(Retrieval):
         else:
             return tuple(i['$'] if isinstance(i, dict) else str(i) for i in isbns)
 
-    @property
+    @cached_property
     def issn(self) -> ISSN | None:
         """Namedtuple in the form `(print electronic)`.
         Note: If the source has an E-ISSN, the META view will return None.
@@ -491,7 +492,7 @@ class AbstractRetrieval(Retrieval):
         """ID of the document (same as EID without "2-s2.0-")."""
         return get_id(self._json)
 
-    @property
+    @cached_property
     def idxterms(self) -> list[str] | None:
         """List of index terms (these are just one category of those
         Scopus provides in the web version)
@@ -592,7 +593,7 @@ class AbstractRetrieval(Retrieval):
             except KeyError:
                 return None
 
-    @property
+    @cached_property
     def references(self) -> list[Reference] | None:
         """List of namedtuples representing references listed in the document,
         in the form `(position, id, doi, title, authors, authors_auid,
@@ -690,7 +691,7 @@ class AbstractRetrieval(Retrieval):
         """URL to Scopus API page of this document."""
         return get_link(self._json, 0)
 
-    @property
+    @cached_property
     def sequencebank(self) -> list[Sequencebank] | None:
         """List of namedtuples representing biological entities defined or
         mentioned in the text, in the form `(name, sequence_number, type)`.
@@ -736,7 +737,7 @@ class AbstractRetrieval(Retrieval):
             starting = chained_get(self._head, path)
         return starting
 
-    @property
+    @cached_property
     def subject_areas(self) -> list[Area] | None:
         """List of namedtuples containing subject areas of the article
         in the form `(area abbreviation code)`.
@@ -1,14 +1,13 @@
+from collections.abc import Iterable
 from warnings import warn
 from typing import NamedTuple
 
-from json import loads
-
 from .author_search import AuthorSearch
 from .scopus_search import ScopusSearch
 from pybliometrics.superclasses import Retrieval
 from pybliometrics.utils import chained_get, check_parameter_value,\
-    filter_digits, get_content, get_link, html_unescape, listify, make_int_if_possible,\
-    parse_affiliation, parse_date_created, VIEWS
+    filter_digits, get_content, get_link, html_unescape, listify, loads, \
+    make_int_if_possible, parse_affiliation, parse_date_created, VIEWS
 
 
 class Affiliation(NamedTuple):
@@ -366,6 +365,57 @@ class AuthorRetrieval(Retrieval):
                 f'in {int(self.citation_count):,} document(s)'
         return s
 
+    @classmethod
+    def batch_resolve(cls,
+                      author_ids: Iterable[int | str],
+                      view: str = "ENHANCED",
+                      workers: int | None = None,
+                      verbose: bool = False,
+                      **kwds
+                      ) -> dict:
+        """Retrieve many author profiles concurrently and resolve merged
+        profiles to their main profile.
+
+        :param author_ids: The IDs or the EIDs of the authors.
+        :param view: The view of the files that should be downloaded.  See
+                     `AuthorRetrieval()` for allowed values.
+        :param workers: The number of concurrent downloads.  Defaults to
+                        `Workers` in section `[Requests]` of the
+                        configuration file (see `get_max_workers()`).
+        :param verbose: Whether to print a progress bar and a summary for
+                        each round of downloads.
+        :param kwds: Keywords passed on to the class, e.g. `refresh`.
+
+        Returns
+        -------
+        dict
+            A dictionary mapping each requested ID to the `AuthorRetrieval()`
+            object of its main profile, or to the exception raised for this
+            ID (e.g. `Scopus404Error`).  Merged profiles whose aliases
+            cannot be retrieved map to the merged profile itself.
+
+        Notes
+        -----
+        Profiles are retrieved via `AuthorRetrieval.batch()`, so cached
+        profiles are read first and the others are downloaded respecting
+        the throttling limits.  The aliases of merged profiles are then
+        retrieved in further rounds, where each ID is retrieved only once.
+        """
+        requested = {a: str(a).split('-')[-1] for a in author_ids}
+        profiles = {}
+        pending = list(dict.fromkeys(requested.values()))
+        while pending:
+            batch = cls.batch(pending, workers=workers, verbose=verbose,
+                              view=view, **kwds)
+            results = dict(batch)
+            profiles.update(results)
+            aliases = [alias for profile in results.values()
+                       if not isinstance(profile, Exception) and profile.alias
+                       for alias in profile.alias]
+            pending = [a for a in dict.fromkeys(aliases) if a not in profiles]
+        return {author_id: _resolve_alias(profiles, auth_id)
+                for author_id, auth_id in requested.items()}
+
     def get_coauthors(self) -> list[Coauthor] | None:
         """Retrieves basic information about co-authors as a list of
         namedtuples in the form
@@ -380,7 +430,7 @@ class AuthorRetrieval(Retrieval):
         if not url:
             return None
         res = get_content(url, api="AuthorSearch")
-        data = loads(res.text)['search-results']
+        data = loads(res.content)['search-results']
         N = int(data.get('opensearch:totalResults', 0))
         # Store information in namedtuples
         coauthors = []
@@ -390,7 +440,7 @@ class AuthorRetrieval(Retrieval):
         while start < N:
             params = {'start': start, 'count': count, 'accept': 'json'}
             res = get_content(url, api="AuthorSearch", params=params)
-            data = loads(res.text)['search-results'].get('entry', [])
+            data = loads(res.content)['search-results'].get('entry', [])
             # Extract information for each coauthor
             for entry in data:
                 aff = entry.get('affiliation-current', {})
@@ -465,3 +515,20 @@ class AuthorRetrieval(Retrieval):
             query = f"AUTHLAST({self.surname}) AND AUTHFIRST({self.given_name})"
         s = AuthorSearch(query, *args, **kwds)
         return s.get_results_size()
+
+
+def _resolve_alias(profiles: dict, author_id: str, seen: set | None = None):
+    """Follow the aliases of a merged profile to the first main profile
+    among `profiles`, or return the profile itself if there is none.
+    """
+    profile = profiles[author_id]
+    if isinstance(profile, Exception) or not profile.alias:
+        return profile
+    seen = (seen or set()) | {author_id}
+    for alias in profile.alias:
+        if alias in seen or alias not in profiles:
+            continue
+        main = _resolve_alias(profiles, alias, seen)
+        if not isinstance(main, Exception) and not main.alias:
+            return main
+    return profile
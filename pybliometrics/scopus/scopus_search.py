@@ -1,9 +1,47 @@
-from typing import NamedTuple
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from tempfile import mkstemp
+from time import localtime
+from typing import Iterable, Iterator, NamedTuple
+from warnings import warn
 
+from tqdm import tqdm
+
+from pybliometrics.exception import ScopusQueryError
 from pybliometrics.superclasses import Search
-from pybliometrics.utils import check_integrity, check_parameter_value, \
-    check_field_consistency, deduplicate, get_freetoread, html_unescape, \
-    listify, make_search_summary, VIEWS
+from pybliometrics.superclasses.base import _check_file_age
+from pybliometrics.superclasses.search import _get_cache_key
+from pybliometrics.utils import check_column_integrity, check_integrity, \
+    check_parameter_value, check_field_consistency, deduplicate, dumps, \
+    encode_file, get_cache, get_cache_path, get_content, get_freetoread, \
+    get_max_workers, html_unescape, listify, loads, make_arrow_table, \
+    make_numpy_columns, make_search_summary, prune_on_write, \
+    SEARCH_MAX_ENTRIES, URLS, VIEWS
+
+# Fields used to partition queries with too many results, see split=True
+_SUBJAREAS = ('AGRI', 'ARTS', 'BIOC', 'BUSI', 'CENG', 'CHEM', 'COMP', 'DECI',
+              'DENT', 'EART', 'ECON', 'ENER', 'ENGI', 'ENVI', 'HEAL', 'IMMU',
+              'MATE', 'MATH', 'MEDI', 'NEUR', 'NURS', 'PHAR', 'PHYS', 'PSYC',
+              'SOCI', 'VETE', 'MULT')
+_DOCTYPES = ('ar', 're', 'cp', 'ch', 'bk', 'le', 'ed', 'no', 'sh', 'er', 'cr',
+             'dp', 'tb', 'ab', 'pr', 'rp')
+_FIRST_PUBYEAR = 1500
+# Typed columns of as_columns() and as_arrow()
+_INT_FIELDS = ('citedby_count', 'openaccess', 'author_count')
+_DICT_FIELDS = ('subtype', 'publicationName')
+_COLUMN_TYPES = {field: 'int64' for field in _INT_FIELDS}
+# Fields of Document taken from the entries as-is, and their keys
+_ITEM_KEYS = {'eid': 'eid', 'doi': 'prism:doi', 'pii': 'pii',
+              'pubmed_id': 'pubmed-id', 'subtype': 'subtype',
+              'subtypeDescription': 'subtypeDescription',
+              'creator': 'dc:creator', 'publicationName': 'prism:publicationName',
+              'issn': 'prism:issn', 'source_id': 'source-id',
+              'eIssn': 'prism:eIssn', 'aggregationType': 'prism:aggregationType',
+              'volume': 'prism:volume', 'issueIdentifier': 'prism:issueIdentifier',
+              'article_number': 'article-number', 'pageRange': 'prism:pageRange',
+              'coverDisplayDate': 'prism:coverDisplayDate',
+              'fund_acr': 'fund-acr', 'fund_sponsor': 'fund-sponsor'}
 
 
 class Document(NamedTuple):
@@ -87,75 +125,7 @@ class ScopusSearch(Search):
                  'freetoreadLabel fund_acr fund_no fund_sponsor'
         check_field_consistency(self._integrity, fields)
         # Parse elements one-by-one
-        out = []
-        for item in self._json:
-            info = {}
-            # Parse affiliations
-            for field, key in [('affilname', 'affilname'),
-                               ('afid', 'afid'),
-                               ('aff_city', 'affiliation-city'),
-                               ('aff_country', 'affiliation-country')]:
-                info[field] = _join(item, key, unescape=self.unescape)
-            # Parse authors
-            try:
-                # Deduplicate list of authors
-                authors = deduplicate(item['author'])
-                # Extract information
-                surnames = _replace_none([d['surname'] for d in authors])
-                firstnames = _replace_none([d['given-name'] for d in authors])
-                info["auth_names"] = ";".join([", ".join([t[0], t[1]]) for t in
-                                               zip(surnames, firstnames)])
-                info["auth_ids"] = ";".join([d['authid'] for d in authors])
-                affs = []
-                for auth in authors:
-                    aff = listify(deduplicate(auth.get('afid', [])))
-                    affs.append('-'.join([d['$'] for d in aff]))
-                if [a for a in affs if a]:
-                    info["auth_afid"] = ';'.join(affs)
-                else:
-                    info["auth_afid"] = None
-            except KeyError:
-                pass
-            date = item.get('prism:coverDate')
-            if isinstance(date, list):
-                date = date[0].get('$')
-            freetoread = get_freetoread(item, ["freetoread", "value"])
-            freetoreadLabel = get_freetoread(item, ["freetoreadLabel", "value"])
-            # Get text fields and unescape
-            for key in ['dc:title', 'dc:description', 'authkeywords']:
-                value = item.get(key)
-                info[key] = html_unescape(str(value)) if (self.unescape and value) else value
-            fund_no = item.get('fund-no', '').replace("undefined", "") or None
-            new = Document(article_number=item.get('article-number'),
-                      title=info.get('dc:title'),
-                      fund_no=fund_no,
-                      fund_sponsor=item.get('fund-sponsor'),
-                      subtype=item.get('subtype'), doi=item.get('prism:doi'),
-                      subtypeDescription=item.get('subtypeDescription'),
-                      issn=item.get('prism:issn'), creator=item.get('dc:creator'),
-                      affilname=info.get("affilname"),
-                      author_names=info.get("auth_names"),
-                      coverDate=date, volume=item.get('prism:volume'),
-                      coverDisplayDate=item.get('prism:coverDisplayDate'),
-                      publicationName=item.get('prism:publicationName'),
-                      source_id=item.get('source-id'), author_ids=info.get("auth_ids"),
-                      aggregationType=item.get('prism:aggregationType'),
-                      issueIdentifier=item.get('prism:issueIdentifier'),
-                      pageRange=item.get('prism:pageRange'),
-                      author_afids=info.get("auth_afid"),
-                      affiliation_country=info.get("aff_country"),
-                      citedby_count=int(item['citedby-count']),
-                      openaccess=int(item['openaccess']),
-                      freetoread=freetoread, freetoreadLabel=freetoreadLabel,
-                      eIssn=item.get('prism:eIssn'),
-                      author_count=item.get('author-count', {}).get('$'),
-                      affiliation_city=info.get("aff_city"), afid=info.get("afid"),
-                      description=info.get('dc:description'),
-                      pii=item.get('pii'),
-                      authkeywords=info.get('authkeywords'),
-                      eid=item.get('eid'),
-                      fund_acr=item.get('fund-acr'), pubmed_id=item.get('pubmed-id'))
-            out.append(new)
+        out = [self._parse_document(item) for item in self._json]
         # Finalize
         check_integrity(out, self._integrity, self._action)
         return out or None
@@ -170,6 +140,7 @@ class ScopusSearch(Search):
                  integrity_action: str = "raise",
                  subscriber: bool = True,
                  unescape: bool = True,
+                 split: bool = False,
                  **kwds: str
                  ) -> None:
         """Interaction with the Scopus Search API.
@@ -206,6 +177,13 @@ class ScopusSearch(Search):
                            corresponding view.
         :param unescape: Convert named and numeric characters in the `results` to
                          their corresponding Unicode characters.
+        :param split: Whether to partition the query into disjoint sub-queries
+                      with at most 5000 results each, download them
+                      concurrently and merge them.  Queries are split by
+                      publication year first, then by document type and
+                      finally by subject area.  Useful for queries with
+                      many results, and for non-subscribers, whose queries
+                      may not return more than 5000 results.
         :param kwds: Keywords passed on as query parameters.  Must contain
                      fields and values mentioned in the API specification at
                      https://dev.elsevier.com/documentation/ScopusSearchAPI.wadl.
@@ -213,7 +191,9 @@ class ScopusSearch(Search):
         Raises
         ------
         ScopusQueryError
-            For non-subscribers, if the number of search results exceeds 5000.
+            For non-subscribers, if the number of search results exceeds 5000
+            and `split=False`, or if the query cannot be partitioned into
+            sub-queries with at most 5000 results.
 
         ValueError
             If any of the parameters `integrity_action`, `refresh` or `view`
@@ -223,7 +203,8 @@ class ScopusSearch(Search):
         -----
         The directory for cached results is `{path}/{view}/{fname}`,
         where `path` is specified in your configuration file and `fname` is
-        the md5-hashed version of `query`.
+        the md5-hashed version of `query`.  With `split=True`, each
+        sub-query is cached as well.
         """
         # Checks
         if view:
@@ -247,6 +228,8 @@ class ScopusSearch(Search):
         self._refresh = refresh
         self._query = query
         self._view = view
+        if split and download:
+            self._download_partitions(verbose, **kwds)
         Search.__init__(self, query=query,
                         cursor=subscriber, download=download,
                         verbose=verbose, **kwds)
@@ -258,7 +241,295 @@ class ScopusSearch(Search):
 
     def get_eids(self):
         """EIDs of retrieved documents."""
-        return [d['eid'] for d in self._json]
+        return [d['eid'] for d in self._iter_entries()]
+
+    def iter_results(self) -> Iterator[Document]:
+        """Yield the namedtuples of `results` one by one.  Other than
+        `results`, this reads the cached entries lazily and thus works in
+        constant memory regardless of the number of results.
+
+        Raises
+        ------
+        ValueError
+            If the elements provided in `integrity_fields` do not match the
+            actual field names.
+        """
+        check_field_consistency(self._integrity, ' '.join(Document._fields))
+        for item in self._iter_entries():
+            doc = self._parse_document(item)
+            check_integrity([doc], self._integrity, self._action)
+            yield doc
+
+    def as_columns(self, fields: list[str] | None = None) -> tuple[dict, dict]:
+        """The results as a dictionary of NumPy arrays, one per field of
+        `results`, together with the distinct values of the
+        dictionary-encoded columns.  The cached entries are parsed into the
+        columns directly, without creating namedtuples first.
+
+        :param fields: Names of fields to return.  Defaults to all fields
+                       of `results`.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+
+        ValueError
+            If the elements provided in `fields` or `integrity_fields` do
+            not match the field names of `results`.
+
+        Notes
+        -----
+        The columns `citedby_count`, `openaccess` and `author_count` are of
+        type `int64`; missing values make them a masked array.  The columns
+        `subtype` and `publicationName` are dictionary-encoded, see
+        `make_numpy_columns()`.  All other columns are arrays of strings
+        with dtype `object`.
+        """
+        return make_numpy_columns(*self._parse_columns(fields), _COLUMN_TYPES)
+
+    def as_arrow(self, fields: list[str] | None = None):
+        """The results as a `pyarrow.Table` with one column per field of
+        `results`.  The cached entries are parsed into the columns directly,
+        without creating namedtuples first.
+
+        :param fields: Names of fields to return.  Defaults to all fields
+                       of `results`.
+
+        Raises
+        ------
+        ImportError
+            If PyArrow is not installed.
+
+        ValueError
+            If the elements provided in `fields` or `integrity_fields` do
+            not match the field names of `results`.
+
+        Notes
+        -----
+        The columns `citedby_count`, `openaccess` and `author_count` are of
+        type `int64`.  The columns `subtype` and `publicationName` are
+        dictionary-encoded strings.  All other columns are strings.
+
+        Use `s.as_arrow().to_pandas()` to obtain a DataFrame.
+        """
+        return make_arrow_table(*self._parse_columns(fields), _COLUMN_TYPES)
+
+    def _parse_columns(self, fields: list[str] | None) -> tuple[dict, dict]:
+        """Parse the cached entries into one list per field.
+
+        Values of the fields in `_INT_FIELDS` are integers.  Values of the
+        fields in `_DICT_FIELDS` are indices into the list of distinct
+        values of that field, which is returned in the second dictionary.
+        """
+        allowed = ' '.join(Document._fields)
+        check_field_consistency(self._integrity, allowed)
+        fields = fields or Document._fields
+        wrong = set(fields) - set(Document._fields)
+        if wrong:
+            msg = f"Element(s) '{', '.join(sorted(wrong))}' not allowed in "\
+                  "parameter fields"
+            raise ValueError(msg)
+        columns = {field: [] for field in [*fields, *self._integrity]}
+        lookups = {field: {} for field in _DICT_FIELDS if field in columns}
+        for item in self._iter_entries():
+            parsed = self._parse_fields(item, columns)
+            for field, column in columns.items():
+                value = parsed[field]
+                if value is None:
+                    pass
+                elif field in lookups:
+                    value = lookups[field].setdefault(value, len(lookups[field]))
+                elif field in _INT_FIELDS:
+                    value = int(value)
+                column.append(value)
+        check_column_integrity(columns, self._integrity, self._action)
+        columns = {field: columns[field] for field in fields}
+        categories = {field: list(lookup) for field, lookup in lookups.items()
+                      if field in columns}
+        return columns, categories
+
+    def _parse_document(self, item: dict) -> Document:
+        """Parse one entry of the search results."""
+        return Document(**self._parse_fields(item))
+
+    def _parse_fields(self, item: dict,
+                      fields: Iterable[str] = Document._fields) -> dict:
+        """Parse one entry of the search results into a dictionary with
+        the requested fields of `Document` (default: all).
+        """
+        fields = set(fields)
+        out = {field: item.get(key) for field, key in _ITEM_KEYS.items()
+               if field in fields}
+        # Parse affiliations
+        for field, key in [('affilname', 'affilname'),
+                           ('afid', 'afid'),
+                           ('affiliation_city', 'affiliation-city'),
+                           ('affiliation_country', 'affiliation-country')]:
+            if field in fields:
+                out[field] = _join(item, key, unescape=self.unescape)
+        # Parse authors
+        if fields & {'author_names', 'author_ids', 'author_afids'}:
+            out.update(_parse_authors(item))
+        if 'coverDate' in fields:
+            date = item.get('prism:coverDate')
+            if isinstance(date, list):
+                date = date[0].get('$')
+            out['coverDate'] = date
+        if 'freetoread' in fields:
+            out['freetoread'] = get_freetoread(item, ["freetoread", "value"])
+        if 'freetoreadLabel' in fields:
+            out['freetoreadLabel'] = get_freetoread(item, ["freetoreadLabel", "value"])
+        # Get text fields and unescape
+        for field, key in [('title', 'dc:title'),
+                           ('description', 'dc:description'),
+                           ('authkeywords', 'authkeywords')]:
+            if field in fields:
+                value = item.get(key)
+                out[field] = html_unescape(str(value)) if (self.unescape and value) else value
+        if 'fund_no' in fields:
+            out['fund_no'] = item.get('fund-no', '').replace("undefined", "") or None
+        if 'citedby_count' in fields:
+            out['citedby_count'] = int(item['citedby-count'])
+        if 'openaccess' in fields:
+            out['openaccess'] = int(item['openaccess'])
+        if 'author_count' in fields:
+            out['author_count'] = item.get('author-count', {}).get('$')
+        return out
+
+    def _download_partitions(self, verbose: bool, **kwds) -> None:
+        """Partition the query into sub-queries with at most
+        SEARCH_MAX_ENTRIES results, download them concurrently and write the
+        deduplicated union to the cache file of the query.
+        """
+        self._cache_key = _get_cache_key('ScopusSearch', self._view, self._query)
+        refresh, _ = _check_file_age(self)
+        if not refresh:
+            return
+        n = _count_results(self._query, **kwds)
+        if n <= SEARCH_MAX_ENTRIES:
+            # No need to split, hence download as usual
+            return
+        partitions = _partition_query(self._query, n, **kwds)
+        if verbose:
+            print(f'Downloading {len(partitions)} partitions for query "{self._query}":')
+
+        def download(query):
+            return ScopusSearch(query, refresh=self._refresh, view=self._view,
+                                subscriber=False, unescape=False, **kwds)
+
+        # Merge and deduplicate in a temporary file, whose name differs from
+        # the names of the sub-queries' cache and partial files
+        seen = set()
+        fname = get_cache_path(*self._cache_key)
+        fd, merged = mkstemp(suffix='.merge.tmp', prefix=fname.name + '.',
+                             dir=fname.parent)
+        merged = Path(merged)
+        try:
+            with ThreadPoolExecutor(max_workers=get_max_workers()) as executor, \
+                    os.fdopen(fd, 'wb') as ouf:
+                searches = executor.map(download, partitions)
+                for search in tqdm(searches, disable=not verbose, total=len(partitions)):
+                    for entry in search._iter_entries():
+                        if entry.get('eid') in seen:
+                            continue
+                        seen.add(entry.get('eid'))
+                        ouf.write(dumps(entry) + b"\n")
+            encode_file(merged)
+            get_cache().put_file(*self._cache_key, merged)
+        except BaseException:
+            merged.unlink(missing_ok=True)
+            raise
+        prune_on_write()
+        if len(seen) < n:
+            msg = f'Only {len(seen):,} of {n:,} results could be assigned '\
+                  'to a partition, e.g. because of a missing publication year.'
+            warn(msg)
+        self._refresh = False
+
+
+def _count_results(query, **kwds):
+    """Return the number of results of a query."""
+    params = {'query': query, 'count': 1, 'start': 0, 'view': 'STANDARD',
+              'field': 'eid', **kwds}
+    resp = get_content(URLS['ScopusSearch'], 'ScopusSearch', params)
+    res = loads(resp.content)
+    return int(res['search-results'].get('opensearch:totalResults', 0) or 0)
+
+
+def _partition_query(query, n, **kwds):
+    """Split a query into sub-queries with at most SEARCH_MAX_ENTRIES
+    results each: First by ranges of publication years, then for single
+    years by document type and finally by subject area.  Each split contains
+    a remainder sub-query for documents not covered by the listed values.
+    Sub-queries without results are dropped.  All sub-queries are disjoint,
+    see `_split_by_field()`.
+    """
+    if n <= SEARCH_MAX_ENTRIES:
+        return [query] if n else []
+    # Split by publication year in halves
+    stack = [(_FIRST_PUBYEAR, localtime().tm_year + 1, n)]
+    years = []
+    while stack:
+        first, last, count = stack.pop()
+        if count <= SEARCH_MAX_ENTRIES or first == last:
+            if count:
+                years.append((first, last, count))
+            continue
+        middle = (first + last)//2
+        for lower, upper in ((middle + 1, last), (first, middle)):
+            sub = _add_year_range(query, lower, upper)
+            stack.append((lower, upper, _count_results(sub, **kwds)))
+    # Split single years further
+    out = []
+    for first, last, count in sorted(years):
+        sub = _add_year_range(query, first, last)
+        if count <= SEARCH_MAX_ENTRIES:
+            out.append(sub)
+            continue
+        for type_query, type_count in _split_by_field(sub, 'DOCTYPE', _DOCTYPES, **kwds):
+            if type_count <= SEARCH_MAX_ENTRIES:
+                out.append(type_query)
+                continue
+            for area_query, area_count in _split_by_field(type_query, 'SUBJAREA', _SUBJAREAS, **kwds):
+                if area_count > SEARCH_MAX_ENTRIES:
+                    msg = f'Sub-query "{area_query}" still yields {area_count:,} '\
+                          f'results, more than {SEARCH_MAX_ENTRIES} entries.  '\
+                          'Change your query such that it returns fewer entries.'
+                    raise ScopusQueryError(msg)
+                out.append(area_query)
+    return out
+
+
+def _add_year_range(query, first, last):
+    """Restrict query to publication years from `first` to `last`."""
+    if first == last:
+        return f'({query}) AND PUBYEAR IS {first}'
+    return f'({query}) AND PUBYEAR > {first - 1} AND PUBYEAR < {last + 1}'
+
+
+def _split_by_field(query, field, values, **kwds):
+    """Split a query by the values of a field plus a remainder sub-query, and
+    yield the non-empty sub-queries with their number of results.
+
+    The sub-query of each value excludes the previous values, such that the
+    sub-queries are disjoint also for fields with several values per
+    document (e.g. SUBJAREA).  Each document belongs to the sub-query of
+    the first of its values.
+    """
+    subs = []
+    for i, value in enumerate(values):
+        sub = f'({query}) AND {field}({value})'
+        if i:
+            previous = " OR ".join(f'{field}({v})' for v in values[:i])
+            sub += f' AND NOT ({previous})'
+        subs.append(sub)
+    others = " OR ".join(f'{field}({value})' for value in values)
+    subs.append(f'({query}) AND NOT ({others})')
+    for sub in subs:
+        count = _count_results(sub, **kwds)
+        if count:
+            yield sub, count
 
 
 def _join(item, key, sep=";", unescape=False):
@@ -272,6 +543,31 @@ def _join(item, key, sep=";", unescape=False):
         return None
 
 
+def _parse_authors(item):
+    """Parse the deduplicated authors of an entry into the fields
+    `author_names`, `author_ids` and `author_afids` of `Document`.
+    """
+    info = dict.fromkeys(('author_names', 'author_ids', 'author_afids'))
+    try:
+        # Deduplicate list of authors
+        authors = deduplicate(item['author'])
+        # Extract information
+        surnames = _replace_none([d['surname'] for d in authors])
+        firstnames = _replace_none([d['given-name'] for d in authors])
+        info["author_names"] = ";".join([", ".join([t[0], t[1]]) for t in
+                                         zip(surnames, firstnames)])
+        info["author_ids"] = ";".join([d['authid'] for d in authors])
+        affs = []
+        for auth in authors:
+            aff = listify(deduplicate(auth.get('afid', [])))
+            affs.append('-'.join([d['$'] for d in aff]))
+        if [a for a in affs if a]:
+            info["author_afids"] = ';'.join(affs)
+    except KeyError:
+        pass
+    return info
+
+
 def _replace_none(lst, repl=""):
     """Auxiliary function to replace None's with another value."""
     return [repl if v is None else v for v in lst]
@@ -1,5 +1,8 @@
 """Tests for `scopus.AbstractRetrieval` module."""
 
+import asyncio
+
+from pybliometrics.exception import Scopus404Error
 from pybliometrics.scopus import AbstractRetrieval, init
 from pybliometrics.scopus.abstract_retrieval import (
     Affiliation, AuthorGroup, Author, Chemical, Contributor, 
@@ -247,6 +250,24 @@ def test_entitlement():
     assert ar10.document_entitlement_status == 'ENTITLED'
 
 
+def test_batch():
+    eids = ["2-s2.0-84930616647", "2-s2.0-0029486824", "2-s2.0-84930616647",
+            "2-s2.0-0000000000"]
+    batch = AbstractRetrieval.batch(eids, view="FULL", refresh=30)
+    received = dict(batch)
+    assert len(received) == 3
+    assert received["2-s2.0-84930616647"].title == ab1.title
+    assert received["2-s2.0-0029486824"].title == ab2.title
+    assert isinstance(received["2-s2.0-0000000000"], Scopus404Error)
+    assert (batch.hits, batch.failures) == (2, 1)
+
+
+def test_fetch():
+    ab = asyncio.run(AbstractRetrieval.fetch("2-s2.0-84930616647", view="FULL", refresh=30))
+    assert ab.eid == ab1.eid
+    assert ab.title == ab1.title
+
+
 def test_funding():
     received = ab6.funding
     assert isinstance(received, list)
@@ -365,6 +386,11 @@ def test_language():
     assert ab8.language is None
 
 
+def test_memoized_properties():
+    assert ab1.authors is ab1.authors
+    assert ab8.references is ab8.references
+
+
 def test_openaccess():
     assert ab5.openaccess == 0
     assert ab6.openaccess == 1
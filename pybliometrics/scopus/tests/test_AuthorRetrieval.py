@@ -63,6 +63,16 @@ def test_alias():
     assert enhanced.alias is None
 
 
+def test_batch_resolve():
+    ids = ["7004212771", "9-s2.0-7004212771", 7004212771]
+    received = AuthorRetrieval.batch_resolve(ids, view="METRICS", refresh=30)
+    assert list(received) == ids
+    for au in received.values():
+        assert au.alias is None
+        assert au.identifier == 7004212771
+        assert au.h_index == metrics.h_index
+
+
 def test_citation_count():
     expected = 13600
     assert metrics.citation_count >= expected
@@ -1,7 +1,8 @@
 """Tests for `scopus.CitationOverview` module."""
 
 from pybliometrics.scopus import init
-from pybliometrics.scopus.abstract_citation import Author, CitationOverview
+from pybliometrics.scopus.abstract_citation import Author, CitationOverview, \
+    _merge_responses, _parse_dict
 
 init()
 
@@ -15,25 +16,43 @@ def test_authors():
     url = 'https://api.elsevier.com/content/author/author_id/7004212771'
     john = Author(name='J.R., Kitchin, John R.', surname='Kitchin',
                   initials='J.R.', id='7004212771', url=url)
-    assert co_eid.authors[0][1] == john
-    assert co_eid.authors[1] == [john]
+    assert co_eid.authors[0] == [john]
+    assert co_eid.authors[1][1] == john
     assert co_doi.authors[0][1] == john
 
 
+def test_batch():
+    identifiers = [["84930616647", "85068268027"], ["85068268027"],
+                   ["84930616647", "85068268027"]]
+    batch = CitationOverview.batch(identifiers, refresh=30, date="2016-2020")
+    received = list(batch)
+    assert len(received) == 2
+    assert received[0][0] == identifiers[0]
+    assert received[0][1].cc == co_eid.cc
+    assert received[1][1].cc == [co_eid.cc[1]]
+    assert (batch.failures, batch.duplicates) == (0, 1)
+    assert batch.summary().endswith(", 1 skipped as duplicate")
+
+
 def test_cc():
     expected0 = [(2016, 0), (2017, 0), (2018, 0), (2019, 0), (2020, 6)]
     expected1 = [(2016, 4), (2017, 2), (2018, 3), (2019, 2), (2020, 2)]
-    assert co_eid.cc == [expected0, expected1]
+    assert co_eid.cc == [expected1, expected0]
     assert co_doi.cc == [expected0]
 
 
+def test_cached_documents():
+    received = CitationOverview(["85068268027", "84930616647"], date="2016-2020")
+    assert received.get_cache_file_mdate() == co_eid.get_cache_file_mdate()
+
+
 def test_citationType_long():
-    assert co_eid.citationType_long == ['ARTICLE', 'REVIEW']
+    assert co_eid.citationType_long == ['REVIEW', 'ARTICLE']
     assert co_doi.citationType_long == ['ARTICLE']
 
 
 def test_citationType_short():
-    assert co_eid.citationType_short == ['ARTICLE', 'REVIEW']
+    assert co_eid.citationType_short == ['REVIEW', 'ARTICLE']
     assert co_doi.citationType_short == ['ARTICLE']
 
 
@@ -43,13 +62,13 @@ def test_columnTotal():
 
 
 def test_doi():
-    expected = ['10.1016/j.softx.2019.100263', '10.1021/acscatal.5b00538']
+    expected = ['10.1021/acscatal.5b00538', '10.1016/j.softx.2019.100263']
     assert co_eid.doi == expected
-    assert co_doi.doi == [expected[0]]
+    assert co_doi.doi == [expected[1]]
 
 
 def test_endingPage():
-    assert co_eid.endingPage == [None, '3899']
+    assert co_eid.endingPage == ['3899', None]
     assert co_doi.endingPage is None
 
 
@@ -64,13 +83,13 @@ def test_h_index():
 
 
 def test_issn():
-    expected = ['2352-7110', '2155-5435']
+    expected = ['2155-5435', '2352-7110']
     assert co_eid.issn == expected
-    assert co_doi.issn == [expected[0]]
+    assert co_doi.issn == [expected[1]]
 
 
 def test_issueIdentifier():
-    assert co_eid.issueIdentifier == [None, '6']
+    assert co_eid.issueIdentifier == ['6', None]
     assert co_doi.issueIdentifier is None
 
 
@@ -79,21 +98,44 @@ def test_laterColumnTotal():
     assert co_doi.laterColumnTotal >= 16
 
 
+def test_input_order():
+    received = CitationOverview(["85068268027", "84930616647", "85068268027"],
+                                date="2016-2020")
+    assert received.scopus_id == co_eid.scopus_id[::-1]
+    assert received.cc == co_eid.cc[::-1]
+    assert received.rowTotal == co_eid.rowTotal[::-1]
+    assert received.grandTotal == co_eid.grandTotal
+    assert received.columnTotal == co_eid.columnTotal
+
+
 def test_lcc():
     assert co_eid.lcc[0] >= 1
     assert co_eid.lcc[1] >= 1
     assert co_doi.lcc[0] >= 1
 
 
+def test_merge_responses():
+    order = ["84930616647", "85068268027"]
+    merged = _merge_responses([co_eid, co_doi], order, "scopus_id")
+    legend = merged['identifier-legend']['identifier']
+    received = [int(_parse_dict(e)['scopus_id']) for e in legend]
+    assert received == [84930616647, 85068268027, 85068268027]
+    header = merged['citeColumnTotalXML']['citeCountHeader']
+    assert int(header['grandTotal']) == co_eid.grandTotal + co_doi.grandTotal
+    totals = [int(d['$']) for d in header['columnTotal']]
+    assert totals == [4, 2, 3, 2, 14]
+    assert merged['h-index'] == '3'
+
+
 def test_pcc():
     assert co_eid.pcc == [0, 0]
     assert co_doi.pcc == [0]
 
 
 def test_pii():
-    expected = ['S2352711019300573', None]
+    expected = [None, 'S2352711019300573']
     assert co_eid.pii == expected
-    assert co_doi.pii == [expected[0]]
+    assert co_doi.pii == [expected[1]]
 
 
 def test_prevColumnTotal():
@@ -102,9 +144,9 @@ def test_prevColumnTotal():
 
 
 def test_publicationName():
-    expected = ['SoftwareX', 'ACS Catalysis']
+    expected = ['ACS Catalysis', 'SoftwareX']
     assert co_eid.publicationName == expected
-    assert co_doi.publicationName == [expected[0]]
+    assert co_doi.publicationName == [expected[1]]
 
 
 def test_rangeColumnTotal():
@@ -125,30 +167,30 @@ def test_rowTotal():
 
 
 def test_scopus_id():
-    expected = [85068268027, 84930616647]
+    expected = [84930616647, 85068268027]
     assert co_eid.scopus_id == expected
-    assert co_doi.scopus_id == [expected[0]]
+    assert co_doi.scopus_id == [expected[1]]
 
 
 def test_startingPage():
-    assert co_eid.startingPage == [None, '3894']
+    assert co_eid.startingPage == ['3894', None]
     assert co_doi.startingPage == None
 
 
 def test_title():
-    expected = ['pybliometrics: Scriptable bibliometrics using a Python interface to Scopus',
-                'Examples of effective data sharing in scientific publishing']
+    expected = ['Examples of effective data sharing in scientific publishing',
+                'pybliometrics: Scriptable bibliometrics using a Python interface to Scopus']
     assert co_eid.title == expected
-    assert co_doi.title == [expected[0]]
+    assert co_doi.title == [expected[1]]
 
 
 def test_url():
-    expected = ['https://api.elsevier.com/content/abstract/scopus_id/85068268027',
-                'https://api.elsevier.com/content/abstract/scopus_id/84930616647']
+    expected = ['https://api.elsevier.com/content/abstract/scopus_id/84930616647',
+                'https://api.elsevier.com/content/abstract/scopus_id/85068268027']
     assert co_eid.url == expected
-    assert co_doi.url == [expected[0]]
+    assert co_doi.url == [expected[1]]
 
 
 def test_volume():
-    assert co_eid.volume == ['10', '5']
+    assert co_eid.volume == ['5', '10']
     assert co_doi.volume == ['10']
@@ -1,7 +1,13 @@
 """Tests for `scopus.ScopusSearch` module."""
 
+import asyncio
+
+import pytest
+
 from pybliometrics.scopus import ScopusSearch, init
 from pybliometrics.scopus.scopus_search import Document
+from pybliometrics.superclasses import base
+from pybliometrics.utils import concurrency
 
 init()
 
@@ -11,6 +17,64 @@ s_j = ScopusSearch('SOURCE-ID(22900) AND PUBYEAR IS 2010', unescape=True, refres
 s_d = ScopusSearch("DOI(10.1038/s41556-022-01034-3)", unescape=False, refresh=30)
 q_empty = 'SOURCE-ID(19700188323) AND PUBYEAR IS 1900'
 s_empty = ScopusSearch(q_empty, unescape=False, refresh=30)
+s_split = ScopusSearch('SOURCE-ID(22900) AND PUBYEAR > 2008 AND PUBYEAR < 2011',
+                       split=True, refresh=30)
+
+
+def test_aiter():
+    async def collect():
+        return [page async for page in
+                ScopusSearch.aiter('AU-ID(24320488600)', unescape=False, refresh=30)]
+    pages = asyncio.run(collect())
+    assert [d['eid'] for page in pages for d in page] == s_au.get_eids()
+
+
+def test_aiter_cancel(monkeypatch):
+    requests = []
+    get_content = base.get_content
+
+    def counting_get_content(*args, **kwds):
+        requests.append(args)
+        return get_content(*args, **kwds)
+
+    async def first_page():
+        pages = ScopusSearch.aiter('SOURCE-ID(22900) AND PUBYEAR IS 2010',
+                                   refresh=True)
+        page = await anext(pages)
+        await pages.aclose()
+        return page
+    # Use a separate thread pool to wait for the download to stop
+    monkeypatch.setattr(concurrency, '_executor', None)
+    monkeypatch.setattr(base, 'get_content', counting_get_content)
+    page = asyncio.run(first_page())
+    concurrency.get_executor().shutdown(wait=True)
+    assert len(page) == 25
+    assert len(requests) < 5
+
+
+def test_as_arrow():
+    pa = pytest.importorskip("pyarrow")
+    table = s_j.as_arrow()
+    assert table.column_names == list(Document._fields)
+    assert table.num_rows == 118
+    assert table.schema.field('citedby_count').type == pa.int64()
+    assert pa.types.is_dictionary(table.schema.field('publicationName').type)
+    assert table.column('eid').to_pylist() == s_j.get_eids()
+    assert s_empty.as_arrow(['eid']).num_rows == 0
+
+
+def test_as_columns():
+    np = pytest.importorskip("numpy")
+    columns, categories = s_j.as_columns(['eid', 'citedby_count',
+                                          'author_count', 'subtype'])
+    assert list(columns) == ['eid', 'citedby_count', 'author_count', 'subtype']
+    assert list(columns['eid']) == s_j.get_eids()
+    assert columns['citedby_count'].dtype == np.int64
+    expected = [int(d.author_count) for d in s_j.results]
+    assert columns['author_count'].tolist() == expected
+    assert columns['subtype'].dtype == np.int32
+    subtypes = categories['subtype'][columns['subtype']]
+    assert subtypes.tolist() == [d.subtype for d in s_j.results]
 
 
 def test_get_eids_author():
@@ -29,6 +93,24 @@ def test_get_results_size():
     assert s_empty.get_results_size() == 0
 
 
+def test_split():
+    eids = s_split.get_eids()
+    assert len(eids) == len(set(eids))
+    assert set(s_j.get_eids()) <= set(eids)
+    assert s_split.get_results_size() == len(eids)
+
+
+def test_split_unnecessary():
+    s = ScopusSearch('AU-ID(24320488600)', unescape=False, split=True,
+                     refresh=True)
+    assert s.get_eids() == s_au.get_eids()
+
+
+def test_iter_results():
+    assert list(s_au.iter_results()) == s_au.results
+    assert list(s_empty.iter_results()) == []
+
+
 def test_results_author():
     received = s_au.results[-1]
     expected = Document(eid='2-s2.0-26444452434', doi='10.1016/0014-2921(92)90085-B',
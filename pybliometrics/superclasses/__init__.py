@@ -1,3 +1,4 @@
 from pybliometrics.superclasses.base import *
 from pybliometrics.superclasses.retrieval import *
 from pybliometrics.superclasses.search import *
+from pybliometrics.superclasses.metrics import *
@@ -1,15 +1,33 @@
 """Base class object for superclasses."""
 
-from json import dumps, loads
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import cached_property
+from itertools import islice
 from math import ceil
 from time import localtime, strftime, time
 
 from tqdm import tqdm
 
-from pybliometrics.exception import ScopusQueryError
-from pybliometrics.utils import get_content, parse_content, SEARCH_MAX_ENTRIES
+from pybliometrics.exception import Scopus400Error, ScopusQueryError
+from pybliometrics.utils import decode, dumps, encode, encode_file, get_cache, \
+    get_cache_path, get_content, get_max_workers, get_memory_cache, loads, \
+    open_decoded, parse_content, prune_on_write, run_async, SEARCH_MAX_ENTRIES
 from pybliometrics.utils import listify
 
+# Response headers stored with cache entries to revalidate them
+VALIDATORS = ('ETag', 'Last-Modified')
+
+# Callback receiving each page of search results as it becomes available,
+# see Search.aiter()
+_page_listener = ContextVar('page_listener', default=None)
+# Whether to raise _CacheMiss instead of downloading, see Retrieval.batch()
+_cache_only = ContextVar('cache_only', default=False)
+
+
+class _CacheMiss(Exception):
+    """Raised instead of downloading if `_cache_only` is set."""
+
 
 class Base:
     def __init__(self,
@@ -34,6 +52,8 @@ class Base:
             If `self._refresh` is neither boolean nor numeric.
         """
         api = self.__class__.__name__
+        # Invalidate memoized properties of a previous initialization
+        _clear_memoized_properties(self)
         # Checks
         try:
             _ = int(self._refresh)
@@ -42,10 +62,12 @@ class Base:
             raise ValueError(msg)
 
         # Compare age of file to test whether we refresh
+        refresh = self._refresh
         self._refresh, mod_ts = _check_file_age(self)
 
         # Read or download, possibly with caching
-        fname = self._cache_file_path
+        cache = get_cache()
+        key = self._cache_key
 
         # Check if search request
         search_request = "query" in params
@@ -54,19 +76,52 @@ class Base:
         # Check if object retrieval
         obj_retrieval = (api == 'ObjectRetrieval')
 
-        if fname.exists() and not self._refresh:
+        if mod_ts is not None and not self._refresh:
             self._mdate = mod_ts
             if search_request:
-                self._json = [loads(line) for line in
-                              fname.read_text().split("\n") if line]
-                self._n = len(self._json)
+                # Entries are read lazily, see Search._json
+                self._json = None
+                self._n = _count_entries(key)
+                _notify_pages(_iter_entries(key), params['count'])
             elif obj_retrieval:
-                self._object = fname.read_bytes()
+                self._object = cache.get(*key)
             else:
-                self._json = loads(fname.read_text())
+                self._json = _read_json(key, mod_ts)
         else:
-            resp = get_content(url, api, params, **kwds)
+            if _cache_only.get():
+                raise _CacheMiss
+            # Resume interrupted cursor-based downloads
+            partial = None
+            state = None
+            if search_request and download:
+                partial = _PartialCacheFile(key, resumable="cursor" in params)
+                state = partial.load(refresh)
+            # Revalidate existing entries of retrievals
+            headers = {}
+            if mod_ts is not None and not search_request and not ab_ref_retrieval:
+                headers = _get_conditional_headers(cache.validators(*key))
+            if state:
+                try:
+                    resp = get_content(url, api, {**params, 'cursor': state['cursor']},
+                                       **kwds)
+                    params['cursor'] = state['cursor']
+                except Scopus400Error:
+                    # The cursor expired, hence start from scratch
+                    partial.discard()
+                    state = None
+            if not state:
+                resp = get_content(url, api, params, headers=headers, **kwds)
             header = resp.headers
+            if resp.status_code == 304:
+                # Cache entry is still up-to-date
+                cache.touch(*key)
+                self._mdate = cache.mtime(*key)
+                self._header = header
+                if obj_retrieval:
+                    self._object = cache.get(*key)
+                else:
+                    self._json = _read_json(key, self._mdate)
+                return
 
             if ab_ref_retrieval:
                 kwds['startref'] = '1'
@@ -75,7 +130,7 @@ class Base:
                 data = [data]
             elif search_request:
                 # Get number of results
-                res = resp.json()
+                res = loads(resp.content)
                 n = int(res['search-results'].get('opensearch:totalResults', 0) or 0)
                 self._n = n
                 # Results size check
@@ -87,49 +142,74 @@ class Base:
                            'your query such that it returns fewer entries.'
                     raise ScopusQueryError(text)
                 self._json = []
-                # Download results page-wise
+                # Download results page-wise and write them to the cache
+                # file as they arrive
                 if download:
-                    data = res.get('search-results', {}).get('entry', [])
-                    if not n:
-                        data = ""
-                    if not cursor_exists:
-                        start = params["start"]
+                    page = res.get('search-results', {}).get('entry', []) if n else []
+                    done = 0
+                    if state:
+                        done = state['entries']
+                        _notify_pages(partial.iter_entries(), params['count'])
+                    else:
+                        partial.discard()
+                    partial.append(page, res, n)
+                    _notify_pages(page, len(page))
                     # Download the remaining information in chunks
                     if verbose:
                         print(f'Downloading results for query "{params["query"]}":')
-                    n_chunks = ceil(n/params['count'])
-                    for i in tqdm(range(1, n_chunks), disable=not verbose,
-                                  initial=1, total=n_chunks):
-                        if cursor_exists:
-                            cursor = res['search-results']['cursor']['@next']
-                            params.update({'cursor': cursor})
-                        else:
-                            start += params["count"]
-                            params.update({'start': start})
-                        resp = get_content(url, api, params, **kwds)
-                        res = resp.json()
-                        data.extend(res.get('search-results', {}).get('entry', []))
+                    n_done = ceil(done/params['count'])
+                    n_chunks = n_done + ceil((n - done)/params['count'])
+                    if cursor_exists:
+                        responses = _get_cursor_pages(url, api, params, res,
+                                                      n_chunks - n_done, **kwds)
+                    else:
+                        # Offsets are known, hence download pages in parallel
+                        starts = [params["start"] + i*params["count"]
+                                  for i in range(1, n_chunks)]
+                        responses = _get_offset_pages(url, api, params, starts, **kwds)
+                    for resp, res in tqdm(responses, disable=not verbose,
+                                          initial=n_done + 1, total=n_chunks):
+                        page = res.get('search-results', {}).get('entry', [])
+                        partial.append(page, res, n)
+                        _notify_pages(page, len(page))
                     header = resp.headers  # Use header of final call
-                    self._json = data
-                else:
-                    data = None
+                    partial.complete()
+                    # Entries are read lazily, see Search._json
+                    self._json = None
+                data = None
             elif obj_retrieval:
                 self._object = resp.content
                 data = []
             else:
-                data = loads(resp.text)
+                data = loads(resp.content)
                 self._json = data
                 data = [data]
             # Set private variables
             self._mdate = time()
             self._header = header
-            # Finally write data unless download=False
-            if download:
+            # Finally write data unless download=False or already written
+            if download and data is not None:
+                validators = {k: header[k] for k in VALIDATORS if k in header}
                 if obj_retrieval:
-                    fname.write_bytes(self._object)
+                    _store(key, self._object, validators)
                 else:
-                    text = [dumps(item, separators=(',', ':')) for item in data]
-                    fname.write_text("\n".join(text))
+                    text = [dumps(item) for item in data]
+                    _store(key, encode(b"\n".join(text)), validators)
+
+    @classmethod
+    async def fetch(cls, *args, **kwds):
+        """Asynchronously create an instance of the class.
+
+        All arguments are passed on to the class.  The request runs in
+        a worker thread (see `pybliometrics.utils.get_executor()`), so that
+        one event loop can keep many requests in flight.  Caching and error
+        handling are identical to the synchronous class.
+
+        Example
+        -------
+        >>> ab = await AbstractRetrieval.fetch("2-s2.0-85068268027", view="FULL")
+        """
+        return await run_async(cls, *args, **kwds)
 
     def get_cache_file_age(self) -> int:
         """Return the age of the cached file in days."""
@@ -160,28 +240,230 @@ class Base:
             return None
 
 
+def _init_from_cache(init, obj, *args, **kwds) -> bool:
+    """Initialize `obj` with `init(obj, *args, **kwds)` without downloading.
+    Return whether the entry is cached and up-to-date; otherwise set
+    `obj._json` to `None`.
+    """
+    token = _cache_only.set(True)
+    try:
+        init(obj, *args, **kwds)
+    except _CacheMiss:
+        obj._json = None
+        return False
+    finally:
+        _cache_only.reset(token)
+    return True
+
+
+def _store(key: tuple[str, str, str], payload: bytes,
+           validators: dict | None = None) -> None:
+    """Write `payload` to cache entry `key` together with the validators
+    of the response, and drop the entry's parsed content from memory.
+    """
+    get_cache().put(*key, payload, validators)
+    memory = get_memory_cache()
+    if memory is not None:
+        memory.delete(key)
+    prune_on_write()
+
+
+def _clear_memoized_properties(self) -> None:
+    """Remove values of memoized properties from an instance."""
+    for cls in type(self).__mro__:
+        for name, attr in vars(cls).items():
+            if isinstance(attr, cached_property):
+                self.__dict__.pop(name, None)
+
+
+def _read_json(key: tuple[str, str, str], mtime: float) -> dict:
+    """Return the parsed content of a cache entry with modification time
+    `mtime`, from the in-process cache if possible.
+    """
+    memory = get_memory_cache()
+    if memory is not None:
+        data = memory.get(key, mtime)
+        if data is not None:
+            return data
+    data = loads(decode(get_cache().get(*key)))
+    if memory is not None:
+        memory.put(key, mtime, data)
+    return data
+
+
+def _get_conditional_headers(validators: dict) -> dict:
+    """Return the headers of a conditional request for an entry with the
+    given validators.
+    """
+    headers = {}
+    if 'ETag' in validators:
+        headers['If-None-Match'] = validators['ETag']
+    if 'Last-Modified' in validators:
+        headers['If-Modified-Since'] = validators['Last-Modified']
+    return headers
+
+
 def _check_file_age(self):
-    """Whether a file needs to be refreshed based on its age."""
+    """Whether a cache entry needs to be refreshed based on its age."""
     refresh = self._refresh
-    try:
-        mod_ts = self._cache_file_path.stat().st_mtime
-        if not isinstance(refresh, bool):
-            diff = time() - mod_ts
-            days = int(diff / 86400) + 1
-            allowed_age = int(self._refresh)
-            refresh = allowed_age < days
-    except FileNotFoundError:
+    mod_ts = get_cache().mtime(*self._cache_key)
+    if mod_ts is None:
         refresh = True
-        mod_ts = None
+    elif not isinstance(refresh, bool):
+        diff = time() - mod_ts
+        days = int(diff / 86400) + 1
+        allowed_age = int(self._refresh)
+        refresh = allowed_age < days
     return refresh, mod_ts
 
 
+class _PartialCacheFile:
+    def __init__(self, key: tuple[str, str, str], resumable: bool = False) -> None:
+        """Partial cache file of a search, which is extended page by page
+        and stored as cache entry `key` upon completion.  If `resumable`,
+        a state file stores the cursor of the next page after each page,
+        such that interrupted downloads can be resumed.
+        """
+        self.key = key
+        self.resumable = resumable
+        fname = get_cache_path(*key)
+        self.partial = fname.with_name(fname.name + '.partial')
+        self.state_file = fname.with_name(fname.name + '.cursor')
+        self._entries = 0
+
+    def load(self, refresh: bool | int) -> dict | None:
+        """Return the state of a previous download if it can be resumed,
+        i.e. unless `refresh` is True or the state is older than `refresh`
+        days.
+        """
+        if not self.resumable:
+            return None
+        try:
+            state = loads(self.state_file.read_bytes())
+            size = self.partial.stat().st_size
+        except (FileNotFoundError, ValueError):
+            return None
+        age = int((time() - self.state_file.stat().st_mtime) / 86400) + 1
+        if isinstance(refresh, bool):
+            too_old = refresh
+        else:
+            too_old = int(refresh) < age
+        if too_old or size < state['offset'] or not state['cursor']:
+            self.discard()
+            return None
+        # Remove entries written after the last state
+        with open(self.partial, 'r+b') as ouf:
+            ouf.truncate(state['offset'])
+        self._entries = state['entries']
+        return state
+
+    def append(self, entries: list[dict], res: dict, n: int) -> None:
+        """Append entries to the partial cache file and, if resumable, store
+        the cursor of the next page.
+        """
+        text = b"".join(dumps(item) + b"\n" for item in entries)
+        with open(self.partial, 'ab') as ouf:
+            ouf.write(text)
+            offset = ouf.tell()
+        self._entries += len(entries)
+        if not self.resumable:
+            return
+        cursor = parse_content.chained_get(res, ['search-results', 'cursor', '@next'])
+        state = {'cursor': cursor, 'offset': offset, 'entries': self._entries, 'n': n}
+        tmp = self.state_file.with_name(self.state_file.name + '.tmp')
+        tmp.write_bytes(dumps(state))
+        tmp.replace(self.state_file)
+
+    def iter_entries(self):
+        """Yield the entries of the partial cache file one by one."""
+        with open(self.partial, 'rb') as inf:
+            yield from _parse_lines(inf)
+
+    def complete(self) -> None:
+        """Turn the partial cache file into the final cache entry."""
+        encode_file(self.partial)
+        get_cache().put_file(*self.key, self.partial)
+        prune_on_write()
+        self.state_file.unlink(missing_ok=True)
+
+    def discard(self) -> None:
+        """Remove partial cache file and state."""
+        self.partial.unlink(missing_ok=True)
+        self.state_file.unlink(missing_ok=True)
+        self._entries = 0
+
+
+def _count_entries(key: tuple[str, str, str]) -> int:
+    """Return the number of entries in the cache entry of a search."""
+    with get_cache().open(*key) as raw, open_decoded(raw) as inf:
+        return sum(1 for line in inf if line.strip())
+
+
+def _iter_entries(key: tuple[str, str, str]):
+    """Yield the entries of the cache entry of a search one by one."""
+    with get_cache().open(*key) as raw, open_decoded(raw) as inf:
+        yield from _parse_lines(inf)
+
+
+def _parse_lines(inf):
+    """Yield the entries of a binary file with one entry per line."""
+    for line in inf:
+        if line.strip():
+            yield loads(line)
+
+
+def _get_cursor_pages(url: str, api: str, params: dict, res: dict,
+                      n_chunks: int, **kwds):
+    """Download the pages following the page `res` one after another using
+    the cursor until `n_chunks` pages (including `res`) are complete, and
+    yield the responses with their content.
+    """
+    for _ in range(1, n_chunks):
+        cursor = res['search-results']['cursor']['@next']
+        params.update({'cursor': cursor})
+        resp = get_content(url, api, params, **kwds)
+        res = loads(resp.content)
+        yield resp, res
+
+
+def _get_offset_pages(url: str, api: str, params: dict, starts: list[int],
+                      **kwds):
+    """Download the pages starting at `starts` concurrently and yield the
+    responses with their content in the order of `starts`.  The number of
+    concurrent downloads is set by `get_max_workers()`.
+    """
+    def get_page(start):
+        resp = get_content(url, api, {**params, 'start': start}, **kwds)
+        return resp, loads(resp.content)
+
+    if not starts:
+        return
+    with ThreadPoolExecutor(max_workers=get_max_workers()) as executor:
+        futures = [executor.submit(get_page, start) for start in starts]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _notify_pages(entries, size: int) -> None:
+    """Pass search results in pages of `size` to the listener, if any."""
+    listener = _page_listener.get()
+    if listener is None:
+        return
+    entries = iter(entries)
+    while page := list(islice(entries, size)):
+        listener(page)
+
+
 def _get_all_refs(url: str, params: dict, verbose: bool, resp: dict, **kwds) -> dict:
     """Get all references for `AbstractRetrieval` with view `REF`."""
     # startref starts at 1 (0 does not work)
     # Max refs per query are 40
     # Use of refcount leads to errors
-    res = resp.json()
+    res = loads(resp.content)
     path_total_references = ['abstracts-retrieval-response', 'references', '@total-references']
     try:
         n = int(parse_content.chained_get(res, path_total_references))
@@ -199,7 +481,7 @@ def _get_all_refs(url: str, params: dict, verbose: bool, resp: dict, **kwds) ->
         kwds['startref'] = str(int(kwds['startref']) + ref_len)
         # Get
         resp = get_content(url, 'AbstractRetrieval', params, **kwds)
-        res = resp.json()
+        res = loads(resp.content)
         res = parse_content.chained_get(res, path_reference)
         # Append
         data['abstracts-retrieval-response']['references']['reference'].extend(listify(res))
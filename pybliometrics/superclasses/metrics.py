@@ -0,0 +1,217 @@
+"""Superclass to access SciVal metrics APIs for many entities."""
+
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from pybliometrics.superclasses import Retrieval
+from pybliometrics.superclasses.base import _cache_only, _CacheMiss, \
+    _init_from_cache, _store
+from pybliometrics.utils import dumps, encode, get_content, get_max_workers, \
+    loads, make_arrow_table, make_numpy_columns, SCIVAL_MAX_ENTITIES, URLS
+from pybliometrics.utils.parse_metrics import build_metric_index, \
+    extract_metric_columns_from_index, extract_metric_data_from_index, \
+    MetricData
+
+# Types of the columns of as_columns() and as_arrow()
+_COLUMN_TYPES = {'entity_id': 'int64', 'year': 'int16', 'value': 'float64',
+                 'percentage': 'float64', 'threshold': 'int64'}
+
+
+class MetricsRetrieval(Retrieval):
+    def __init__(self,
+                 entity_ids: int | str | list,
+                 entity_param: str,
+                 entity_type: str,
+                 metric_types: list[str],
+                 **params: str
+                 ) -> None:
+        """Class intended as superclass to retrieve SciVal metrics of many
+        entities.
+
+        :param entity_ids: The ID(s) of the entities.  Can be a single ID,
+                           a comma-separated string of IDs, or a list of IDs.
+        :param entity_param: The query parameter of the entity IDs,
+                             e.g. `authors`.
+        :param entity_type: The key of the entity in the results,
+                            e.g. `author`.
+        :param metric_types: The metric types to retrieve.
+        :param params: Other query parameters, e.g. `byYear`.
+
+        Raises
+        ------
+        ValueError
+            If `entity_ids` contains no ID.
+
+        Notes
+        -----
+        Each combination of entity and metric type is cached separately, as
+        if it were retrieved on its own.  Only combinations that are not
+        cached yet are downloaded, in batches of at most
+        `SCIVAL_MAX_ENTITIES` entities that are retrieved concurrently (see
+        `get_max_workers()`).  The results follow the order of `entity_ids`.
+        """
+        api = self.__class__.__name__
+        if isinstance(entity_ids, list):
+            ids = [str(i).strip() for i in entity_ids]
+        else:
+            ids = [i.strip() for i in str(entity_ids).split(",")]
+        ids = list(dict.fromkeys(i for i in ids if i))
+        if not ids:
+            msg = "Provide at least 1 ID"
+            raise ValueError(msg)
+        self._entity_type = entity_type
+        self._metric_types = metric_types
+
+        # Read cached entries and download the others in batches
+        queries = {(i, m): {entity_param: i, 'metricTypes': m, **params}
+                   for i in ids for m in metric_types}
+        entries = {}
+        missing = {}
+        for pair, query in queries.items():
+            entry = self._read_entry(query, self._refresh)
+            if entry._json is None:
+                missing[pair] = entry
+            else:
+                entries[pair] = entry
+        if missing:
+            if _cache_only.get():
+                raise _CacheMiss
+            # Entities lacking the same metric types are requested together
+            lacking = {}
+            for ident, metric in missing:
+                lacking.setdefault(ident, []).append(metric)
+            groups = {}
+            for ident, metrics in lacking.items():
+                groups.setdefault(tuple(metrics), []).append(ident)
+            size = SCIVAL_MAX_ENTITIES[api]
+            batches = [(idents[i:i+size], metrics)
+                       for metrics, idents in groups.items()
+                       for i in range(0, len(idents), size)]
+
+            def download(batch):
+                return self._download_batch(*batch, missing, entity_param, params)
+
+            with ThreadPoolExecutor(max_workers=get_max_workers()) as executor:
+                for header in executor.map(download, batches):
+                    self._header = header
+            for pair in missing:
+                entries[pair] = self._read_entry(queries[pair], False)
+
+        # Combine the metrics of each entity
+        results = []
+        for ident in ids:
+            combined = None
+            for metric in metric_types:
+                for result in entries[(ident, metric)]._json.get('results', []):
+                    if combined is None:
+                        combined = {**result, 'metrics': []}
+                    combined['metrics'].extend(result.get('metrics', []))
+            if combined is not None:
+                results.append(combined)
+        self._json = {'results': results}
+        self._mdate = min(entry._mdate for entry in entries.values())
+        self._metric_index = build_metric_index(self._json, entity_type)
+
+    def as_arrow(self):
+        """The data of all retrieved metric types as a `pyarrow.Table` with
+        one column per field of `MetricData`, in the order of
+        `iter_metric_data()`.
+
+        Raises
+        ------
+        ImportError
+            If PyArrow is not installed.
+
+        Notes
+        -----
+        The column `entity_id` is of type `int64`, `year` of type `int16`
+        and `threshold` of type `int64`.  The columns `value` and
+        `percentage` are of type `float64`.  The columns `entity_name` and
+        `metric` are dictionary-encoded strings.  The year is missing if the
+        data is not broken down by year.
+
+        Use `m.as_arrow().to_pandas()` to obtain a DataFrame.
+        """
+        return make_arrow_table(*self._parse_columns(), _COLUMN_TYPES)
+
+    def as_columns(self) -> tuple[dict, dict]:
+        """The data of all retrieved metric types as a dictionary of NumPy
+        arrays, one per field of `MetricData`, together with the distinct
+        values of the dictionary-encoded columns.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+
+        Notes
+        -----
+        The column `entity_id` is of type `int64`, `year` of type `int16`
+        and `threshold` of type `int64`; missing values make them a masked
+        array.  The year is missing if the data is not broken down by year.
+        The columns `value` and `percentage` are of type `float64`, with
+        missing values as `nan`.  The columns `entity_name` and `metric` are
+        dictionary-encoded, see `make_numpy_columns()`.
+        """
+        return make_numpy_columns(*self._parse_columns(), _COLUMN_TYPES)
+
+    def iter_metric_data(self) -> Iterator[MetricData]:
+        """Iterate over the data of all retrieved metric types as
+        MetricData namedtuples, one metric type after another.
+        """
+        for metric in self._metric_types:
+            data = extract_metric_data_from_index(self._metric_index, metric,
+                                                  self._by_year)
+            yield from data or []
+
+    def _parse_columns(self) -> tuple[dict, dict]:
+        """Parse the data of all retrieved metric types into one list per
+        field of `MetricData`, see `extract_metric_columns_from_index()`.
+        """
+        return extract_metric_columns_from_index(self._metric_index,
+                                                 self._metric_types,
+                                                 self._by_year)
+
+    def _read_entry(self, query: dict, refresh: bool | int) -> 'MetricsRetrieval':
+        """Return the object of a single entity and metric type read from
+        the cache.  If the entry is not cached or needs to be refreshed,
+        the object's content is `None`.
+        """
+        entry = self.__class__.__new__(self.__class__)
+        entry._view = self._view
+        entry._refresh = refresh
+        _init_from_cache(Retrieval.__init__, entry, **query)
+        return entry
+
+    def _download_batch(self,
+                        idents: list[str],
+                        metrics: tuple[str, ...],
+                        entries: dict,
+                        entity_param: str,
+                        params: dict
+                        ) -> dict:
+        """Download the metric types `metrics` of several entities in one
+        request and store them in the cache entries of the corresponding
+        objects in `entries`.  Return the header of the response.
+        """
+        api = self.__class__.__name__
+        query = {'view': self._view, entity_param: ",".join(idents),
+                 'metricTypes': ",".join(metrics), **params}
+        resp = get_content(URLS[api], api, query)
+        data = loads(resp.content)
+        results = {str(r.get(self._entity_type, {}).get('id')): r
+                   for r in data.get('results', [])}
+        if len(idents) == 1 and len(results) == 1:
+            results = {idents[0]: next(iter(results.values()))}
+        for ident in idents:
+            result = results.get(ident)
+            for metric in metrics:
+                if result is None:
+                    content = {**data, 'results': []}
+                else:
+                    found = [m for m in result.get('metrics', [])
+                             if m.get('metricType') == metric]
+                    content = {**data, 'results': [{**result, 'metrics': found}]}
+                _store(entries[(ident, metric)]._cache_key,
+                       encode(dumps(content)))
+        return resp.headers
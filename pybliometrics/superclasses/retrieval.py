@@ -1,10 +1,15 @@
 """Superclass to access all Scopus retrieval APIs and dump the results."""
 
 import hashlib
-from pathlib import Path
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from tqdm import tqdm
 
 from pybliometrics.superclasses import Base
-from pybliometrics.utils import APIS_NO_ID_IN_URL, APIS_WITH_ID_TYPE, get_config, URLS
+from pybliometrics.superclasses.base import _cache_only, _CacheMiss
+from pybliometrics.utils import APIS_NO_ID_IN_URL, APIS_WITH_ID_TYPE, URLS, \
+    get_max_workers
 
 
 class Retrieval(Base):
@@ -45,11 +50,133 @@ class Retrieval(Base):
         else:
             url += str(identifier)
             stem = str(identifier).replace('/', '_')
-        # Get cache file path
-        config = get_config()
-        parent = Path(config.get('Directories', api))
-        self._cache_file_path = parent/self._view/stem
+        # Get key of cache entry
+        self._cache_key = (api, self._view, stem)
 
         # Parse file contents
         params = {'view': self._view, **kwds}
         Base.__init__(self, params=params, url=url)
+
+    @classmethod
+    def batch(cls,
+              identifiers: Iterable,
+              workers: int | None = None,
+              verbose: bool = False,
+              **kwds
+              ) -> 'RetrievalBatch':
+        """Retrieve many identifiers, downloading those that are not cached
+        concurrently.
+
+        :param identifiers: The identifiers to retrieve.  Duplicates, i.e.
+                            identifiers with the same string representation,
+                            are retrieved only once.
+        :param workers: The number of concurrent downloads.  Defaults to
+                        `Workers` in section `[Requests]` of the
+                        configuration file (see `get_max_workers()`).
+        :param verbose: Whether to print a progress bar and a summary.
+        :param kwds: Keywords passed on to the class, e.g. `view` or
+                     `refresh`.
+
+        Returns
+        -------
+        RetrievalBatch
+            An iterable of tuples `(identifier, result)`, where `result` is
+            either an instance of the class or the exception raised for
+            this identifier (e.g. `Scopus404Error`).  Cached identifiers
+            come first, downloaded ones follow as they complete.
+
+        Example
+        -------
+        >>> batch = AbstractRetrieval.batch(eids, view="FULL", workers=8)
+        >>> for eid, ab in batch:
+        ...     if isinstance(ab, Exception):
+        ...         continue
+        ...     print(ab.title)
+        >>> print(batch.summary())
+        """
+        return RetrievalBatch(cls, identifiers, workers, verbose, kwds)
+
+
+class RetrievalBatch:
+    def __init__(self,
+                 cls: type,
+                 identifiers: Iterable,
+                 workers: int | None,
+                 verbose: bool,
+                 kwds: dict
+                 ) -> None:
+        """Iterable over the results of a retrieval class for many
+        identifiers, see `Retrieval.batch()`.
+
+        Attributes `hits`, `misses` and `failures` count the identifiers
+        read from the cache, the identifiers that needed to be downloaded
+        and the identifiers whose retrieval raised an exception.  Attribute
+        `duplicates` counts the identifiers skipped as duplicates.
+        """
+        self.cls = cls
+        identifiers = list(identifiers)
+        # Compare strings, as identifiers may be unhashable lists of IDs
+        unique = {}
+        for identifier in identifiers:
+            unique.setdefault(str(identifier), identifier)
+        self.identifiers = list(unique.values())
+        self.duplicates = len(identifiers) - len(self.identifiers)
+        self.workers = workers or get_max_workers()
+        self.verbose = verbose
+        self.kwds = kwds
+        self.hits = 0
+        self.misses = 0
+        self.failures = 0
+
+    def __iter__(self) -> Iterator[tuple]:
+        self.hits = self.misses = self.failures = 0
+        progress = tqdm(total=len(self.identifiers), disable=not self.verbose)
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        futures = {}
+        try:
+            # Read cached identifiers and submit the others for download
+            for identifier in self.identifiers:
+                token = _cache_only.set(True)
+                try:
+                    result = self.cls(identifier, **self.kwds)
+                except _CacheMiss:
+                    self.misses += 1
+                    future = executor.submit(self.cls, identifier, **self.kwds)
+                    futures[future] = identifier
+                    continue
+                except Exception as err:
+                    result = err
+                finally:
+                    _cache_only.reset(token)
+                self.hits += not isinstance(result, Exception)
+                yield self._finish(identifier, result, progress)
+            # Yield downloads as they complete
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as err:
+                    result = err
+                yield self._finish(futures[future], result, progress)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            progress.close()
+        if self.verbose:
+            print(self.summary())
+
+    def __len__(self) -> int:
+        return len(self.identifiers)
+
+    def summary(self) -> str:
+        """Return a summary of hits, misses, failures and duplicates."""
+        summary = f"{self.hits:,} from cache, {self.misses:,} not cached, "\
+                  f"{self.failures:,} failed"
+        if self.duplicates:
+            summary += f", {self.duplicates:,} skipped as duplicate"
+        return summary
+
+    def _finish(self, identifier, result, progress) -> tuple:
+        """Count and return the result of an identifier."""
+        if isinstance(result, Exception):
+            self.failures += 1
+        progress.update()
+        return identifier, result
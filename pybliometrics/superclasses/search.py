@@ -1,13 +1,29 @@
 """Superclass to access all Scopus search APIs and dump the results."""
 
+import asyncio
+from collections.abc import AsyncIterator
 from hashlib import md5
-from pathlib import Path
+from threading import Event
 
 from pybliometrics.superclasses import Base
-from pybliometrics.utils import get_config, COUNTS, URLS
+from pybliometrics.superclasses.base import _iter_entries, _page_listener
+from pybliometrics.utils import get_cache, run_async, COUNTS, URLS
 
 
 class Search(Base):
+    @property
+    def _json(self) -> list[dict]:
+        """Entries of the search results, read from the cache file upon
+        first access.
+        """
+        if self._json_entries is None:
+            self._json_entries = list(self._iter_entries())
+        return self._json_entries
+
+    @_json.setter
+    def _json(self, value: list[dict] | None) -> None:
+        self._json_entries = value
+
     def __init__(self,
                  query: str | dict,
                  cursor: bool = False,
@@ -49,16 +65,70 @@ class Search(Base):
             if "start" not in params:
                 params['start'] = 0
 
-        # Construct cache file path
-        stem = md5(name.encode('utf8')).hexdigest()
-        # Get cache file path
-        config = get_config()
-        parent = Path(config.get('Directories', api))
-        self._cache_file_path = parent/self._view/stem
+        # Get key of cache entry
+        self._cache_key = _get_cache_key(api, self._view, name)
 
         # Init
         Base.__init__(self, params=params, url=URLS[api], download=download, verbose=verbose)
 
+    @classmethod
+    async def aiter(cls, *args, **kwds) -> AsyncIterator[list[dict]]:
+        """Asynchronously iterate over the pages of search results.
+
+        All arguments are passed on to the class.  Each page is a list of
+        raw entries as returned by the API and is yielded as soon as it
+        was downloaded (or read from the cache).  The results are cached
+        exactly as by the synchronous class.  If the iteration is cancelled
+        or stopped early, the download stops at the next page and, if
+        cursor-based, is resumed like an interrupted download.
+
+        Example
+        -------
+        >>> async for page in ScopusSearch.aiter("AU-ID(7004212771)"):
+        ...     print(len(page))
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        done = object()
+        stop = Event()
+
+        def listener(page):
+            if stop.is_set():
+                # Abort the download in the worker thread
+                raise asyncio.CancelledError
+            loop.call_soon_threadsafe(queue.put_nowait, page)
+
+        token = _page_listener.set(listener)
+        try:
+            future = run_async(cls, *args, **kwds)
+        finally:
+            _page_listener.reset(token)
+        future.add_done_callback(lambda _: queue.put_nowait(done))
+        try:
+            while (page := await queue.get()) is not done:
+                yield page
+            await future
+        finally:
+            if not future.done():
+                stop.set()
+                future.cancel()
+
+    def _iter_entries(self):
+        """Yield the entries of the search results one by one without
+        keeping them in memory.
+        """
+        if self._json_entries is not None:
+            yield from self._json_entries
+        elif get_cache().mtime(*self._cache_key) is not None:
+            yield from _iter_entries(self._cache_key)
+
     def get_results_size(self) -> int:
         """Return the number of results (works even if download=False)."""
         return self._n
+
+
+def _get_cache_key(api: str, view: str, name: str) -> tuple[str, str, str]:
+    """Return the key of the cache entry for a search, whose stem is the
+    md5-hashed version of the query.
+    """
+    return api, view, md5(name.encode('utf8')).hexdigest()
@@ -1,7 +1,13 @@
+from pybliometrics.utils.cache import *
 from pybliometrics.utils.checks import *
+from pybliometrics.utils.columns import *
+from pybliometrics.utils.concurrency import *
 from pybliometrics.utils.constants import *
 from pybliometrics.utils.create_config import *
 from pybliometrics.utils.get_content import *
+from pybliometrics.utils.key_pool import *
 from pybliometrics.utils.parse_content import *
 from pybliometrics.utils.parse_metrics import *
+from pybliometrics.utils.serialization import *
 from pybliometrics.utils.startup import *
+from pybliometrics.utils.throttle import *
@@ -0,0 +1,882 @@
+"""Storage of downloaded results, keyed by API, view and stem."""
+
+import gzip
+import heapq
+import os
+import shutil
+import sqlite3
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from io import BufferedReader, BytesIO, RawIOBase
+from pathlib import Path
+from threading import Lock, Thread, local
+from time import time
+from typing import BinaryIO, Iterator, NamedTuple
+from warnings import warn
+
+from pybliometrics.utils.constants import CACHE_PATH
+from pybliometrics.utils.serialization import dumps, loads
+from pybliometrics.utils.startup import get_config
+
+# Leading bytes of compressed entries; JSON always starts with "{" or "["
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+# Suffixes of files next to the files of cache entries that are no entries:
+# unfinished downloads and response validators
+AUX_SUFFIXES = ('.partial', '.cursor', '.tmp', '.validators')
+# Minimum number of seconds between two automatic prunings, see PruneOnWrite
+PRUNE_INTERVAL = 60
+# Number of seconds within which repeated reads do not update the access time
+ATIME_RESOLUTION = 3600
+# Number of least recently used entries fetched at once while pruning
+PRUNE_BATCH = 1000
+# Number of seconds after which FileCache recounts the size of its entries,
+# e.g. to include entries written by other processes
+RECOUNT_INTERVAL = 3600
+# Number of bytes read or written at once when streaming entries of SQLiteCache
+BLOB_CHUNK_SIZE = 1 << 20
+
+
+class CacheEntry(NamedTuple):
+    api: str
+    view: str
+    stem: str
+    size: int
+    mtime: float
+    atime: float
+
+
+class CacheBackend(ABC):
+    """Interface of cache backends.
+
+    Entries are identified by the name of the API, the view and a stem,
+    which is the (possibly hashed) identifier or query.  Their content is
+    stored as bytes.
+    """
+
+    @abstractmethod
+    def get(self, api: str, view: str, stem: str) -> bytes | None:
+        """Return the content of an entry, or `None` if it does not exist."""
+
+    @abstractmethod
+    def put(self, api: str, view: str, stem: str, data: bytes,
+            validators: dict | None = None) -> None:
+        """Store the content of an entry, replacing an existing one, together
+        with the validators of the response (the headers `ETag` and
+        `Last-Modified`), if any.
+        """
+
+    @abstractmethod
+    def mtime(self, api: str, view: str, stem: str) -> float | None:
+        """Return the time of the last modification of an entry as
+        timestamp, or `None` if it does not exist.
+        """
+
+    @abstractmethod
+    def touch(self, api: str, view: str, stem: str) -> None:
+        """Set the time of the last modification of an entry to now, e.g.
+        because the server confirmed that it is still up-to-date.
+        """
+
+    @abstractmethod
+    def validators(self, api: str, view: str, stem: str) -> dict:
+        """Return the validators stored with an entry."""
+
+    @abstractmethod
+    def delete(self, api: str, view: str, stem: str) -> None:
+        """Remove an entry if it exists."""
+
+    def open(self, api: str, view: str, stem: str) -> BinaryIO:
+        """Return a binary file object to read an entry.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the entry does not exist.
+        """
+        data = self.get(api, view, stem)
+        if data is None:
+            raise FileNotFoundError(f"No cache entry for {api}/{view}/{stem}")
+        return BytesIO(data)
+
+    def put_file(self, api: str, view: str, stem: str, path: Path) -> None:
+        """Store the content of the file at `path` as an entry and remove
+        the file.
+        """
+        self.put(api, view, stem, path.read_bytes())
+        path.unlink()
+
+    @abstractmethod
+    def entries(self, api: str | None = None) -> Iterator[CacheEntry]:
+        """Yield size, time of last modification and time of last access
+        of all entries, or of all entries of `api`.
+        """
+
+    def delete_many(self, keys: list[tuple[str, str, str]]) -> None:
+        """Remove several entries given by their keys."""
+        for key in keys:
+            self.delete(*key)
+
+    def size(self, api: str | None = None) -> int:
+        """Return the number of bytes of all entries, or of all entries of
+        `api`.
+        """
+        return sum(entry.size for entry in self.entries(api))
+
+    def least_recently_used(self, api: str | None, limit: int) -> list[CacheEntry]:
+        """Return at most `limit` entries, or entries of `api`, with the
+        earliest time of last access, ordered by it.
+        """
+        return heapq.nsmallest(limit, self.entries(api), key=lambda e: e.atime)
+
+    def expired(self, before: float, api: str | None = None) -> list[CacheEntry]:
+        """Return all entries, or entries of `api`, modified before the
+        timestamp `before`.
+        """
+        return [entry for entry in self.entries(api) if entry.mtime < before]
+
+
+class FileCache(CacheBackend):
+    def __init__(self) -> None:
+        """Cache storing each entry in a file `{path}/{view}/{stem}`, where
+        `path` is the folder of the API in section `[Directories]` of the
+        configuration file.
+
+        Notes
+        -----
+        The size and the earliest modification time of the entries of each
+        API are counted once and then updated on writes, such that pruning
+        does not walk the folders while the cache is within its budget.
+        They are recounted every RECOUNT_INTERVAL seconds.
+        """
+        self._stats = {}
+        self._stats_lock = Lock()
+
+    def get(self, api: str, view: str, stem: str) -> bytes | None:
+        path = get_cache_path(api, view, stem)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        _touch(path)
+        return data
+
+    def put(self, api: str, view: str, stem: str, data: bytes,
+            validators: dict | None = None) -> None:
+        path = get_cache_path(api, view, stem)
+        old = _file_size(path)
+        path.write_bytes(data)
+        self._add_size(api, len(data) - old)
+        aux = _validators_path(path)
+        if validators:
+            aux.write_bytes(dumps(validators))
+        else:
+            aux.unlink(missing_ok=True)
+
+    def mtime(self, api: str, view: str, stem: str) -> float | None:
+        try:
+            return get_cache_path(api, view, stem).stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def touch(self, api: str, view: str, stem: str) -> None:
+        os.utime(get_cache_path(api, view, stem))
+
+    def validators(self, api: str, view: str, stem: str) -> dict:
+        try:
+            return loads(_validators_path(get_cache_path(api, view, stem)).read_bytes())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def delete(self, api: str, view: str, stem: str) -> None:
+        path = get_cache_path(api, view, stem)
+        old = _file_size(path)
+        path.unlink(missing_ok=True)
+        self._add_size(api, -old)
+        _validators_path(path).unlink(missing_ok=True)
+
+    def open(self, api: str, view: str, stem: str) -> BinaryIO:
+        path = get_cache_path(api, view, stem)
+        inf = open(path, 'rb')
+        _touch(path)
+        return inf
+
+    def put_file(self, api: str, view: str, stem: str, path: Path) -> None:
+        target = get_cache_path(api, view, stem)
+        delta = _file_size(path) - _file_size(target)
+        path.replace(target)
+        self._add_size(api, delta)
+        _validators_path(target).unlink(missing_ok=True)
+
+    def entries(self, api: str | None = None) -> Iterator[CacheEntry]:
+        for name, folder in get_config().items('Directories'):
+            if api and name != api:
+                continue
+            for root, _, files in os.walk(folder):
+                view = os.path.relpath(root, folder)
+                view = "" if view == "." else view
+                for stem in files:
+                    if stem.endswith(AUX_SUFFIXES):
+                        continue
+                    try:
+                        stat = os.stat(os.path.join(root, stem))
+                    except FileNotFoundError:
+                        continue
+                    yield CacheEntry(name, view, stem, stat.st_size,
+                                     stat.st_mtime, stat.st_atime)
+
+    def size(self, api: str | None = None) -> int:
+        return sum(self._get_stats(name)[0] for name in self._apis(api))
+
+    def least_recently_used(self, api: str | None, limit: int) -> list[CacheEntry]:
+        entries = (entry for name in self._apis(api) for entry in self._scan(name))
+        return heapq.nsmallest(limit, entries, key=lambda e: e.atime)
+
+    def expired(self, before: float, api: str | None = None) -> list[CacheEntry]:
+        out = []
+        for name in self._apis(api):
+            if self._get_stats(name)[1] >= before:
+                continue
+            kept = float("inf")
+            for entry in self._scan(name):
+                if entry.mtime < before:
+                    out.append(entry)
+                else:
+                    kept = min(kept, entry.mtime)
+            # The expired entries are about to be removed
+            with self._stats_lock:
+                self._stats[name][1] = kept
+        return out
+
+    def _apis(self, api: str | None) -> list[str]:
+        """Return the names of all APIs, or `[api]`."""
+        if api:
+            return [api]
+        return [name for name, _ in get_config().items('Directories')]
+
+    def _scan(self, api: str) -> Iterator[CacheEntry]:
+        """Yield the entries of `api` and, once all are yielded, store
+        their size and earliest modification time.
+        """
+        size = 0
+        oldest = float("inf")
+        for entry in self.entries(api):
+            size += entry.size
+            oldest = min(oldest, entry.mtime)
+            yield entry
+        with self._stats_lock:
+            self._stats[api] = [size, oldest, time()]
+
+    def _get_stats(self, api: str) -> list:
+        """Return the size, the earliest modification time and the time of
+        counting of the entries of `api`, counting them if necessary.
+        """
+        with self._stats_lock:
+            stats = self._stats.get(api)
+        if stats is None or stats[2] < time() - RECOUNT_INTERVAL:
+            for _ in self._scan(api):
+                pass
+            with self._stats_lock:
+                stats = self._stats[api]
+        return stats
+
+    def _add_size(self, api: str, delta: int) -> None:
+        """Update the counted size of the entries of `api`."""
+        with self._stats_lock:
+            if api in self._stats:
+                self._stats[api][0] += delta
+
+
+class SQLiteCache(CacheBackend):
+    def __init__(self, path: str | Path) -> None:
+        """Cache storing all entries in a single SQLite file, which avoids
+        millions of small files.  The file uses write-ahead logging, so
+        that several threads and processes can read and write concurrently.
+
+        :param path: The location of the SQLite file.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = local()
+        con = self._connect()
+        if con.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            # Files created without incremental vacuum need to be rebuilt
+            # once, otherwise they never shrink
+            con.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            try:
+                con.execute("VACUUM")
+            except sqlite3.OperationalError as err:
+                warn(f"Could not enable incremental vacuum for {path}: {err}")
+        con.execute("CREATE TABLE IF NOT EXISTS entries (api TEXT, view TEXT, "
+                    "stem TEXT, data BLOB, mtime REAL, atime REAL, "
+                    "validators TEXT, size INTEGER, PRIMARY KEY (api, view, stem))")
+        # Add columns missing in files created by earlier versions
+        columns = [row[1] for row in con.execute("PRAGMA table_info(entries)")]
+        for column, kind in (("atime", "REAL"), ("validators", "TEXT"),
+                             ("size", "INTEGER")):
+            if column not in columns:
+                con.execute(f"ALTER TABLE entries ADD COLUMN {column} {kind}")
+        con.execute("UPDATE entries SET atime = mtime WHERE atime IS NULL")
+        con.execute("UPDATE entries SET size = length(data) WHERE size IS NULL")
+        # Indexes to prune without reading all entries
+        con.execute("CREATE INDEX IF NOT EXISTS entries_atime ON entries (atime)")
+        con.execute("CREATE INDEX IF NOT EXISTS entries_api_atime ON entries "
+                    "(api, atime, size)")
+        con.execute("CREATE INDEX IF NOT EXISTS entries_mtime ON entries (mtime)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the connection of the current thread."""
+        try:
+            return self._local.con
+        except AttributeError:
+            con = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            con.execute("PRAGMA journal_mode=WAL")
+            self._local.con = con
+            return con
+
+    def get(self, api: str, view: str, stem: str) -> bytes | None:
+        con = self._connect()
+        row = con.execute(
+            "SELECT data, atime FROM entries WHERE api = ? AND view = ? AND stem = ?",
+            (api, view, stem)).fetchone()
+        if row is None:
+            return None
+        self._update_atime(api, view, stem, row[1])
+        return row[0]
+
+    def _update_atime(self, api: str, view: str, stem: str,
+                      atime: float | None) -> None:
+        """Set the time of the last access of an entry to now unless it was
+        accessed recently.
+        """
+        now = time()
+        if atime is None or atime < now - ATIME_RESOLUTION:
+            self._connect().execute(
+                "UPDATE entries SET atime = ? WHERE api = ? AND view = ? AND "
+                "stem = ?", (now, api, view, stem))
+
+    def put(self, api: str, view: str, stem: str, data: bytes,
+            validators: dict | None = None) -> None:
+        now = time()
+        validators = dumps(validators).decode() if validators else None
+        self._connect().execute(
+            "INSERT OR REPLACE INTO entries (api, view, stem, data, mtime, "
+            "atime, validators, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (api, view, stem, data, now, now, validators, len(data)))
+
+    def mtime(self, api: str, view: str, stem: str) -> float | None:
+        row = self._connect().execute(
+            "SELECT mtime FROM entries WHERE api = ? AND view = ? AND stem = ?",
+            (api, view, stem)).fetchone()
+        return row[0] if row else None
+
+    def touch(self, api: str, view: str, stem: str) -> None:
+        now = time()
+        self._connect().execute(
+            "UPDATE entries SET mtime = ?, atime = ? WHERE api = ? AND "
+            "view = ? AND stem = ?", (now, now, api, view, stem))
+
+    def validators(self, api: str, view: str, stem: str) -> dict:
+        row = self._connect().execute(
+            "SELECT validators FROM entries WHERE api = ? AND view = ? AND stem = ?",
+            (api, view, stem)).fetchone()
+        if not row or not row[0]:
+            return {}
+        return loads(row[0])
+
+    def delete(self, api: str, view: str, stem: str) -> None:
+        self._connect().execute(
+            "DELETE FROM entries WHERE api = ? AND view = ? AND stem = ?",
+            (api, view, stem))
+
+    def open(self, api: str, view: str, stem: str) -> BinaryIO:
+        """Return a binary file object to read an entry.  The entry is read
+        incrementally on Python 3.11+, and at once on earlier versions.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the entry does not exist.
+        """
+        if not hasattr(sqlite3.Connection, 'blobopen'):
+            return super().open(api, view, stem)
+        con = self._connect()
+        row = con.execute(
+            "SELECT rowid, atime FROM entries WHERE api = ? AND view = ? AND stem = ?",
+            (api, view, stem)).fetchone()
+        try:
+            if row is None:
+                raise sqlite3.OperationalError
+            self._update_atime(api, view, stem, row[1])
+            blob = con.blobopen("entries", "data", row[0], readonly=True)
+        except sqlite3.OperationalError:
+            # The entry does not exist or was removed in the meantime
+            raise FileNotFoundError(f"No cache entry for {api}/{view}/{stem}")
+        return BufferedReader(_BlobReader(blob), BLOB_CHUNK_SIZE)
+
+    def put_file(self, api: str, view: str, stem: str, path: Path) -> None:
+        """Store the content of the file at `path` as an entry and remove
+        the file.  The file is written incrementally on Python 3.11+, and at
+        once on earlier versions.
+        """
+        if not hasattr(sqlite3.Connection, 'blobopen'):
+            return super().put_file(api, view, stem, path)
+        con = self._connect()
+        now = time()
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            size = path.stat().st_size
+            cur = con.execute(
+                "INSERT OR REPLACE INTO entries (api, view, stem, data, mtime, "
+                "atime, validators, size) VALUES (?, ?, ?, zeroblob(?), ?, ?, "
+                "NULL, ?)", (api, view, stem, size, now, now, size))
+            with con.blobopen("entries", "data", cur.lastrowid) as blob, \
+                    open(path, 'rb') as inf:
+                while chunk := inf.read(BLOB_CHUNK_SIZE):
+                    blob.write(chunk)
+            con.execute("COMMIT")
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+        path.unlink()
+
+    def entries(self, api: str | None = None) -> Iterator[CacheEntry]:
+        query = "SELECT api, view, stem, size, mtime, atime FROM entries"
+        if api:
+            rows = self._connect().execute(query + " WHERE api = ?", (api,))
+        else:
+            rows = self._connect().execute(query)
+        for row in rows:
+            yield CacheEntry(*row)
+
+    def size(self, api: str | None = None) -> int:
+        query = "SELECT coalesce(sum(size), 0) FROM entries"
+        if api:
+            return self._connect().execute(query + " WHERE api = ?", (api,)).fetchone()[0]
+        return self._connect().execute(query).fetchone()[0]
+
+    def least_recently_used(self, api: str | None, limit: int) -> list[CacheEntry]:
+        query = "SELECT api, view, stem, size, mtime, atime FROM entries"
+        if api:
+            rows = self._connect().execute(
+                query + " WHERE api = ? ORDER BY atime LIMIT ?", (api, limit))
+        else:
+            rows = self._connect().execute(query + " ORDER BY atime LIMIT ?", (limit,))
+        return [CacheEntry(*row) for row in rows]
+
+    def expired(self, before: float, api: str | None = None) -> list[CacheEntry]:
+        query = "SELECT api, view, stem, size, mtime, atime FROM entries "\
+                "WHERE mtime < ?"
+        if api:
+            rows = self._connect().execute(query + " AND api = ?", (before, api))
+        else:
+            rows = self._connect().execute(query, (before,))
+        return [CacheEntry(*row) for row in rows]
+
+    def delete_many(self, keys: list[tuple[str, str, str]]) -> None:
+        con = self._connect()
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            con.executemany("DELETE FROM entries WHERE api = ? AND view = ? "
+                            "AND stem = ?", keys)
+            con.execute("COMMIT")
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+        # Return the space of deleted entries to the file system; unlike
+        # execute(), executescript() runs the pragma until all pages are freed
+        con.executescript("PRAGMA incremental_vacuum")
+
+
+class _BlobReader(RawIOBase):
+    def __init__(self, blob: sqlite3.Blob) -> None:
+        """Raw binary file object reading a BLOB of an SQLite database."""
+        self.blob = blob
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.blob.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self.blob.close()
+        super().close()
+
+
+class MemoryCache:
+    def __init__(self, maxsize: int) -> None:
+        """Bounded in-process cache of parsed cache entries, which evicts the
+        least recently used entry first.
+
+        :param maxsize: The maximum number of entries.
+
+        Notes
+        -----
+        Parsed entries are shared by all objects created from them and
+        must not be modified.  Each entry remembers the time of the last
+        modification of the underlying cache entry, so that refreshed
+        entries are never served from memory.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: tuple[str, str, str], mtime: float):
+        """Return the parsed content of entry `key`, or `None` if it is
+        not in memory or stems from a different modification time `mtime`.
+        """
+        with self._lock:
+            try:
+                stored_mtime, value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            if stored_mtime != mtime:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: tuple[str, str, str], mtime: float, value) -> None:
+        """Store the parsed content of entry `key` with the time of the last
+        modification `mtime` of the underlying cache entry.
+        """
+        with self._lock:
+            self._entries[key] = (mtime, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: tuple[str, str, str]) -> None:
+        """Remove entry `key` if it exists."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = None
+_cache_signature = None
+_cache_lock = Lock()
+_memory_cache = None
+_memory_cache_lock = Lock()
+_last_prune = 0.0
+_pruning = False
+_prune_lock = Lock()
+
+
+def get_cache() -> CacheBackend:
+    """Return the backend of the cache for downloaded results.
+
+    The backend is set via `Backend` in section `[Cache]` of the
+    configuration file: `file` (default) stores one file per entry in the
+    folders of section `[Directories]`, `sqlite` stores all entries in the
+    file given in `Path` (default: `cache.sqlite` in the cache folder).
+    """
+    global _cache, _cache_signature
+    config = get_config()
+    backend = config.get("Cache", "Backend", fallback="file").lower()
+    path = config.get("Cache", "Path", fallback=str(CACHE_PATH/"cache.sqlite"))
+    signature = (backend, path if backend == "sqlite" else None)
+    with _cache_lock:
+        if _cache is None or _cache_signature != signature:
+            if backend == "sqlite":
+                _cache = SQLiteCache(path)
+            elif backend == "file":
+                _cache = FileCache()
+            else:
+                msg = "Option Backend in section Cache must be one of file, sqlite."
+                raise ValueError(msg)
+            _cache_signature = signature
+        return _cache
+
+
+def get_memory_cache() -> MemoryCache | None:
+    """Return the in-process cache of parsed retrieval results, or `None`
+    if it is disabled.
+
+    Its size is set via `MemorySize` in section `[Cache]` of the
+    configuration file as number of entries (default: 0, i.e. disabled).
+    """
+    global _memory_cache
+    size = get_config().getint("Cache", "MemorySize", fallback=0)
+    with _memory_cache_lock:
+        if size <= 0:
+            _memory_cache = None
+        elif _memory_cache is None:
+            _memory_cache = MemoryCache(size)
+        else:
+            _memory_cache.maxsize = size
+        return _memory_cache
+
+
+def get_cache_path(api: str, view: str, stem: str) -> Path:
+    """Return the location of the file of an entry in the folder of the API
+    in section `[Directories]` of the configuration file.  Unfinished
+    downloads are kept next to this location regardless of the backend.
+    """
+    return Path(get_config().get('Directories', api))/view/stem
+
+
+def get_codec() -> str:
+    """Return the codec used to compress new cache entries.
+
+    The codec is set via `Compression` in section `[Cache]` of the
+    configuration file: `none` (default), `gzip` or `zstd`.  If no zstd
+    library is installed, `gzip` is used instead of `zstd`.
+    """
+    codec = get_config().get("Cache", "Compression", fallback="none").lower()
+    if codec not in ("none", "gzip", "zstd"):
+        msg = "Option Compression in section Cache must be one of none, gzip, zstd."
+        raise ValueError(msg)
+    if codec == "zstd" and _import_zstd() is None:
+        warn("Compression zstd requires the zstandard package; using gzip instead.")
+        codec = "gzip"
+    return codec
+
+
+def encode(data: bytes) -> bytes:
+    """Compress the content of a cache entry with the configured codec."""
+    codec = get_codec()
+    if codec == "gzip":
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    if codec == "zstd":
+        return _import_zstd().compress(data)
+    return data
+
+
+def decode(data: bytes) -> bytes:
+    """Decompress the content of a cache entry.  The codec is recognized
+    by the leading bytes, so uncompressed entries are returned as-is.
+    """
+    with open_decoded(BytesIO(data)) as inf:
+        return inf.read()
+
+
+def encode_file(path: Path) -> None:
+    """Compress the file at `path` in place with the configured codec."""
+    codec = get_codec()
+    if codec == "none":
+        return
+    tmp = path.with_name(path.name + '.tmp')
+    with open(path, 'rb') as inf, open(tmp, 'wb') as raw:
+        if codec == "gzip":
+            ouf = gzip.GzipFile(filename='', mode='wb', compresslevel=6,
+                                fileobj=raw, mtime=0)
+        else:
+            ouf = _import_zstd().open(raw, 'wb')
+        with ouf:
+            shutil.copyfileobj(inf, ouf)
+    tmp.replace(path)
+
+
+def open_decoded(inf: BinaryIO) -> BinaryIO:
+    """Wrap a binary file object of a cache entry such that reading it
+    yields the decompressed content.  The codec is recognized by the
+    leading bytes.  Closing the wrapper does not close `inf`.
+
+    Raises
+    ------
+    ImportError
+        If the entry is compressed with zstd and no zstd library is
+        installed.
+    """
+    inf = inf if hasattr(inf, 'peek') else BufferedReader(inf)
+    head = inf.peek(4)[:4]
+    if head.startswith(GZIP_MAGIC):
+        return gzip.GzipFile(fileobj=inf, mode='rb')
+    if head == ZSTD_MAGIC:
+        zstd = _import_zstd()
+        if zstd is None:
+            msg = "Cache entry is compressed with zstd, which requires "\
+                  "the zstandard package."
+            raise ImportError(msg)
+        return zstd.open(inf, 'rb')
+    return inf
+
+
+def _import_zstd():
+    """Return the module `compression.zstd` of Python 3.14+ or, if
+    unavailable, an equivalent wrapper around the zstandard package, or
+    `None` if neither exists.
+    """
+    try:
+        from compression import zstd
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return _Zstandard(zstandard)
+
+
+class _Zstandard:
+    def __init__(self, module) -> None:
+        """Subset of the interface of `compression.zstd` implemented with
+        the zstandard package.
+        """
+        self.module = module
+
+    def compress(self, data: bytes) -> bytes:
+        return self.module.ZstdCompressor().compress(data)
+
+    def open(self, fileobj: BinaryIO, mode: str) -> BinaryIO:
+        if mode == 'rb':
+            reader = self.module.ZstdDecompressor().stream_reader(
+                fileobj, closefd=False)
+            return BufferedReader(reader)
+        return self.module.ZstdCompressor().stream_writer(fileobj, closefd=False)
+
+
+def prune(max_size: int | str | None = None,
+          max_age: int | None = None,
+          api: str | None = None
+          ) -> tuple[int, int]:
+    """Remove cache entries to keep the cache within its budget.
+
+    :param max_size: The maximum number of bytes of all entries (of `api`
+                     if given), either as integer or as string with unit
+                     (e.g. `"500M"` or `"20G"`).  Least recently used
+                     entries are removed first.  Defaults to `MaxSize` in
+                     section `[Cache]` of the configuration file.
+    :param max_age: The maximum number of days since an entry was
+                    downloaded.  Older entries are removed.  Defaults to
+                    `MaxAge` in section `[Cache]` of the configuration file.
+    :param api: Prune only entries of this API.
+
+    :returns: The number of removed entries and the number of freed bytes.
+
+    Notes
+    -----
+    Budgets per API are set in section `[Cache]` via keys of the form
+    `MaxSize.<API>`, e.g. `MaxSize.ScopusSearch = 5G`.  They are enforced
+    before the global budget.  Unfinished downloads are neither counted
+    nor removed.
+    """
+    config = get_config()
+    if max_size is None:
+        max_size = config.get("Cache", "MaxSize", fallback=None)
+    if max_age is None:
+        max_age = config.getint("Cache", "MaxAge", fallback=None)
+    budgets = {}
+    if config.has_section("Cache"):
+        budgets = {option.split(".", 1)[1]: _parse_size(value)
+                   for option, value in config.items("Cache")
+                   if option.startswith("MaxSize.")}
+    if api:
+        budgets = {a: b for a, b in budgets.items() if a == api}
+    max_size = _parse_size(max_size)
+    cache = get_cache()
+
+    removed = []
+    if max_age:
+        removed = cache.expired(time() - max_age*86400, api)
+        cache.delete_many([(e.api, e.view, e.stem) for e in removed])
+    for name, budget in budgets.items():
+        removed.extend(_evict(cache, name, budget))
+    if max_size is not None:
+        removed.extend(_evict(cache, api, max_size))
+    return len(removed), sum(e.size for e in removed)
+
+
+def _evict(cache: CacheBackend, api: str | None, budget: int) -> list[CacheEntry]:
+    """Remove the least recently used entries, or entries of `api`, until
+    their size is within `budget`, and return them.  Entries are only read
+    if the budget is exceeded.
+    """
+    excess = cache.size(api) - budget
+    removed = []
+    while excess > 0:
+        batch = []
+        for entry in cache.least_recently_used(api, PRUNE_BATCH):
+            if excess <= 0:
+                break
+            batch.append(entry)
+            excess -= entry.size
+        if not batch:
+            break
+        cache.delete_many([(e.api, e.view, e.stem) for e in batch])
+        removed.extend(batch)
+    return removed
+
+
+def prune_on_write() -> None:
+    """Prune the cache after a write if `PruneOnWrite` in section `[Cache]`
+    of the configuration file is true, at most once every PRUNE_INTERVAL
+    seconds per process.  Pruning runs in a background thread, such that
+    writes do not wait for it.
+    """
+    global _last_prune, _pruning
+    if not get_config().getboolean("Cache", "PruneOnWrite", fallback=False):
+        return
+    with _prune_lock:
+        now = time()
+        if _pruning or now - _last_prune < PRUNE_INTERVAL:
+            return
+        _last_prune = now
+        _pruning = True
+    Thread(target=_prune_in_background, name="pybliometrics-prune",
+           daemon=True).start()
+
+
+def _prune_in_background() -> None:
+    """Prune the cache and warn instead of raising errors."""
+    global _pruning
+    try:
+        prune()
+    except Exception as err:
+        warn(f"Automatic pruning of the cache failed: {err}")
+    finally:
+        with _prune_lock:
+            _pruning = False
+
+
+def _parse_size(size: int | str | None) -> int | None:
+    """Convert a size with optional unit K, M, G or T (base 1024) to bytes."""
+    if size is None or isinstance(size, int):
+        return size
+    size = size.strip().upper().removesuffix("B")
+    units = {"K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+    factor = units.get(size[-1:], 1)
+    if size[-1:] in units:
+        size = size[:-1]
+    return int(float(size)*factor)
+
+
+def _file_size(path: Path) -> int:
+    """Return the size of the file at `path`, or 0 if it does not exist."""
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _validators_path(path: Path) -> Path:
+    """Return the location of the validators of the entry at `path`."""
+    return path.with_name(path.name + '.validators')
+
+
+def _touch(path: Path) -> None:
+    """Set the access time of a file to now, keeping its modification time,
+    unless it was accessed within the last ATIME_RESOLUTION seconds.
+    """
+    try:
+        stat = path.stat()
+        now = time()
+        if stat.st_atime < now - ATIME_RESOLUTION:
+            os.utime(path, ns=(int(now*1e9), stat.st_mtime_ns))
+    except OSError:
+        pass
@@ -0,0 +1,84 @@
+"""Conversion of parsed results into NumPy arrays and PyArrow tables."""
+
+
+def make_arrow_table(columns: dict, categories: dict, types: dict):
+    """Return columns of parsed values as a `pyarrow.Table`.
+
+    :param columns: Lists of values keyed by field, with `None` for missing
+                    values.  Values of fields in `categories` are indices
+                    into the distinct values of that field.
+    :param categories: Lists of the distinct values of dictionary-encoded
+                       fields, which become dictionary-encoded strings.
+    :param types: The type of each other field: `"int16"`, `"int64"`,
+                  `"float64"` or `"string"` (default).
+
+    Raises
+    ------
+    ImportError
+        If PyArrow is not installed.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        msg = "as_arrow() requires PyArrow, which you can install "\
+              "with `pip install pyarrow`."
+        raise ImportError(msg) from None
+    arrays = []
+    for field, values in columns.items():
+        if field in categories:
+            arrays.append(pa.DictionaryArray.from_arrays(
+                pa.array(values, type=pa.int32()),
+                pa.array(categories[field], type=pa.string())))
+        else:
+            kind = getattr(pa, types.get(field, "string"))
+            arrays.append(pa.array(values, type=kind()))
+    return pa.Table.from_arrays(arrays, names=list(columns))
+
+
+def make_numpy_columns(columns: dict, categories: dict, types: dict) -> tuple[dict, dict]:
+    """Return columns of parsed values as NumPy arrays.
+
+    :param columns: Lists of values keyed by field, with `None` for missing
+                    values.  Values of fields in `categories` are indices
+                    into the distinct values of that field.
+    :param categories: Lists of the distinct values of dictionary-encoded
+                       fields.
+    :param types: The type of each other field: `"int16"`, `"int64"`,
+                  `"float64"` or `"string"` (default).
+
+    :returns: The arrays keyed by field and the distinct values of each
+              dictionary-encoded field as array of dtype `object`.
+              Dictionary-encoded fields are `int32` arrays of indices into
+              the distinct values, with -1 for missing values.  Integer
+              fields with missing values are masked arrays, missing floats
+              are `nan`, and strings are arrays of dtype `object`.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        msg = "as_columns() requires NumPy, which you can install "\
+              "with `pip install numpy`."
+        raise ImportError(msg) from None
+    out = {}
+    for field, values in columns.items():
+        kind = types.get(field)
+        if field in categories:
+            out[field] = np.array([-1 if v is None else v for v in values],
+                                  dtype=np.int32)
+        elif kind in ("int16", "int64"):
+            mask = [v is None for v in values]
+            data = np.array([v or 0 for v in values], dtype=kind)
+            out[field] = np.ma.masked_array(data, mask) if any(mask) else data
+        elif kind == "float64":
+            out[field] = np.array([np.nan if v is None else v for v in values],
+                                  dtype=np.float64)
+        else:
+            out[field] = np.array(values, dtype=object)
+    uniques = {field: np.array(values, dtype=object)
+               for field, values in categories.items()}
+    return out, uniques
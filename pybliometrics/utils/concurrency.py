@@ -0,0 +1,50 @@
+"""Helpers to run blocking pybliometrics code concurrently."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from threading import Lock
+
+from pybliometrics.utils.startup import get_config
+
+_executor = None
+_executor_size = None
+_executor_lock = Lock()
+
+
+def get_max_workers() -> int:
+    """Return the number of concurrent downloads for a single task, set via
+    `Workers` in section `[Requests]` of the configuration file (default: 4).
+    """
+    return get_config().getint("Requests", "Workers", fallback=4)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide thread pool used by the asynchronous API.
+
+    The number of threads is set via `AsyncWorkers` in section `[Requests]`
+    of the configuration file (default: 16).  It bounds the number of
+    requests in flight for one event loop.
+    """
+    global _executor, _executor_size
+    size = get_config().getint("Requests", "AsyncWorkers", fallback=16)
+    with _executor_lock:
+        if _executor is None or _executor_size != size:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ThreadPoolExecutor(max_workers=size,
+                                           thread_name_prefix="pybliometrics")
+            _executor_size = size
+        return _executor
+
+
+def run_async(func, *args, **kwds) -> asyncio.Future:
+    """Run a blocking function in the thread pool of `get_executor()` and
+    return an awaitable future.  Context variables are passed on to the
+    worker thread.
+    """
+    loop = asyncio.get_running_loop()
+    context = copy_context()
+    call = partial(context.run, func, *args, **kwds)
+    return loop.run_in_executor(get_executor(), call)
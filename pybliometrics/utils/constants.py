@@ -165,6 +165,9 @@ APIS_WITH_ID_TYPE = {"AbstractRetrieval",
 # APIs that do not require an ID in the URL
 APIS_NO_ID_IN_URL = {"AuthorMetrics", "InstitutionLookupMetrics", "TopicLookupMetrics"}
 
+# Maximum number of entities per request of SciVal metrics APIs
+SCIVAL_MAX_ENTITIES = {"AuthorMetrics": 100, "InstitutionLookupMetrics": 100}
+
 # Item per page limits for all classes
 COUNTS = {
     "AffiliationSearch": {"STANDARD": 200},
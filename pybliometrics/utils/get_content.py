@@ -1,3 +1,5 @@
+from threading import Lock
+
 from requests import Session
 from requests.adapters import HTTPAdapter
 from requests.exceptions import JSONDecodeError
@@ -5,7 +7,9 @@ from urllib3.util import Retry
 
 from pybliometrics import __version__
 from pybliometrics import exception
-from pybliometrics.utils.startup import get_config, get_insttokens, get_keys, _throttling_params
+from pybliometrics.utils.key_pool import get_key_pool
+from pybliometrics.utils.startup import get_config
+from pybliometrics.utils.throttle import wait_for_token
 
 # Define user agent string for HTTP requests
 user_agent = 'pybliometrics-v' + __version__
@@ -15,22 +19,84 @@ errors = {400: exception.Scopus400Error, 401: exception.Scopus401Error,
           407: exception.Scopus407Error, 413: exception.Scopus413Error, 
           414: exception.Scopus414Error, 429: exception.Scopus429Error}
 
+# Process-wide session, see get_session()
+_session = None
+_session_signature = None
+_session_lock = Lock()
+_session_stats = {'sessions': 0, 'requests': 0, 'connections': 0}
+
 
 def get_session() -> Session:
-    """Auxiliary function to create a session"""
+    """Auxiliary function to return the process-wide session.
+
+    The session and its connection pool are shared by all requests, so that
+    connections to the API servers are kept alive and reused.  The session
+    is rebuilt whenever the relevant configuration (retries, pool settings,
+    keep-alive, proxies) changes, e.g. after a new call of `init()`.
+    """
+    global _session, _session_signature
     config = get_config()
 
     _retries = config.getint("Requests", "Retries", fallback=5)
-    retry = Retry(total=_retries, backoff_factor=0.1,
-                  status_forcelist=[500, 501, 502, 503, 504, 524])
-    adapter = HTTPAdapter(max_retries=retry)
-    session = Session()
-    session.mount('http://', adapter)
-    session.mount('https://', adapter)
-    return session
+    pool_connections = config.getint("Requests", "PoolConnections", fallback=10)
+    pool_maxsize = config.getint("Requests", "PoolMaxsize", fallback=10)
+    keep_alive = config.getboolean("Requests", "KeepAlive", fallback=True)
+    proxies = tuple(sorted(config._sections.get("Proxy", {}).items()))
+    signature = (_retries, pool_connections, pool_maxsize, keep_alive, proxies)
+
+    with _session_lock:
+        if _session is not None and _session_signature == signature:
+            return _session
+        if _session is not None:
+            # Requests of other threads may still use the old session, so
+            # it is not closed but left to garbage collection
+            _add_pool_counts(_session, _session_stats)
+        retry = Retry(total=_retries, backoff_factor=0.1,
+                      status_forcelist=[500, 501, 502, 503, 504, 524])
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize)
+        session = Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        if not keep_alive:
+            session.headers['Connection'] = 'close'
+        _session = session
+        _session_signature = signature
+        _session_stats['sessions'] += 1
+        return session
+
+
+def get_session_stats() -> dict[str, int]:
+    """Return counters on the use of the shared session.
+
+    The dictionary contains the number of `sessions` built so far, the
+    number of `requests` sent, the number of `connections` opened and the
+    number of requests that `reused` an already open connection.
+    """
+    with _session_lock:
+        stats = _session_stats.copy()
+        if _session is not None:
+            _add_pool_counts(_session, stats)
+    stats['reused'] = max(stats['requests'] - stats['connections'], 0)
+    return stats
 
 
-def get_content(url, api, params=None, **kwds):
+def _add_pool_counts(session: Session, stats: dict) -> None:
+    """Add the request and connection counts of the session's connection
+    pools to `stats`.
+    """
+    for adapter in set(session.adapters.values()):
+        managers = [adapter.poolmanager, *adapter.proxy_manager.values()]
+        for pools in (manager.pools for manager in managers):
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                stats['requests'] += pool.num_requests
+                stats['connections'] += pool.num_connections
+
+
+def get_content(url, api, params=None, headers=None, **kwds):
     """Helper function to download a file and return its content.
 
     Parameters
@@ -46,6 +112,9 @@ def get_content(url, api, params=None, **kwds):
         and accepted values see e.g.
         https://api.elsevier.com/documentation/AuthorRetrievalAPI.wadl
 
+    headers : dict (optional)
+        Additional HTTP headers, e.g. for conditional requests.
+
     **kwds : key-value parings, optional
         Keywords passed on to as query parameters.  Must contain fields
         and values specified in the respective API specification.
@@ -63,21 +132,9 @@ def get_content(url, api, params=None, **kwds):
     resp : byte-like object
         The content of the file, which needs to be serialized.
     """
-    from random import shuffle
-    from time import sleep, time
-
     # Get needed ressources for query
     config = get_config()
-
-    keys = get_keys()
-
-    # Get tokens and zip with keys
-    insttokens = get_insttokens()
-    insttokens = list(zip(keys, insttokens))
-
-    # Keep keys that are not insttokens
-    keys = keys[len(insttokens):]
-
+    pool = get_key_pool()
     session = get_session()
 
     params = params or {}
@@ -85,63 +142,37 @@ def get_content(url, api, params=None, **kwds):
     proxies = dict(config._sections.get("Proxy", {}))
     timeout = config.getint("Requests", "Timeout", fallback=20)
 
-    # Get keys/tokens and create header
-    token_key, insttoken = None, None
+    # Get key/token: either provided or with most remaining quota
     if "insttoken" in params:
-        token_key = params.pop("apikey")
-        insttoken = params.pop("insttoken")
+        credential = (params.pop("apikey"), params.pop("insttoken"))
     elif "apikey" in params:
-        key = params.pop("apikey")
-    elif insttokens:
-        token_key, insttoken = insttokens.pop(0)
+        credential = (params.pop("apikey"), None)
     else:
-        key = keys.pop(0)
-
-    header = {'Accept': 'application/json',
-              'User-Agent': user_agent,
-              'X-ELS-APIKey': token_key or key}
-
-    # Eventually wait bc of throttling
-    if len(_throttling_params[api]) == _throttling_params[api].maxlen:
-        try:
-            sleep(1 - (time() - _throttling_params[api][0]))
-        except (IndexError, ValueError):
-            pass
-
-    # Use insttoken if available
-    if insttoken:
-        header['X-ELS-Insttoken'] = insttoken
-        resp = session.get(url, headers=header, params=params, timeout=timeout)
-    else:
-        resp = session.get(url, headers=header, params=params, timeout=timeout, proxies=proxies)
-
-    # If 429 try other tokens
-    while (resp.status_code == 429) or (resp.status_code == 401):
-        try:
-            token_key, token = insttokens.pop(0) # Get and remove current key
-            header['X-ELS-APIKey'] = token_key
-            header['X-ELS-Insttoken'] = token
-            shuffle(insttokens)
+        credential = pool.select(api)
+
+    # Send request and try other keys/tokens in case of 429 or 401
+    tried = set()
+    while True:
+        key, insttoken = credential
+        header = {'Accept': 'application/json',
+                  'User-Agent': user_agent,
+                  'X-ELS-APIKey': key,
+                  **(headers or {})}
+        wait_for_token(api, key)
+        if insttoken:
+            header['X-ELS-Insttoken'] = insttoken
             resp = session.get(url, headers=header, params=params, timeout=timeout)
-        except IndexError:  # All tokens depleted
+        else:
+            resp = session.get(url, headers=header, params=params, timeout=timeout,
+                               proxies=proxies)
+        pool.report(api, credential, resp)
+        if resp.status_code not in (401, 429):
             break
-
-   # Remove Insttoken from header (if present)
-    if 'X-ELS-Insttoken' in header:
-        del header['X-ELS-Insttoken']
-
-    # If 429 try other keys
-    while (resp.status_code == 429) or (resp.status_code == 401):
-        try:
-            key = keys.pop(0)  # Remove current key
-            header['X-ELS-APIKey'] = key
-            shuffle(keys)
-            resp = session.get(url, headers=header, proxies=proxies, params=params, timeout=timeout)
-        except IndexError:  # All keys depleted
+        tried.add(credential)
+        credential = pool.select(api, exclude=tried)
+        if credential is None:  # All keys and tokens depleted
             break
 
-    _throttling_params[api].append(time())
-
     # Eventually raise error, if possible with supplied error message
     try:
         error_type = errors[resp.status_code]
@@ -0,0 +1,121 @@
+"""Pool of API keys and InstTokens with quota-aware selection."""
+
+from threading import Lock
+from time import localtime, strftime, time
+
+from pybliometrics.utils.startup import get_insttokens, get_keys
+from pybliometrics.utils.throttle import get_ledger, record_quota
+
+# Seconds a key rests after a 429 error that is not related to its quota
+THROTTLE_COOLDOWN = 1
+# Seconds a key rests after a 401 error or an exceeded quota without reset time
+UNAUTHORIZED_COOLDOWN = 3600
+
+
+class KeyPool:
+    def __init__(self,
+                 keys: list[str],
+                 insttokens: list[str] | None = None
+                 ) -> None:
+        """Pool of credentials that routes each request to the credential
+        with the most remaining quota for the requested API.
+
+        :param keys: List of API keys.
+        :param insttokens: List of InstTokens.  The i-th InstToken belongs
+                           to the i-th key.
+
+        Notes
+        -----
+        Credentials are tuples of the form `(key, insttoken)`, where
+        `insttoken` is `None` for keys without InstToken.  Credentials with
+        InstToken come first.  The remaining quota and reset time of each
+        key are kept in the ledger (see `get_ledger()`), so that they are
+        shared with other processes if configured so.  Keys without
+        known quota are considered to have the most headroom.
+        """
+        insttokens = insttokens or []
+        self.credentials = list(zip(keys, insttokens))
+        self.credentials.extend((key, None) for key in keys[len(insttokens):])
+        self._cooldown = {}
+        self._lock = Lock()
+
+    def select(self,
+               api: str,
+               exclude: set | None = None
+               ) -> tuple[str, str | None] | None:
+        """Return the credential with the most headroom for `api`, or `None`
+        if all credentials are excluded.  Credentials that are exhausted or
+        on cool-down are only returned if no other credential is left.
+        """
+        exclude = exclude or set()
+        candidates = [c for c in self.credentials if c not in exclude]
+        if not candidates:
+            return None
+        ledger = get_ledger()
+        now = time()
+
+        def rank(credential):
+            remaining, reset = ledger.get_quota(api, credential[0])
+            with self._lock:
+                cooldown = self._cooldown.get((api, credential), 0)
+            if ledger.is_exhausted(api, credential[0]):
+                cooldown = max(cooldown, reset)
+            if cooldown > now:
+                return (1, cooldown, 0)
+            if remaining is None:
+                remaining = float('inf')
+            return (0, 0, -remaining)
+
+        return min(candidates, key=rank)
+
+    def report(self, api: str, credential: tuple[str, str | None], resp) -> None:
+        """Record the quota information of a response obtained with
+        `credential` and put the credential on cool-down if necessary.
+        """
+        key = credential[0]
+        record_quota(api, key, resp)
+        if resp.status_code not in (401, 429):
+            return
+        ledger = get_ledger()
+        remaining, reset = ledger.get_quota(api, key)
+        if resp.status_code == 401:
+            until = time() + UNAUTHORIZED_COOLDOWN
+        elif remaining == 0:
+            until = reset or time() + UNAUTHORIZED_COOLDOWN
+        else:
+            until = time() + THROTTLE_COOLDOWN
+        with self._lock:
+            self._cooldown[(api, credential)] = until
+
+    def get_quotas(self, api: str) -> dict[str, tuple[int | None, str | None]]:
+        """Return the last known remaining quota and reset time (formatted
+        as '%Y-%m-%d %H:%M:%S') of each key for `api`.
+        """
+        ledger = get_ledger()
+        out = {}
+        for key, _ in self.credentials:
+            remaining, reset = ledger.get_quota(api, key)
+            if reset is not None:
+                reset = strftime('%Y-%m-%d %H:%M:%S', localtime(reset))
+            out[key] = (remaining, reset)
+        return out
+
+
+_key_pool = None
+_key_pool_signature = None
+_key_pool_lock = Lock()
+
+
+def get_key_pool() -> KeyPool:
+    """Return the process-wide pool of API keys and InstTokens.  The pool
+    is rebuilt when the keys or InstTokens change, e.g. after `init()`.
+    """
+    global _key_pool, _key_pool_signature
+    keys = get_keys()
+    insttokens = get_insttokens()
+    signature = (tuple(keys), tuple(insttokens))
+    with _key_pool_lock:
+        if _key_pool is None or _key_pool_signature != signature:
+            _key_pool = KeyPool(keys, insttokens)
+            _key_pool_signature = signature
+        return _key_pool
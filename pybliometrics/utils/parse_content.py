@@ -55,9 +55,16 @@ def check_integrity(tuples, fields, action):
     """Check integrity of specific fields in a list of tuples and perfom
     provided action.
     """
+    columns = {field: [getattr(e, field) for e in tuples] for field in fields}
+    check_column_integrity(columns, fields, action)
+
+
+def check_column_integrity(columns, fields, action):
+    """Check integrity of specific fields in a dictionary of columns and
+    perform provided action.
+    """
     for field in fields:
-        elements = [getattr(e, field) for e in tuples]
-        if None not in elements:
+        if None not in columns[field]:
             continue
         msg = "Parsed information doesn't pass integrity check because of "\
               f"incomplete information in field '{field}'"
@@ -78,11 +85,35 @@ def check_field_consistency(needles, haystack):
 
 def deduplicate(lst):
     """Auxiliary function to deduplicate a list while preserving its order."""
-    new = reduce(lambda x, y: x + y if y[0] not in x else x,
-                 map(lambda x: [x], lst),
-                 [])
+    seen = set()
+    unhashable = []
+    new = []
+    for item in lst:
+        try:
+            key = _make_hashable(item)
+        except TypeError:
+            if item not in unhashable:
+                unhashable.append(item)
+                new.append(item)
+            continue
+        if key not in seen:
+            seen.add(key)
+            new.append(item)
     return new
 
+
+def _make_hashable(item):
+    """Auxiliary function to turn nested dictionaries and lists into
+    hashable objects that compare equal if and only if the originals do.
+    """
+    if isinstance(item, dict):
+        return dict, frozenset((k, _make_hashable(v)) for k, v in item.items())
+    if isinstance(item, list):
+        return list, tuple(_make_hashable(v) for v in item)
+    hash(item)
+    return item
+
+
 def get_and_aggregate_subjects(fields):
     """Get and aggregate subject areas from Scopus AuthorSearch."""
     frequencies = {}
@@ -14,6 +14,39 @@ class MetricData(NamedTuple):
     threshold: int | None = None
 
 
+def build_metric_index(json_data, entity_type: str) -> dict:
+    """Index the metric data of all results by metric type and entity in a
+    single pass.
+
+    Parameters
+    ----------
+    json_data : dict
+        The JSON response from the API
+    entity_type : str
+        The type of entity ("author", "institution", or "topic")
+
+    Returns
+    -------
+    dict
+        Dictionary of the form `{metric_type: {(entity_id, entity_name): metric_data}}`,
+        where entities follow the order of the results
+    """
+    index = {}
+
+    # Get results from JSON data
+    if isinstance(json_data, dict):
+        results = json_data.get('results', [])
+    else:
+        results = []
+
+    for result in results:
+        entity = extract_entity_info(result, entity_type)
+        for metric in result.get('metrics', []):
+            # Like find_metric_data(), use the first entry of a metric type
+            index.setdefault(metric.get('metricType'), {}).setdefault(entity, metric)
+    return index
+
+
 def extract_metric_data(json_data, metric_type: str, by_year: bool, entity_type: str):
     """Helper function to extract metric data for a specific metric type.
     
@@ -33,21 +66,30 @@ def extract_metric_data(json_data, metric_type: str, by_year: bool, entity_type:
     list or None
         List of MetricData namedtuples or None if no data found
     """
-    out = []
+    index = build_metric_index(json_data, entity_type)
+    return extract_metric_data_from_index(index, metric_type, by_year)
 
-    # Get results from JSON data
-    if isinstance(json_data, dict):
-        results = json_data.get('results', [])
-    else:
-        results = []
 
-    for result in results:
-        entity_id, entity_name = extract_entity_info(result, entity_type)
-        metric_data = find_metric_data(result, metric_type)
+def extract_metric_data_from_index(index: dict, metric_type: str, by_year: bool):
+    """Extract metric data for a specific metric type from an index
+    created with `build_metric_index()`.
 
-        if not metric_data:
-            continue
+    Parameters
+    ----------
+    index : dict
+        The index of the metric data
+    metric_type : str
+        The metric type to extract
+    by_year : bool
+        Whether the data is broken down by year
 
+    Returns
+    -------
+    list or None
+        List of MetricData namedtuples or None if no data found
+    """
+    out = []
+    for (entity_id, entity_name), metric_data in index.get(metric_type, {}).items():
         # Process metric data using unified approach
         metric_items = process_metric(metric_data, entity_id, entity_name, metric_type, by_year)
         if metric_items:
@@ -55,27 +97,104 @@ def extract_metric_data(json_data, metric_type: str, by_year: bool, entity_type:
 
     return out or None
 
+
+def extract_metric_columns(json_data, metric_types: list[str], by_year: bool, entity_type: str) -> tuple[dict, dict]:
+    """Helper function to extract the data of several metric types into one
+    list per field of `MetricData`.
+
+    Parameters
+    ----------
+    json_data : dict
+        The JSON response from the API
+    metric_types : list of str
+        The metric types to extract
+    by_year : bool
+        Whether the data is broken down by year
+    entity_type : str
+        The type of entity ("author", "institution", or "topic")
+
+    Returns
+    -------
+    tuple
+        (columns, categories) as returned by
+        `extract_metric_columns_from_index()`
+    """
+    index = build_metric_index(json_data, entity_type)
+    return extract_metric_columns_from_index(index, metric_types, by_year)
+
+
+def extract_metric_columns_from_index(index: dict, metric_types: list[str], by_year: bool) -> tuple[dict, dict]:
+    """Extract the data of several metric types from an index created with
+    `build_metric_index()` into one list per field of `MetricData`, without
+    creating namedtuples.
+
+    Parameters
+    ----------
+    index : dict
+        The index of the metric data
+    metric_types : list of str
+        The metric types to extract
+    by_year : bool
+        Whether the data is broken down by year
+
+    Returns
+    -------
+    tuple
+        (columns, categories), where `columns` maps each field of
+        `MetricData` to a list of values in the order of
+        `extract_metric_data_from_index()`.  Years are integers and `None`
+        if the data is not broken down by year.  Values of `entity_name`
+        and `metric` are indices into the list of distinct values of that
+        field, which `categories` maps the field to.
+    """
+    columns = {field: [] for field in MetricData._fields}
+    lookups = {'entity_name': {}, 'metric': {}}
+    for metric_type in metric_types:
+        for (entity_id, entity_name), metric_data in index.get(metric_type, {}).items():
+            if entity_name is not None:
+                entity_name = lookups['entity_name'].setdefault(entity_name, len(lookups['entity_name']))
+            for metric_name, year, value, percentage, threshold in \
+                    _iter_metric_values(metric_data, metric_type, by_year):
+                columns['entity_id'].append(entity_id)
+                columns['entity_name'].append(entity_name)
+                columns['metric'].append(lookups['metric'].setdefault(metric_name, len(lookups['metric'])))
+                columns['year'].append(int(year) if by_year else None)
+                columns['value'].append(value)
+                columns['percentage'].append(percentage)
+                columns['threshold'].append(threshold)
+
+    categories = {field: list(lookup) for field, lookup in lookups.items()}
+    return columns, categories
+
+
 def extract_metric_lists(json_data, metric_type: str, entity_type: str) -> list:
-    out = []
+    index = build_metric_index(json_data, entity_type)
+    return extract_metric_lists_from_index(index, metric_type)
 
-    # Get results from JSON data
-    if isinstance(json_data, dict):
-        results = json_data.get('results', [])
-    else:
-        results = []
 
-    for result in results:
-        entity_id, entity_name = extract_entity_info(result, entity_type)
-        metric_data = find_metric_data(result, metric_type)
+def extract_metric_lists_from_index(index: dict, metric_type: str) -> list:
+    """Extract the lists of values of a specific metric type for each
+    entity from an index created with `build_metric_index()`.
 
-        if not metric_data:
-            continue
+    Parameters
+    ----------
+    index : dict
+        The index of the metric data
+    metric_type : str
+        The metric type to extract
 
-        metric_values = metric_data.get('values', [])
+    Returns
+    -------
+    list
+        List of dictionaries with keys "entity_id", "entity_name" and
+        "values", one per entity with data for this metric type
+    """
+    out = []
+    for (entity_id, entity_name), metric_data in index.get(metric_type, {}).items():
         out.append({
             "entity_id": entity_id,
             "entity_name": entity_name,
-            "values": metric_values
+            "values": metric_data.get('values', [])
         })
     return out
 
@@ -144,8 +263,18 @@ def process_metric(metric_data: dict, entity_id: int, entity_name: str, metric_t
     list or None
         List of MetricData namedtuples or None if no data
     """
-    out = []
+    out = [MetricData(entity_id=entity_id, entity_name=entity_name,
+                      metric=metric_name, year=str(year), value=value,
+                      percentage=percentage, threshold=threshold)
+           for metric_name, year, value, percentage, threshold in
+           _iter_metric_values(metric_data, metric_type, by_year)]
+    return out if out else None
 
+
+def _iter_metric_values(metric_data: dict, metric_type: str, by_year: bool):
+    """Yield the name of the metric, the year, the value, the percentage and
+    the threshold of each value of a metric, see `process_metric()`.
+    """
     # Normalize all metrics to have a 'values' structure
     if 'values' in metric_data:
         # Already has multiple values (collaboration/threshold metrics)
@@ -168,21 +297,10 @@ def process_metric(metric_data: dict, entity_id: int, entity_name: str, metric_t
             value_data = {"all": value_item.get('value')}
             percentage_data = {"all": value_item.get('percentage')}
 
+        # For nested metrics (like Collaboration), metric is the specific type (collabType)
+        # For simple metrics (like CitationCount), metric is the metric_type itself
+        metric_name = collab_type or value_item.get('indexType') or value_item.get('impactType') or metric_type
+
         # Process all years uniformly
         for year in value_data.keys():
-            # For nested metrics (like Collaboration), metric is the specific type (collabType)
-            # For simple metrics (like CitationCount), metric is the metric_type itself
-            metric_name = collab_type or value_item.get('indexType') or value_item.get('impactType') or metric_type
-
-            new = MetricData(
-                entity_id=entity_id,
-                entity_name=entity_name,
-                metric=metric_name,
-                year=str(year),
-                value=value_data.get(year),
-                percentage=percentage_data.get(year),
-                threshold=threshold
-            )
-            out.append(new)
-
-    return out if out else None
+            yield metric_name, year, value_data.get(year), percentage_data.get(year), threshold
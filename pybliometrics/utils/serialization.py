@@ -0,0 +1,59 @@
+"""Serialization of JSON with the fastest available library."""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if orjson is not None:
+    JSON_ENGINE = "orjson"
+elif msgspec is not None:
+    JSON_ENGINE = "msgspec"
+else:
+    JSON_ENGINE = "json"
+
+
+def loads(data: bytes | str):
+    """Parse a JSON document with orjson or msgspec if installed, and with
+    the standard library otherwise.
+
+    Raises
+    ------
+    ValueError
+        If `data` is not a valid JSON document.
+    """
+    if JSON_ENGINE == "orjson":
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # The standard library is more lenient, e.g. on lone surrogates
+            pass
+    elif JSON_ENGINE == "msgspec":
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """Serialize an object to compact JSON encoded as UTF-8, with orjson or
+    msgspec if installed, and with the standard library otherwise.
+    """
+    if JSON_ENGINE == "orjson":
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            pass
+    elif JSON_ENGINE == "msgspec":
+        try:
+            return msgspec.json.encode(obj)
+        except (msgspec.EncodeError, TypeError, OverflowError):
+            pass
+    return json.dumps(obj, separators=(',', ':')).encode()
@@ -1,17 +1,14 @@
 import warnings
 from configparser import ConfigParser, NoOptionError, NoSectionError
-from collections import deque
 from pathlib import Path
 
-from pybliometrics.utils.constants import CONFIG_FILE, RATELIMITS, DEFAULT_PATHS, VIEWS
+from pybliometrics.utils.constants import CONFIG_FILE, DEFAULT_PATHS, VIEWS
 from pybliometrics.utils.create_config import create_config
 
 CONFIG = None
 CUSTOM_KEYS = None
 CUSTOM_INSTTOKENS = None
 
-_throttling_params = {k: deque(maxlen=v) for k, v in RATELIMITS.items()}
-
 
 def init(config_path: str | Path | None = None,
          keys: list[str] | None = None,
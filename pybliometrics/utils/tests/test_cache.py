@@ -0,0 +1,375 @@
+"""Tests for the cache module."""
+
+import gzip
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from time import time
+
+import pytest
+
+from pybliometrics.scopus import init
+from pybliometrics.utils import CacheBackend, FileCache, MemoryCache, \
+    SQLiteCache, decode, encode, encode_file, get_cache, get_config, \
+    get_memory_cache, open_decoded, prune, prune_on_write
+
+init()
+
+PAYLOAD = b'{"eid":"2-s2.0-1"}\n{"eid":"2-s2.0-2"}'
+
+
+def set_compression(codec):
+    """Set the codec of the cache in the configuration."""
+    set_cache_option('Compression', codec)
+
+
+def set_cache_option(option, value):
+    """Set or, if value is None, remove an option of section Cache."""
+    config = get_config()
+    if not config.has_section('Cache'):
+        config.add_section('Cache')
+    if value is None:
+        config.remove_option('Cache', option)
+    else:
+        config.set('Cache', option, value)
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path):
+    """Use a temporary SQLite file as cache."""
+    set_cache_option('Backend', 'sqlite')
+    set_cache_option('Path', str(tmp_path/'cache.sqlite'))
+    yield get_cache()
+    set_cache_option('Backend', None)
+    set_cache_option('Path', None)
+
+
+def test_sqlite_cache(tmp_path):
+    """Test whether entries are stored, read and deleted by their key."""
+    cache = SQLiteCache(tmp_path/'cache.sqlite')
+    key = ('AbstractRetrieval', 'META', '2-s2.0-1')
+    assert cache.get(*key) is None
+    assert cache.mtime(*key) is None
+    cache.put(*key, b'{"a":1}')
+    assert cache.get(*key) == b'{"a":1}'
+    assert cache.get('AbstractRetrieval', 'FULL', '2-s2.0-1') is None
+    assert time() - cache.mtime(*key) < 5
+    with cache.open(*key) as inf:
+        assert inf.read() == b'{"a":1}'
+    cache.delete(*key)
+    assert cache.get(*key) is None
+
+
+def test_sqlite_cache_put_file(tmp_path):
+    """Test whether a file is moved into the cache."""
+    cache = SQLiteCache(tmp_path/'cache.sqlite')
+    path = tmp_path/'search.partial'
+    path.write_bytes(b'{"eid":"1"}\n{"eid":"2"}\n')
+    cache.put_file('ScopusSearch', 'STANDARD', 'abc', path)
+    assert not path.exists()
+    with cache.open('ScopusSearch', 'STANDARD', 'abc') as inf:
+        assert len(inf.readlines()) == 2
+
+
+def test_sqlite_cache_streaming(tmp_path, monkeypatch):
+    """Test whether entries larger than a chunk are written and read in
+    chunks, also if compressed.
+    """
+    monkeypatch.setattr('pybliometrics.utils.cache.BLOB_CHUNK_SIZE', 16)
+    cache = SQLiteCache(tmp_path/'cache.sqlite')
+    content = b"".join(b'{"eid":"%d"}\n' % i for i in range(100))
+    path = tmp_path/'search.partial'
+    path.write_bytes(gzip.compress(content))
+    cache.put_file('ScopusSearch', 'STANDARD', 'abc', path)
+    with cache.open('ScopusSearch', 'STANDARD', 'abc') as raw, \
+            open_decoded(raw) as inf:
+        assert inf.read() == content
+    cache.put('ScopusSearch', 'STANDARD', 'empty', b'')
+    with cache.open('ScopusSearch', 'STANDARD', 'empty') as inf:
+        assert inf.read() == b''
+    with pytest.raises(FileNotFoundError):
+        cache.open('ScopusSearch', 'STANDARD', 'missing')
+
+
+def test_sqlite_cache_shared(tmp_path):
+    """Test whether threads and several instances share one file."""
+    path = tmp_path/'cache.sqlite'
+    first, second = SQLiteCache(path), SQLiteCache(path)
+
+    def put(i):
+        first.put('AuthorRetrieval', 'ENHANCED', str(i), str(i).encode())
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(put, range(20)))
+    received = [second.get('AuthorRetrieval', 'ENHANCED', str(i)) for i in range(20)]
+    assert received == [str(i).encode() for i in range(20)]
+
+
+def test_decode_uncompressed():
+    """Test whether uncompressed entries are read as-is."""
+    assert decode(PAYLOAD) == PAYLOAD
+    assert decode(b'') == b''
+
+
+@pytest.mark.parametrize("codec", ["gzip", "zstd"])
+def test_encode_decode(codec, tmp_path):
+    """Test whether compressed entries are recognized and decompressed."""
+    if codec == "zstd":
+        pytest.importorskip("zstandard")
+    set_compression(codec)
+    try:
+        data = encode(PAYLOAD)
+        path = tmp_path/'entry'
+        path.write_bytes(PAYLOAD)
+        encode_file(path)
+    finally:
+        set_compression('none')
+    assert data != PAYLOAD
+    assert decode(data) == PAYLOAD
+    assert decode(path.read_bytes()) == PAYLOAD
+    with open(path, 'rb') as raw, open_decoded(raw) as inf:
+        assert len(list(inf)) == 2
+    assert encode(PAYLOAD) == PAYLOAD
+
+
+def test_open_decoded_stream():
+    """Test whether gzip-compressed entries are read line by line."""
+    raw = BytesIO(gzip.compress(PAYLOAD))
+    with open_decoded(raw) as inf:
+        assert inf.readline() == b'{"eid":"2-s2.0-1"}\n'
+    assert not raw.closed
+
+
+def test_file_cache_entries(tmp_path):
+    """Test whether files of entries are listed without staging files."""
+    config = get_config()
+    config.set('Directories', 'TestAPI', str(tmp_path))
+    try:
+        (tmp_path/'VIEW').mkdir()
+        (tmp_path/'VIEW'/'stem').write_bytes(b'12345')
+        (tmp_path/'VIEW'/'stem.partial').write_bytes(b'1')
+        entries = list(FileCache().entries('TestAPI'))
+        assert [e[:4] for e in entries] == [('TestAPI', 'VIEW', 'stem', 5)]
+        os.utime(tmp_path/'VIEW'/'stem', (0, 0))
+        assert FileCache().get('TestAPI', 'VIEW', 'stem') == b'12345'
+        entry = next(FileCache().entries('TestAPI'))
+        assert entry.mtime == 0
+        assert time() - entry.atime < 5
+    finally:
+        config.remove_option('Directories', 'TestAPI')
+
+
+def test_prune_lru(sqlite_cache):
+    """Test whether least recently used entries are removed first."""
+    for i in range(4):
+        sqlite_cache.put('AuthorRetrieval', 'ENHANCED', str(i), b'x'*100)
+    con = sqlite_cache._connect()
+    con.execute("UPDATE entries SET atime = 1000 - CAST(stem AS REAL)")
+    assert prune(max_size=250) == (2, 200)
+    remaining = [e.stem for e in sqlite_cache.entries()]
+    assert sorted(remaining) == ['0', '1']
+    assert prune(max_size="1K") == (0, 0)
+
+
+def test_prune_without_scan(sqlite_cache, monkeypatch):
+    """Test whether pruning reads only the entries it removes."""
+    for i in range(4):
+        sqlite_cache.put('AuthorRetrieval', 'ENHANCED', str(i), b'x'*100)
+    sqlite_cache._connect().execute(
+        "UPDATE entries SET atime = 1000 - CAST(stem AS REAL)")
+
+    def scan(*args):
+        raise AssertionError("All entries were read")
+
+    monkeypatch.setattr(SQLiteCache, 'entries', scan)
+    assert prune(max_size="1K", max_age=5) == (0, 0)
+    assert prune(max_size=250) == (2, 200)
+    assert sqlite_cache.size() == 200
+    query = "EXPLAIN QUERY PLAN SELECT * FROM entries ORDER BY atime LIMIT 1"
+    plan = sqlite_cache._connect().execute(query).fetchall()
+    assert 'entries_atime' in str(plan)
+
+
+def test_file_cache_prune(tmp_path, monkeypatch):
+    """Test whether FileCache counts the size of its entries once and
+    walks its folders again only to remove entries.
+    """
+    config = get_config()
+    config.set('Directories', 'TestAPI', str(tmp_path))
+    try:
+        (tmp_path/'VIEW').mkdir()
+        cache = FileCache()
+        for i in range(4):
+            cache.put('TestAPI', 'VIEW', str(i), b'x'*100)
+            os.utime(tmp_path/'VIEW'/str(i), (1000 - i, time()))
+        assert cache.size('TestAPI') == 400
+        walks = []
+        original = FileCache.entries
+
+        def entries(self, api=None):
+            walks.append(api)
+            return original(self, api)
+
+        monkeypatch.setattr(FileCache, 'entries', entries)
+        cache.put('TestAPI', 'VIEW', '4', b'x'*50)
+        cache.delete('TestAPI', 'VIEW', '0')
+        assert cache.size('TestAPI') == 350
+        assert cache.expired(time() - 86400, 'TestAPI') == []
+        assert walks == []
+        monkeypatch.setattr('pybliometrics.utils.cache.get_cache', lambda: cache)
+        assert prune(max_size=200, api='TestAPI') == (2, 200)
+        assert walks == ['TestAPI']
+        assert sorted(e.stem for e in original(cache, 'TestAPI')) == ['1', '4']
+        assert cache.size('TestAPI') == 150
+    finally:
+        config.remove_option('Directories', 'TestAPI')
+
+
+def test_prune_max_age(sqlite_cache):
+    """Test whether entries older than max_age days are removed."""
+    sqlite_cache.put('AuthorRetrieval', 'ENHANCED', 'old', b'x')
+    sqlite_cache.put('AuthorRetrieval', 'ENHANCED', 'new', b'x')
+    sqlite_cache._connect().execute(
+        "UPDATE entries SET mtime = ? WHERE stem = 'old'", (time() - 10*86400,))
+    assert prune(max_age=5) == (1, 1)
+    assert [e.stem for e in sqlite_cache.entries()] == ['new']
+
+
+def test_prune_per_api(sqlite_cache):
+    """Test whether budgets per API are respected."""
+    for i in range(3):
+        sqlite_cache.put('ScopusSearch', 'STANDARD', str(i), b'x'*100)
+        sqlite_cache.put('AuthorRetrieval', 'ENHANCED', str(i), b'x'*100)
+    set_cache_option('MaxSize.ScopusSearch', '100')
+    try:
+        assert prune() == (2, 200)
+    finally:
+        set_cache_option('MaxSize.ScopusSearch', None)
+    assert len(list(sqlite_cache.entries('ScopusSearch'))) == 1
+    assert len(list(sqlite_cache.entries('AuthorRetrieval'))) == 3
+
+
+def test_prune_on_write(sqlite_cache, monkeypatch):
+    """Test whether pruning after writes runs in the background."""
+    for i in range(3):
+        sqlite_cache.put('AuthorRetrieval', 'ENHANCED', str(i), b'x'*100)
+    monkeypatch.setattr('pybliometrics.utils.cache._last_prune', 0.0)
+    set_cache_option('MaxSize', '100')
+    set_cache_option('PruneOnWrite', 'true')
+    try:
+        prune_on_write()
+        for thread in threading.enumerate():
+            if thread.name == 'pybliometrics-prune':
+                thread.join()
+    finally:
+        set_cache_option('MaxSize', None)
+        set_cache_option('PruneOnWrite', None)
+    assert len(list(sqlite_cache.entries())) == 1
+
+
+def test_sqlite_cache_vacuum(tmp_path):
+    """Test whether files created without incremental vacuum are converted
+    and shrink after entries are removed.
+    """
+    path = tmp_path/'cache.sqlite'
+    con = sqlite3.connect(path, isolation_level=None)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("CREATE TABLE entries (api TEXT, view TEXT, stem TEXT, "
+                "data BLOB, mtime REAL, PRIMARY KEY (api, view, stem))")
+    con.executemany("INSERT INTO entries VALUES ('A', 'V', ?, ?, 0)",
+                    [(str(i), os.urandom(10_000)) for i in range(50)])
+    con.close()
+    cache = SQLiteCache(path)
+    cache.delete_many([('A', 'V', str(i)) for i in range(50)])
+    con = cache._connect()
+    assert con.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    assert con.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+
+def test_memory_cache():
+    """Test whether the memory cache evicts least recently used entries and
+    ignores entries of other modification times.
+    """
+    memory = MemoryCache(2)
+    memory.put(('SerialTitleISSN', 'ENHANCED', '1'), 1.0, {'a': 1})
+    memory.put(('SerialTitleISSN', 'ENHANCED', '2'), 1.0, {'a': 2})
+    assert memory.get(('SerialTitleISSN', 'ENHANCED', '1'), 1.0) == {'a': 1}
+    memory.put(('SerialTitleISSN', 'ENHANCED', '3'), 1.0, {'a': 3})
+    assert memory.get(('SerialTitleISSN', 'ENHANCED', '2'), 1.0) is None
+    assert memory.get(('SerialTitleISSN', 'ENHANCED', '1'), 2.0) is None
+    assert memory.get(('SerialTitleISSN', 'ENHANCED', '1'), 1.0) is None
+    assert memory.get(('SerialTitleISSN', 'ENHANCED', '3'), 1.0) == {'a': 3}
+    assert (memory.hits, memory.misses) == (2, 3)
+
+
+def test_get_memory_cache():
+    """Test whether the memory cache is enabled by its size."""
+    assert get_memory_cache() is None
+    set_cache_option('MemorySize', '10')
+    try:
+        memory = get_memory_cache()
+        assert memory.maxsize == 10
+        assert get_memory_cache() is memory
+    finally:
+        set_cache_option('MemorySize', None)
+    assert get_memory_cache() is None
+
+
+def test_sqlite_cache_validators(tmp_path):
+    """Test whether validators are stored with entries and whether touch
+    updates the modification time only.
+    """
+    cache = SQLiteCache(tmp_path/'cache.sqlite')
+    key = ('AbstractRetrieval', 'FULL', '2-s2.0-1')
+    cache.put(*key, b'{}', {'ETag': '"abc"'})
+    assert cache.validators(*key) == {'ETag': '"abc"'}
+    cache._connect().execute("UPDATE entries SET mtime = 0")
+    cache.touch(*key)
+    assert time() - cache.mtime(*key) < 5
+    assert cache.get(*key) == b'{}'
+    cache.put(*key, b'{}')
+    assert cache.validators(*key) == {}
+
+
+def test_sqlite_cache_migration(tmp_path):
+    """Test whether files of earlier versions gain the new columns."""
+    path = tmp_path/'cache.sqlite'
+    con = sqlite3.connect(path)
+    con.execute("CREATE TABLE entries (api TEXT, view TEXT, stem TEXT, "
+                "data BLOB, mtime REAL, PRIMARY KEY (api, view, stem))")
+    con.execute("INSERT INTO entries VALUES ('ScopusSearch', '', 'a', x'00', 1)")
+    con.commit()
+    con.close()
+    cache = SQLiteCache(path)
+    assert list(cache.entries()) == [('ScopusSearch', '', 'a', 1, 1.0, 1.0)]
+    cache.put('ScopusSearch', '', 'b', b'{}', {'Last-Modified': 'yesterday'})
+    assert cache.validators('ScopusSearch', '', 'b') == {'Last-Modified': 'yesterday'}
+
+
+def test_file_cache_validators(tmp_path):
+    """Test whether validators are stored next to files and removed with them."""
+    config = get_config()
+    config.set('Directories', 'TestAPI', str(tmp_path))
+    try:
+        cache = FileCache()
+        cache.put('TestAPI', '', 'stem', b'{}', {'ETag': '"abc"'})
+        assert cache.validators('TestAPI', '', 'stem') == {'ETag': '"abc"'}
+        assert [e.stem for e in cache.entries('TestAPI')] == ['stem']
+        cache.delete('TestAPI', '', 'stem')
+        assert cache.validators('TestAPI', '', 'stem') == {}
+        assert not list(tmp_path.iterdir())
+    finally:
+        config.remove_option('Directories', 'TestAPI')
+
+
+def test_cache_backend_abstract():
+    """Test whether backends must implement the abstract methods."""
+    class Incomplete(CacheBackend):
+        def get(self, api, view, stem):
+            return None
+
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete()
+    assert isinstance(FileCache(), CacheBackend)
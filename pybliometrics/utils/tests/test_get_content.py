@@ -0,0 +1,35 @@
+"""Tests for the get_content module."""
+
+from pybliometrics.scopus import init
+from pybliometrics.utils import get_config, get_session, get_session_stats
+
+init()
+
+
+def test_get_session_reuse():
+    """Test whether the same session is returned for consecutive calls."""
+    session = get_session()
+    assert get_session() is session
+
+
+def test_get_session_rebuild():
+    """Test whether a change of the configuration rebuilds the session."""
+    config = get_config()
+    session = get_session()
+    retries = config.get('Requests', 'Retries', fallback='5')
+    config.set('Requests', 'Retries', str(int(retries) + 1))
+    try:
+        new_session = get_session()
+        assert new_session is not session
+        assert new_session.get_adapter('https://').max_retries.total == int(retries) + 1
+        assert get_session() is new_session
+    finally:
+        config.set('Requests', 'Retries', retries)
+
+
+def test_get_session_stats():
+    """Test whether the session counters are complete."""
+    stats = get_session_stats()
+    assert set(stats) == {'sessions', 'requests', 'connections', 'reused'}
+    assert stats['sessions'] >= 1
+    assert stats['reused'] == max(stats['requests'] - stats['connections'], 0)
@@ -0,0 +1,73 @@
+"""Tests for the key_pool module."""
+
+from time import time
+
+import pytest
+from requests import Response
+
+from pybliometrics.scopus import init
+from pybliometrics.utils import get_key_pool, KeyPool
+
+init()
+
+
+def make_response(status_code, remaining=None, reset=None, status=None):
+    """Create a response with quota headers."""
+    resp = Response()
+    resp.status_code = status_code
+    if remaining is not None:
+        resp.headers['X-RateLimit-Remaining'] = str(remaining)
+    if reset is not None:
+        resp.headers['X-RateLimit-Reset'] = str(int(reset))
+    if status is not None:
+        resp.headers['X-ELS-Status'] = status
+    return resp
+
+
+def test_credentials():
+    """Test whether credentials with InstToken come first."""
+    pool = KeyPool(['k1', 'k2', 'k3'], ['t1'])
+    assert pool.credentials == [('k1', 't1'), ('k2', None), ('k3', None)]
+
+
+@pytest.fixture
+def restore_config():
+    """Restore the configuration after a test that changes it."""
+    yield
+    init()
+
+
+def test_get_key_pool(restore_config):
+    """Test whether the pool persists and follows changes of the keys."""
+    init(keys=['p1', 'p2'])
+    pool = get_key_pool()
+    assert get_key_pool() is pool
+    init(keys=['p3'])
+    assert get_key_pool().credentials == [('p3', None)]
+
+
+def test_select_headroom():
+    """Test whether the key with the most remaining quota is selected."""
+    pool = KeyPool(['h1', 'h2', 'h3'])
+    assert pool.select('ScopusSearch') == ('h1', None)
+    pool.report('ScopusSearch', ('h1', None), make_response(200, 100, time() + 60))
+    pool.report('ScopusSearch', ('h2', None), make_response(200, 500, time() + 60))
+    assert pool.select('ScopusSearch') == ('h3', None)
+    pool.report('ScopusSearch', ('h3', None), make_response(200, 200, time() + 60))
+    assert pool.select('ScopusSearch') == ('h2', None)
+    assert pool.select('ScopusSearch', exclude={('h2', None)}) == ('h3', None)
+    assert pool.select('AuthorSearch') == ('h1', None)
+    assert pool.get_quotas('ScopusSearch')['h2'][0] == 500
+
+
+def test_select_cooldown():
+    """Test whether exhausted keys rest until their reset."""
+    pool = KeyPool(['c1', 'c2'])
+    reset = time() + 7200
+    resp = make_response(429, reset=reset, status='QUOTA_EXCEEDED - Quota Exceeded')
+    pool.report('AbstractRetrieval', ('c1', None), resp)
+    pool.report('AbstractRetrieval', ('c2', None), make_response(401))
+    assert pool.select('AbstractRetrieval') == ('c2', None)
+    assert pool.select('AbstractRetrieval', exclude={('c2', None)}) == ('c1', None)
+    assert pool.select('AbstractRetrieval', exclude={('c1', None), ('c2', None)}) is None
+    assert pool.select('AuthorRetrieval') == ('c1', None)
@@ -0,0 +1,58 @@
+"""Tests for the parse_content module."""
+
+from pybliometrics.utils import deduplicate
+
+
+def make_authors(n):
+    """Create a list of author dictionaries as in Scopus Search results,
+    in which every author appears twice.
+    """
+    authors = [{'@_fa': 'true', 'authid': str(i), 'authname': f'Author {i}',
+                'surname': 'Author', 'given-name': str(i),
+                'afid': [{'@_fa': 'true', '$': str(i % 50)}]}
+               for i in range(n)]
+    return authors + authors
+
+
+def test_deduplicate():
+    """Test whether duplicates are removed while the order is preserved."""
+    assert deduplicate([3, 1, 3, 2, 1]) == [3, 1, 2]
+    assert deduplicate(['a', 'b', 'a']) == ['a', 'b']
+    assert deduplicate([]) == []
+    first = {'authid': '1', 'afid': [{'$': '1'}, {'$': '2'}]}
+    second = {'afid': [{'$': '1'}, {'$': '2'}], 'authid': '1'}
+    third = {'authid': '1', 'afid': [{'$': '2'}, {'$': '1'}]}
+    assert deduplicate([first, second, third]) == [first, third]
+    assert deduplicate([[1], (1,), [1]]) == [[1], (1,)]
+    assert deduplicate([{1, 2}, {1, 2}]) == [{1, 2}]
+
+
+def test_deduplicate_authors():
+    """Test whether duplicated authors are removed in order."""
+    authors = make_authors(3_000)
+    assert deduplicate(authors) == authors[:3_000]
+    assert deduplicate(authors[::-1]) == authors[:3_000][::-1]
+
+
+def test_deduplicate_comparisons():
+    """Test whether items are looked up by hash rather than compared with
+    all previous items, which would take quadratic time.
+    """
+    class Item:
+        comparisons = 0
+
+        def __init__(self, value):
+            self.value = value
+
+        def __hash__(self):
+            return hash(self.value)
+
+        def __eq__(self, other):
+            Item.comparisons += 1
+            return self.value == other.value
+
+    items = [Item(i) for i in range(3_000)]
+    duplicates = [Item(i) for i in range(3_000)]
+    new = deduplicate(items + duplicates)
+    assert Item.comparisons <= 2*len(items)
+    assert all(a is b for a, b in zip(new, items, strict=True))
@@ -0,0 +1,103 @@
+"""Tests for the parse_metrics module."""
+
+from pybliometrics.utils import build_metric_index, extract_entity_info, \
+    extract_metric_columns, extract_metric_columns_from_index, \
+    extract_metric_data, extract_metric_data_from_index, extract_metric_lists_from_index, \
+    find_metric_data, process_metric
+
+
+def make_results(by_year):
+    """Create results as in SciVal Author Metrics responses for three
+    authors with a simple and a nested metric.
+    """
+    def values(n):
+        if by_year:
+            return {'valueByYear': {'2020': n, '2021': n + 1},
+                    'percentageByYear': {'2020': n / 10, '2021': None}}
+        return {'value': n, 'percentage': n / 10}
+
+    results = []
+    for i in range(3):
+        collab = [{'collabType': 'International collaboration', **values(i)},
+                  {'collabType': 'Single authorship', **values(i + 5)}]
+        top = [{'threshold': 10, **values(i)}]
+        results.append({
+            'author': {'id': str(100 + i), 'name': f'Author {i}'},
+            'metrics': [{'metricType': 'CitationCount', **values(2 * i)},
+                        {'metricType': 'Collaboration', 'values': collab},
+                        {'metricType': 'OutputsInTopCitationPercentiles',
+                         'values': top}]})
+    return {'results': results}
+
+
+def as_rows(columns, categories):
+    """Turn columns back into rows with decoded strings."""
+    decoded = dict(columns)
+    for field, uniques in categories.items():
+        decoded[field] = [uniques[v] for v in columns[field]]
+    return list(zip(*decoded.values()))
+
+
+def test_extract_metric_columns():
+    """Test whether the columns contain the same data as the namedtuples."""
+    metric_types = ['CitationCount', 'Collaboration',
+                    'OutputsInTopCitationPercentiles']
+    for by_year in (False, True):
+        data = make_results(by_year)
+        columns, categories = extract_metric_columns(data, metric_types,
+                                                     by_year, "author")
+        expected = []
+        for metric in metric_types:
+            for m in extract_metric_data(data, metric, by_year, "author"):
+                year = int(m.year) if by_year else None
+                expected.append(m._replace(year=year))
+        assert sorted(as_rows(columns, categories)) == sorted(expected)
+        assert categories['entity_name'] == ['Author 0', 'Author 1', 'Author 2']
+        assert set(columns['threshold']) == {None, 10}
+
+
+def test_extract_metric_columns_selection():
+    """Test whether only requested metric types are extracted."""
+    data = make_results(False)
+    columns, categories = extract_metric_columns(data, ['CitationCount'],
+                                                 False, "author")
+    assert columns['entity_id'] == [100, 101, 102]
+    assert columns['value'] == [0, 2, 4]
+    assert categories['metric'] == ['CitationCount']
+    columns, _ = extract_metric_columns({}, ['CitationCount'], False, "author")
+    assert all(values == [] for values in columns.values())
+
+
+def test_extract_metric_columns_from_index():
+    """Test whether repeated metric types are extracted only once."""
+    data = make_results(False)
+    for result in data['results']:
+        result['metrics'].append({'metricType': 'CitationCount', 'value': -1})
+    index = build_metric_index(data, "author")
+    columns, categories = extract_metric_columns_from_index(
+        index, ['CitationCount'], False)
+    expected = [m._replace(year=None) for m in
+                extract_metric_data(data, 'CitationCount', False, "author")]
+    assert as_rows(columns, categories) == expected
+
+
+def test_build_metric_index():
+    """Test whether the index yields the same data as scanning the results."""
+    data = make_results(True)
+    index = build_metric_index(data, "author")
+    assert list(index) == ['CitationCount', 'Collaboration',
+                           'OutputsInTopCitationPercentiles']
+    assert list(index['CitationCount']) == [(100, 'Author 0'), (101, 'Author 1'),
+                                            (102, 'Author 2')]
+    for metric in index:
+        expected = []
+        for result in data['results']:
+            entity_id, entity_name = extract_entity_info(result, "author")
+            found = find_metric_data(result, metric)
+            expected.extend(process_metric(found, entity_id, entity_name, metric, True))
+        assert extract_metric_data_from_index(index, metric, True) == expected
+        assert extract_metric_data(data, metric, True, "author") == expected
+    assert extract_metric_data_from_index(index, 'HIndices', True) is None
+    lists = extract_metric_lists_from_index(index, 'Collaboration')
+    assert [item['entity_id'] for item in lists] == [100, 101, 102]
+    assert len(lists[0]['values']) == 2
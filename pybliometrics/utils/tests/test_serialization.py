@@ -0,0 +1,34 @@
+"""Tests for the serialization module."""
+
+import json
+
+import pytest
+
+from pybliometrics.utils import dumps, loads
+
+DOCUMENT = {'search-results': {'entry': [{'eid': '2-s2.0-1', 'citedby-count': '3',
+                                          'dc:title': 'Économie — 経済', 'count': 7,
+                                          'score': 0.5, 'open': True, 'none': None}]}}
+
+
+def test_dumps():
+    """Test whether objects are serialized to compact UTF-8 bytes."""
+    received = dumps(DOCUMENT)
+    assert isinstance(received, bytes)
+    assert b', ' not in received and b': ' not in received
+    assert json.loads(received) == DOCUMENT
+
+
+def test_loads():
+    """Test whether bytes and strings are parsed like the standard library."""
+    text = json.dumps(DOCUMENT)
+    assert loads(text) == DOCUMENT
+    assert loads(text.encode()) == DOCUMENT
+    assert loads(dumps(DOCUMENT)) == DOCUMENT
+    assert loads(b'{"a":"\\ud800"}') == {'a': '\ud800'}
+
+
+def test_loads_invalid():
+    """Test whether invalid documents raise a ValueError."""
+    with pytest.raises(ValueError):
+        loads(b'{"a":')
@@ -0,0 +1,79 @@
+"""Tests for the throttle module."""
+
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, time
+from types import ModuleType
+
+from pybliometrics.utils import MemoryLedger, SQLiteLedger, TokenBucket
+
+
+def test_memory_ledger_buckets():
+    """Test whether buckets are kept per API and key."""
+    ledger = MemoryLedger()
+    bucket = ledger.bucket('AuthorRetrieval', 'key1')
+    assert ledger.bucket('AuthorRetrieval', 'key1') is bucket
+    assert ledger.bucket('AuthorRetrieval', 'key2') is not bucket
+    assert bucket.rate == 3
+
+
+def test_memory_ledger_quota():
+    """Test whether exhausted keys are recognized until their reset."""
+    ledger = MemoryLedger()
+    assert not ledger.is_exhausted('ScopusSearch', 'key1')
+    ledger.set_quota('ScopusSearch', 'key1', 0, time() + 60)
+    ledger.set_quota('ScopusSearch', 'key2', 0, time() - 60)
+    ledger.set_quota('ScopusSearch', 'key3', 10, time() + 60)
+    assert ledger.is_exhausted('ScopusSearch', 'key1')
+    assert not ledger.is_exhausted('ScopusSearch', 'key2')
+    assert not ledger.is_exhausted('ScopusSearch', 'key3')
+    assert not ledger.is_exhausted('AuthorSearch', 'key1')
+
+
+def test_sqlite_ledger_shared(tmp_path):
+    """Test whether two ledgers on the same file share their tokens."""
+    path = tmp_path/'ratelimits.sqlite'
+    first, second = SQLiteLedger(path), SQLiteLedger(path)
+    waits = [ledger.reserve('AuthorRetrieval', 'key1')
+             for ledger in (first, second, first, second)]
+    assert waits[:3] == [0.0]*3
+    assert 0.3 < waits[3] <= 1/3
+    assert second.reserve('AuthorRetrieval', 'key2') == 0.0
+    assert second.reserve('ObjectRetrieval', 'key1') == 0.0
+
+
+def test_sqlite_ledger_quota(tmp_path):
+    """Test whether quotas are visible to other ledgers on the same file."""
+    path = tmp_path/'ratelimits.sqlite'
+    SQLiteLedger(path).set_quota('ScopusSearch', 'key1', 0, time() + 60)
+    ledger = SQLiteLedger(path)
+    assert ledger.is_exhausted('ScopusSearch', 'key1')
+    assert not ledger.is_exhausted('ScopusSearch', 'key2')
+
+
+def test_token_bucket_burst():
+    """Test whether a full bucket allows for a burst without waiting."""
+    bucket = TokenBucket(rate=5)
+    assert [bucket.reserve() for _ in range(5)] == [0.0]*5
+    assert 0.15 < bucket.reserve() <= 0.2
+
+
+def test_token_bucket_threads():
+    """Test whether concurrent threads respect the rate."""
+    bucket = TokenBucket(rate=20, capacity=1)
+    start = monotonic()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: bucket.acquire(), range(11)))
+    assert monotonic() - start >= 0.45
+
+
+def test_token_bucket_unlimited():
+    """Test whether a rate of 0 never blocks."""
+    bucket = TokenBucket(rate=0)
+    assert all(bucket.reserve() == 0 for _ in range(1_000))
+
+
+def test_module_not_shadowed():
+    """Test whether the star import keeps the throttle module accessible."""
+    from pybliometrics.utils import throttle, wait_for_token
+    assert isinstance(throttle, ModuleType)
+    assert throttle.wait_for_token is wait_for_token
@@ -0,0 +1,234 @@
+"""Rate limiting of requests per API and API key, and bookkeeping of the
+remaining quota of API keys.
+"""
+
+import sqlite3
+from pathlib import Path
+from threading import Lock, local
+from time import monotonic, sleep, time
+
+from pybliometrics.utils.constants import CACHE_PATH, RATELIMITS
+from pybliometrics.utils.startup import get_config
+
+
+class TokenBucket:
+    def __init__(self,
+                 rate: float,
+                 capacity: float | None = None
+                 ) -> None:
+        """Thread-safe token bucket.
+
+        :param rate: The number of tokens added per second.  A rate of 0
+                     means that the bucket never runs empty.
+        :param capacity: The maximum number of tokens, i.e. the size of
+                         a burst.  Defaults to `rate`.
+        """
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = monotonic()
+        self._lock = Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return the number of seconds to wait until
+        it is available.  Tokens not available yet are reserved in order
+        of the calls, so that concurrent callers never exceed the rate.
+        """
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            now = monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed*self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens/self.rate
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        wait = self.reserve()
+        if wait:
+            sleep(wait)
+
+
+class MemoryLedger:
+    def __init__(self) -> None:
+        """Ledger of rate limits and key quotas valid for the current
+        process only.
+        """
+        self._buckets = {}
+        self._quotas = {}
+        self._lock = Lock()
+
+    def bucket(self, api: str, key: str | None = None) -> TokenBucket:
+        """Return the token bucket for an API and an API key."""
+        with self._lock:
+            try:
+                return self._buckets[(api, key)]
+            except KeyError:
+                bucket = TokenBucket(RATELIMITS.get(api, 0))
+                self._buckets[(api, key)] = bucket
+                return bucket
+
+    def reserve(self, api: str, key: str | None = None) -> float:
+        """Take one token for `api` and `key` and return the number of
+        seconds to wait until it is available.
+        """
+        return self.bucket(api, key).reserve()
+
+    def get_quota(self, api: str, key: str) -> tuple[int | None, float | None]:
+        """Return the last known remaining quota and reset time (as
+        timestamp) of `key` for `api`.
+        """
+        with self._lock:
+            return self._quotas.get((api, key), (None, None))
+
+    def set_quota(self, api: str, key: str, remaining: int | None,
+                  reset: float | None) -> None:
+        """Store the remaining quota and reset time of `key` for `api`."""
+        with self._lock:
+            self._quotas[(api, key)] = (remaining, reset)
+
+    def is_exhausted(self, api: str, key: str) -> bool:
+        """Whether `key` is known to have no quota left for `api`."""
+        return _is_exhausted(*self.get_quota(api, key))
+
+
+class SQLiteLedger:
+    def __init__(self, path: str | Path) -> None:
+        """Ledger of rate limits and key quotas shared by all processes
+        using the same SQLite file.
+
+        :param path: The location of the SQLite file.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = local()
+        con = self._connect()
+        con.execute("CREATE TABLE IF NOT EXISTS buckets (api TEXT, key TEXT, "
+                    "tokens REAL, updated REAL, PRIMARY KEY (api, key))")
+        con.execute("CREATE TABLE IF NOT EXISTS quotas (api TEXT, key TEXT, "
+                    "remaining INTEGER, reset REAL, PRIMARY KEY (api, key))")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the connection of the current thread."""
+        try:
+            return self._local.con
+        except AttributeError:
+            con = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            con.execute("PRAGMA journal_mode=WAL")
+            self._local.con = con
+            return con
+
+    def reserve(self, api: str, key: str | None = None) -> float:
+        """Take one token for `api` and `key` and return the number of
+        seconds to wait until it is available.
+        """
+        rate = RATELIMITS.get(api, 0)
+        if not rate:
+            return 0.0
+        key = key or ""
+        con = self._connect()
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            row = con.execute("SELECT tokens, updated FROM buckets WHERE "
+                              "api = ? AND key = ?", (api, key)).fetchone()
+            now = time()
+            if row is None:
+                tokens = rate
+            else:
+                tokens = min(rate, row[0] + max(now - row[1], 0)*rate)
+            tokens -= 1
+            con.execute("INSERT OR REPLACE INTO buckets VALUES (?, ?, ?, ?)",
+                        (api, key, tokens, now))
+            con.execute("COMMIT")
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+        if tokens >= 0:
+            return 0.0
+        return -tokens/rate
+
+    def get_quota(self, api: str, key: str) -> tuple[int | None, float | None]:
+        """Return the last known remaining quota and reset time (as
+        timestamp) of `key` for `api`.
+        """
+        row = self._connect().execute(
+            "SELECT remaining, reset FROM quotas WHERE api = ? AND key = ?",
+            (api, key)).fetchone()
+        return row or (None, None)
+
+    def set_quota(self, api: str, key: str, remaining: int | None,
+                  reset: float | None) -> None:
+        """Store the remaining quota and reset time of `key` for `api`."""
+        self._connect().execute("INSERT OR REPLACE INTO quotas VALUES (?, ?, ?, ?)",
+                                (api, key, remaining, reset))
+
+    def is_exhausted(self, api: str, key: str) -> bool:
+        """Whether `key` is known to have no quota left for `api`."""
+        return _is_exhausted(*self.get_quota(api, key))
+
+
+_ledger = None
+_ledger_signature = None
+_ledger_lock = Lock()
+
+
+def get_ledger() -> MemoryLedger | SQLiteLedger:
+    """Return the ledger of rate limits and key quotas.
+
+    The backend is set via `RateLimitBackend` in section `[Requests]` of
+    the configuration file: `memory` (default) coordinates the threads of
+    one process, `sqlite` coordinates all processes using the file given
+    in `RateLimitLedger`.
+    """
+    global _ledger, _ledger_signature
+    config = get_config()
+    backend = config.get("Requests", "RateLimitBackend", fallback="memory").lower()
+    path = config.get("Requests", "RateLimitLedger",
+                      fallback=str(CACHE_PATH/"ratelimits.sqlite"))
+    signature = (backend, path if backend == "sqlite" else None)
+    with _ledger_lock:
+        if _ledger is None or _ledger_signature != signature:
+            if backend == "sqlite":
+                _ledger = SQLiteLedger(path)
+            elif backend == "memory":
+                _ledger = MemoryLedger()
+            else:
+                msg = "Option RateLimitBackend must be one of memory, sqlite."
+                raise ValueError(msg)
+            _ledger_signature = signature
+        return _ledger
+
+
+def wait_for_token(api: str, key: str | None = None) -> None:
+    """Block until a request to `api` with `key` respects the rate limit."""
+    wait = get_ledger().reserve(api, key)
+    if wait:
+        sleep(wait)
+
+
+def record_quota(api: str, key: str, resp) -> None:
+    """Store the quota information of a response in the ledger."""
+    headers = resp.headers
+    remaining = headers.get('X-RateLimit-Remaining')
+    reset = headers.get('X-RateLimit-Reset')
+    if resp.status_code == 429 and \
+            'QUOTA_EXCEEDED' in headers.get('X-ELS-Status', '').upper():
+        remaining = 0
+    if remaining is None:
+        return
+    try:
+        reset = float(reset)
+    except (TypeError, ValueError):
+        reset = None
+    get_ledger().set_quota(api, key, int(remaining), reset)
+
+
+def _is_exhausted(remaining, reset):
+    """Whether a quota is used up and not yet reset."""
+    if remaining is None or remaining > 0 or reset is None:
+        return False
+    return reset > time()